@@ -17,12 +17,12 @@ import json
 from datetime import datetime, timezone
 from pathlib import Path
 
+from yahoo_ai_gm.async_yahoo_client import AsyncYahooClient
 from yahoo_ai_gm.yahoo_client import YahooClient
-import xml.etree.ElementTree as ET
+from yahoo_ai_gm.yahoo_xml import iter_records, text
 
 LEAGUE_KEY  = "469.l.40206"
 MY_TEAM_KEY = "469.l.40206.t.6"
-NS          = "http://fantasysports.yahooapis.com/fantasy/v2/base.rng"
 
 IL_STATUS_PATH = Path("data/il_status.json")
 IL_ALERTS_PATH = Path("data/il_alerts.json")
@@ -44,22 +44,30 @@ def _severity(status: str) -> int:
     return SEVERITY.get(status.strip().upper(), 1)
 
 
+ROSTER_PATH = f"team/{MY_TEAM_KEY}/roster/players"
+
+
 def fetch_current_statuses(client: YahooClient) -> dict[str, dict]:
-    xml = client.get(f"team/{MY_TEAM_KEY}/roster/players")
-    root = ET.fromstring(xml)
-    ns = NS
+    return parse_statuses(client.get(ROSTER_PATH))
+
+
+async def fetch_current_statuses_async(aclient: AsyncYahooClient) -> dict[str, dict]:
+    return parse_statuses(await aclient.get(ROSTER_PATH))
+
+
+def parse_statuses(xml: str) -> dict[str, dict]:
     players = {}
-    for player in root.iter(f"{{{ns}}}player"):
-        key         = player.findtext(f".//{{{ns}}}player_key") or ""
-        name        = player.findtext(f".//{{{ns}}}full") or ""
-        status      = player.findtext(f".//{{{ns}}}status") or ""
-        status_full = player.findtext(f".//{{{ns}}}status_full") or ""
-        on_il       = player.findtext(f".//{{{ns}}}on_disabled_list") or "0"
+    for player in iter_records(xml, "player"):
+        key         = text(player, "player_key")
+        name        = text(player, "name/full")
+        status      = text(player, "status")
+        status_full = text(player, "status_full")
+        on_il       = text(player, "on_disabled_list", "0")
         if key:
             players[key] = {
                 "name":        name,
-                "status":      status.strip(),
-                "status_full": status_full.strip(),
+                "status":      status,
+                "status_full": status_full,
                 "on_il":       on_il == "1",
                 "checked_at":  datetime.now(tz=timezone.utc).isoformat(),
             }
@@ -147,11 +155,8 @@ def load_existing_alerts() -> list[dict]:
     return []
 
 
-def main() -> None:
-    client = YahooClient.from_local_config()
-
-    print("[check_il] Fetching current roster statuses...")
-    current = fetch_current_statuses(client)
+def record_statuses(current: dict[str, dict]) -> list[dict]:
+    """Diff against the saved statuses, save the new ones and merge alerts. Returns new alerts."""
     previous = load_previous_statuses()
 
     # Load pool for replacement suggestions
@@ -173,6 +178,15 @@ def main() -> None:
     # Keep only most recent 50 alerts
     all_alerts = all_alerts[:50]
     IL_ALERTS_PATH.write_text(json.dumps(all_alerts, indent=2))
+    return alerts
+
+
+def main() -> None:
+    client = YahooClient.from_local_config()
+
+    print("[check_il] Fetching current roster statuses...")
+    current = fetch_current_statuses(client)
+    alerts = record_statuses(current)
 
     if alerts:
         print(f"[check_il] {len(alerts)} new alert(s):")
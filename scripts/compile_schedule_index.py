@@ -0,0 +1,43 @@
+"""
+scripts/compile_schedule_index.py
+
+Compile data/league_schedule.json into data/league_schedule_index.json
+(integer week x matchup and team x week arrays, see analysis/schedule_index.py).
+Run whenever league_schedule.json is (re)written. Use cases fall back to
+compiling on the fly if the index is missing or older than the schedule.
+
+Usage:
+  python3 scripts/compile_schedule_index.py
+"""
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from yahoo_ai_gm.analysis.schedule_index import (
+    compile_schedule_index,
+    schedule_index_to_dict,
+)
+
+DATA_DIR = Path("data")
+
+
+def main() -> None:
+    src = DATA_DIR / "league_schedule.json"
+    if not src.exists():
+        raise SystemExit(f"Schedule not found: {src}")
+
+    index = compile_schedule_index(json.loads(src.read_text(encoding="utf-8")))
+
+    out_path = DATA_DIR / "league_schedule_index.json"
+    tmp = out_path.with_suffix(".json.tmp")
+    tmp.write_text(
+        json.dumps(schedule_index_to_dict(index), separators=(",", ":"), ensure_ascii=False),
+        encoding="utf-8",
+    )
+    tmp.replace(out_path)
+    print(f"Compiled {index.n_weeks} weeks x {index.n_teams} teams -> {out_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -410,37 +410,42 @@ def generate_report(week: int) -> str:
         sv_pool_list = raw if isinstance(raw, list) else raw.get("players") or raw.get("pool") or []
 
     waivers = waiver_recommendations(snapshot, pool=pool_list, sv_pool=sv_pool_list)
+
+    # One shared computation context for every section of this run
+    from yahoo_ai_gm.use_cases.context import AnalysisContext
+    ctx = AnalysisContext(Path('data'))
+
     from yahoo_ai_gm.use_cases.get_trades import get_trade_report
     try:
-        trade_report = get_trade_report(data_dir=Path('data'), n_suggestions=5)
+        trade_report = get_trade_report(data_dir=Path('data'), n_suggestions=5, ctx=ctx)
         trades_suggestions = trade_report.suggestions
     except Exception as e:
         print(f'[daily_report] Trade suggestions failed: {e}')
         trades_suggestions = []
     from yahoo_ai_gm.use_cases.get_matchup import get_matchup_report
     try:
-        matchup_report = get_matchup_report(data_dir=Path('data'))
+        matchup_report = get_matchup_report(data_dir=Path('data'), ctx=ctx)
         matchup_data = matchup_report.projection
     except Exception as e:
         print(f'[daily_report] Matchup projection failed: {e}')
         matchup_data = {}
     from yahoo_ai_gm.use_cases.get_adddrop import get_adddrop_report
     try:
-        adddrop_report = get_adddrop_report(data_dir=Path('data'))
+        adddrop_report = get_adddrop_report(data_dir=Path('data'), ctx=ctx)
         adddrop_plan = adddrop_report.plan
     except Exception as e:
         print(f'[daily_report] Add/drop simulation failed: {e}')
         adddrop_plan = {}
     from yahoo_ai_gm.use_cases.get_ratio_risk import get_ratio_risk_report
     try:
-        ratio_report = get_ratio_risk_report(data_dir=Path('data'))
+        ratio_report = get_ratio_risk_report(data_dir=Path('data'), ctx=ctx)
         ratio_profiles = ratio_report.profiles
     except Exception as e:
         print(f'[daily_report] Ratio risk failed: {e}')
         ratio_profiles = []
     from yahoo_ai_gm.use_cases.get_standings import get_standings_report
     try:
-        standings_report = get_standings_report(data_dir=Path('data'), current_week=week)
+        standings_report = get_standings_report(data_dir=Path('data'), current_week=week, ctx=ctx)
         standings_data = standings_report.trajectory
     except Exception as e:
         print(f'[daily_report] Standings trajectory failed: {e}')
@@ -454,14 +459,14 @@ def generate_report(week: int) -> str:
         _il_status, _il_alerts = {}, []
     from yahoo_ai_gm.use_cases.get_trade_value import get_trade_value_report
     try:
-        tv_report = get_trade_value_report(data_dir=Path('data'))
+        tv_report = get_trade_value_report(data_dir=Path('data'), ctx=ctx)
         trade_value_players = tv_report.players
     except Exception as e:
         print(f'[daily_report] Trade value tracker failed: {e}')
         trade_value_players = []
     from yahoo_ai_gm.use_cases.get_league_intelligence import get_league_intelligence_report
     try:
-        li_report = get_league_intelligence_report(data_dir=Path('data'))
+        li_report = get_league_intelligence_report(data_dir=Path('data'), ctx=ctx)
         league_construction = li_report.my_construction
         league_opponents = li_report.opponent_profiles
     except Exception as e:
@@ -470,7 +475,7 @@ def generate_report(week: int) -> str:
         league_opponents = []
     from yahoo_ai_gm.use_cases.get_streaming_sp import get_streaming_sp_report
     try:
-        streaming_report = get_streaming_sp_report(data_dir=Path('data'))
+        streaming_report = get_streaming_sp_report(data_dir=Path('data'), ctx=ctx)
         streaming_candidates = streaming_report.candidates
         streaming_source = streaming_report.data_source
         streaming_opp_weaknesses = streaming_report.opp_weaknesses
@@ -481,7 +486,7 @@ def generate_report(week: int) -> str:
         streaming_opp_weaknesses = []
     from yahoo_ai_gm.use_cases.get_trade_acceptance import get_trade_acceptance_report
     try:
-        acc_report = get_trade_acceptance_report(data_dir=Path('data'))
+        acc_report = get_trade_acceptance_report(data_dir=Path('data'), ctx=ctx)
         acceptance_map = {
             f"{s.get('give',{}).get('name','')}|{s.get('receive',{}).get('name','')}": s.get('acceptance',{})
             for s in acc_report.suggestions
@@ -495,7 +500,7 @@ def generate_report(week: int) -> str:
         def _timeout(signum, frame): raise TimeoutError()
         signal.signal(signal.SIGALRM, _timeout)
         signal.alarm(30)
-        multi_report = get_multi_trade_report(data_dir=Path('data'), n_suggestions=3)
+        multi_report = get_multi_trade_report(data_dir=Path('data'), n_suggestions=3, ctx=ctx)
         multi_trade_sizes = multi_report.trade_sizes
         signal.alarm(0)
     except Exception as e:
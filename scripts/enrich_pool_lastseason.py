@@ -1,36 +1,14 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
 import json
-import time
 from pathlib import Path
 from typing import Any
-import xml.etree.ElementTree as ET
 
-from yahoo_ai_gm.yahoo_client import YahooClient
-
-
-def _strip_ns(root: ET.Element) -> ET.Element:
-    for el in root.iter():
-        if "}" in el.tag:
-            el.tag = el.tag.split("}", 1)[1]
-    return root
-
-
-def _text(node: ET.Element, path: str, default: str = "") -> str:
-    found = node.find(path)
-    return found.text.strip() if (found is not None and found.text) else default
-
-
-def parse_player_stats_by_id(xml_text: str) -> dict[str, str]:
-    root = _strip_ns(ET.fromstring(xml_text))
-    out: dict[str, str] = {}
-    for stat in root.findall(".//stats//stat"):
-        stat_id = _text(stat, "stat_id")
-        value = _text(stat, "value")
-        if stat_id:
-            out[str(stat_id)] = value
-    return out
+from yahoo_ai_gm.async_yahoo_client import AsyncYahooClient
+from yahoo_ai_gm.player_stats import MAX_KEYS_PER_REQUEST, fetch_stats_by_player
+from yahoo_ai_gm.yahoo_client import DEFAULT_POOL_SIZE
 
 
 def main() -> None:
@@ -38,37 +16,47 @@ def main() -> None:
     ap.add_argument("--pool", required=True)
     ap.add_argument("--out", required=True)
     ap.add_argument("--season", type=int, default=2025)
-    ap.add_argument("--sleep", type=float, default=0.15)
+    ap.add_argument("--chunk-size", type=int, default=MAX_KEYS_PER_REQUEST,
+                    help="Player keys per request (Yahoo max 25)")
+    ap.add_argument("--concurrency", type=int, default=DEFAULT_POOL_SIZE,
+                    help="Chunk requests in flight (rate limit: YAHOO_RATE_LIMIT)")
     ap.add_argument("--limit", type=int, default=0, help="0=all, else first N players")
     args = ap.parse_args()
 
-    yc = YahooClient.from_local_config()
-
     pool = json.loads(Path(args.pool).read_text(encoding="utf-8"))
     players = pool.get("players", [])
     if args.limit and args.limit > 0:
         players = players[: args.limit]
 
-    enriched: list[dict[str, Any]] = []
     total = len(players)
+    done = [0]
+
+    def on_chunk(keys: list[str], error: Exception | None) -> None:
+        done[0] += len(keys)
+        print(f"[{done[0]}/{total}] {'ok' if error is None else f'FAIL {error}'} ({len(keys)} players)")
+
+    # players;player_keys=.../stats;type=season;season=N, one request per chunk
+    aclient = AsyncYahooClient.from_local_config(concurrency=args.concurrency)
+    try:
+        stats, errors = asyncio.run(fetch_stats_by_player(
+            aclient, [p["player_key"] for p in players],
+            stats_type="season", season=args.season,
+            chunk_size=min(args.chunk_size, MAX_KEYS_PER_REQUEST), on_chunk=on_chunk,
+        ))
+    finally:
+        aclient.close()
+    if errors:
+        # Same contract as before: a failed fetch aborts without writing
+        key, message = next(iter(errors.items()))
+        raise SystemExit(f"{len(errors)} players failed (first: {key}: {message})")
 
-    for i, p in enumerate(players, start=1):
-        pk = p["player_key"]
-        name = p.get("name", pk)
-
-        path = f"player/{pk}/stats;type=season;season={args.season}"
-        xml_text = yc.get(path)
-
-        baseline_stats_by_id = parse_player_stats_by_id(xml_text)
-
+    enriched: list[dict[str, Any]] = []
+    for p in players:
         p2 = dict(p)
         p2["baseline_season"] = args.season
-        p2["baseline_stats_by_id"] = baseline_stats_by_id
+        p2["baseline_stats_by_id"] = stats.get(p["player_key"], {})
         enriched.append(p2)
 
-        print(f"[{i}/{total}] ok {name}")
-        time.sleep(args.sleep)
-
     out = dict(pool)
     out["baseline_season"] = args.season
     out["players"] = enriched
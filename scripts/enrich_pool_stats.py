@@ -1,87 +1,56 @@
 import argparse
+import asyncio
 import json
-import time
 from pathlib import Path
-import xml.etree.ElementTree as ET
-import requests
 
-from yahoo_ai_gm.yahoo_client import YahooClient
-from yahoo_ai_gm.settings import Settings
-
-
-def _strip_ns(root):
-    for el in root.iter():
-        if "}" in el.tag:
-            el.tag = el.tag.split("}", 1)[1]
-    return root
-
-
-def _text(node, path, default=""):
-    found = node.find(path)
-    return found.text.strip() if (found is not None and found.text) else default
-
-
-def fetch_player_stats_xml(yc: YahooClient, player_key: str) -> str:
-    # Common pattern: player/{player_key}/stats
-    endpoint = f"player/{player_key}/stats"
-    return yc.get(endpoint)
-
-
-def parse_player_stats(xml_text: str) -> dict:
-    """
-    Returns a dict like:
-      {"stat_map": {"R": 10, "HR": 2, ...}} if Yahoo provides stat_id-based output.
-    We’ll keep raw stat_id/value pairs first; later we map stat_ids -> category names.
-    """
-    root = _strip_ns(ET.fromstring(xml_text))
-
-    # Yahoo stats often look like: player/stats/stat -> stat_id, value
-    stats = {}
-    for stat in root.findall(".//stats//stat"):
-        stat_id = _text(stat, "stat_id")
-        value = _text(stat, "value")
-        if stat_id:
-            stats[stat_id] = value
-
-    return {"stats_by_id": stats}
+from yahoo_ai_gm.async_yahoo_client import AsyncYahooClient
+from yahoo_ai_gm.player_stats import MAX_KEYS_PER_REQUEST, fetch_stats_by_player
+from yahoo_ai_gm.yahoo_client import DEFAULT_POOL_SIZE
 
 
 def main():
     ap = argparse.ArgumentParser()
     ap.add_argument("--pool", default="data/waiver_pool_limit_100.json")
     ap.add_argument("--out", default="data/waiver_pool_enriched_100.json")
-    ap.add_argument("--sleep", type=float, default=0.2, help="Sleep between requests (seconds).")
+    ap.add_argument("--chunk-size", type=int, default=MAX_KEYS_PER_REQUEST,
+                    help="Player keys per request (Yahoo max 25).")
+    ap.add_argument("--concurrency", type=int, default=DEFAULT_POOL_SIZE,
+                    help="Chunk requests in flight (rate limit: YAHOO_RATE_LIMIT).")
     ap.add_argument("--limit", type=int, default=None, help="Only enrich first N players (debug).")
     args = ap.parse_args()
 
-    settings = Settings.from_local_config()
-    session = requests.Session()
-    yc = YahooClient(settings=settings, session=session)
-
     pool = json.loads(Path(args.pool).read_text(encoding="utf-8"))
     players = pool.get("players", [])
 
     if args.limit is not None:
         players = players[: args.limit]
 
+    # One request per chunk of keys instead of one per player
+    done = [0]
+
+    def on_chunk(keys, error):
+        done[0] += len(keys)
+        status = "ok" if error is None else f"FAIL {error}"
+        print(f"[{done[0]}/{len(players)}] {status} ({len(keys)} players)")
+
+    aclient = AsyncYahooClient.from_local_config(concurrency=args.concurrency)
+    try:
+        stats, errors = asyncio.run(fetch_stats_by_player(
+            aclient, [p["player_key"] for p in players],
+            chunk_size=min(args.chunk_size, MAX_KEYS_PER_REQUEST), on_chunk=on_chunk,
+        ))
+    finally:
+        aclient.close()
+
     enriched = []
-    for i, p in enumerate(players, start=1):
+    for p in players:
         pk = p["player_key"]
-        try:
-            xml_text = fetch_player_stats_xml(yc, pk)
-            parsed = parse_player_stats(xml_text)
-            p2 = dict(p)
-            p2.update(parsed)
-            enriched.append(p2)
-            print(f"[{i}/{len(players)}] ok {p['name']}")
-        except Exception as e:
-            print(f"[{i}/{len(players)}] FAIL {p.get('name')} {pk}: {e}")
-            p2 = dict(p)
-            p2["stats_by_id"] = {}
-            p2["stats_error"] = str(e)
-            enriched.append(p2)
-
-        time.sleep(args.sleep)
+        p2 = dict(p)
+        p2["stats_by_id"] = stats.get(pk, {})
+        if pk in errors:
+            p2["stats_error"] = errors[pk]
+            print(f"FAIL {p.get('name')} {pk}: {errors[pk]}")
+        enriched.append(p2)
 
     out = dict(pool)
     out["players"] = enriched
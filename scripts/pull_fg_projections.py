@@ -12,11 +12,12 @@ from __future__ import annotations
 import argparse
 import json
 import re
-import time
 from pathlib import Path
 
 import requests
 
+from yahoo_ai_gm.retry import RetryPolicy, send_with_retry
+
 FG_HEADERS = {
     "User-Agent": (
         "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
@@ -49,18 +50,11 @@ PIT_KEEP = {
 
 
 def _fetch_html(url: str, retries: int = 3) -> str:
-    session = requests.Session()
-    for attempt in range(retries):
-        try:
-            resp = session.get(url, headers=FG_HEADERS, timeout=30)
-            resp.raise_for_status()
-            return resp.text
-        except requests.RequestException as e:
-            if attempt == retries - 1:
-                raise
-            print(f"  Retry {attempt + 1}/{retries} after error: {e}")
-            time.sleep(2 ** attempt)
-    raise RuntimeError("unreachable")
+    resp = send_with_retry(
+        lambda: requests.get(url, headers=FG_HEADERS, timeout=30),
+        RetryPolicy(max_attempts=retries, base_delay=1.0),
+    )
+    return resp.text
 
 
 def _extract_next_data(html: str) -> list[dict]:
@@ -4,20 +4,45 @@ scripts/pull_league_rosters.py
 Fetch all team rosters in the league and save to data/league_rosters.json.
 Used by matchup projection engine.
 
+The team list is one request; the per-team roster requests are then issued
+concurrently through AsyncYahooClient (bounded concurrency + shared rate
+limit), so the pull takes about one round trip instead of one per team.
+
+--incremental applies the league transactions since the last sync (adds,
+drops, trades) to the stored rosters instead: one feed request when nothing
+happened. It falls back to a full pull when there is no cursor yet, the
+feed has a gap, or the last full pull is older than FULL_PULL_EVERY.
+The cursor lives in data/sync/league_rosters.json, outside the files the
+service fingerprints, and league_rosters.json is only rewritten when a
+roster changed. Each team carries a roster_hash so per-team caches only
+recompute the teams that changed.
+
 Usage:
   python3 scripts/pull_league_rosters.py
+  python3 scripts/pull_league_rosters.py --incremental
 """
 from __future__ import annotations
 
+import argparse
+import asyncio
 import json
 import xml.etree.ElementTree as ET
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Optional
 
+from yahoo_ai_gm.async_yahoo_client import AsyncYahooClient
+from yahoo_ai_gm.league_rosters import apply_transactions, team_roster_hash, with_hashes
+from yahoo_ai_gm.transactions import fetch_transactions_since
 from yahoo_ai_gm.yahoo_client import YahooClient
+from yahoo_ai_gm.yahoo_xml import iter_records, text
 
 NS = {"y": "http://fantasysports.yahooapis.com/fantasy/v2/base.rng"}
 DATA_DIR = Path("data")
+ROSTERS_PATH = DATA_DIR / "league_rosters.json"
+SYNC_STATE_PATH = DATA_DIR / "sync" / "league_rosters.json"
+
+FULL_PULL_EVERY = timedelta(days=7)
 
 
 def _t(node: ET.Element, path: str, default: str = "") -> str:
@@ -38,57 +63,146 @@ def fetch_team_keys(client: YahooClient, league_key: str) -> list[dict]:
     return teams
 
 
+def roster_path(team_key: str) -> str:
+    return f"team/{team_key}/roster/players"
+
+
 def fetch_roster(client: YahooClient, team_key: str) -> list[dict]:
     """Return normalized player list for a team."""
-    xml = client.get(f"team/{team_key}/roster/players")
-    root = ET.fromstring(xml)
+    return parse_roster(client.get(roster_path(team_key)))
+
+
+def parse_roster(xml: str) -> list[dict]:
     players = []
-    for p in root.findall(".//y:player", NS):
-        player_key = _t(p, "y:player_key")
-        full_name = _t(p, "y:name/y:full")
+    for p in iter_records(xml, "player"):
+        player_key = text(p, "player_key")
+        full_name = text(p, "name/full")
         if not full_name:
-            first = _t(p, "y:name/y:first")
-            last = _t(p, "y:name/y:last")
+            first = text(p, "name/first")
+            last = text(p, "name/last")
             full_name = (first + " " + last).strip()
         players.append({
             "player_key": player_key,
             "full_name": full_name,
-            "mlb_team": _t(p, "y:editorial_team_abbr"),
-            "display_position": _t(p, "y:display_position"),
-            "status": _t(p, "y:status") or "OK",
+            "mlb_team": text(p, "editorial_team_abbr"),
+            "display_position": text(p, "display_position"),
+            "status": text(p, "status") or "OK",
         })
     return players
 
 
+async def fetch_league_rosters(
+    aclient: AsyncYahooClient, teams: list[dict], use_cache: bool = True,
+) -> list[dict]:
+    """Every team's roster, fetched concurrently; same order as teams."""
+    xmls = await aclient.get_many((roster_path(t["team_key"]) for t in teams), use_cache=use_cache)
+    return [
+        {"team_key": t["team_key"], "team_name": t["team_name"], "players": parse_roster(xml)}
+        for t, xml in zip(teams, xmls)
+    ]
+
+
+def _write_json(path: Path, data: dict) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".json.tmp")
+    tmp.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
+    tmp.replace(path)
+
+
+def _load_json(path: Path) -> Optional[dict]:
+    if not path.exists():
+        return None
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except ValueError:
+        return None
+
+
+def _changed_teams(old: Optional[dict], teams: list[dict]) -> set[str]:
+    before = {t["team_key"]: team_roster_hash(t) for t in (old or {}).get("teams", [])}
+    return {t["team_key"] for t in teams if before.get(t["team_key"]) != t["roster_hash"]}
+
+
+async def full_pull(aclient: AsyncYahooClient, league_key: str) -> tuple[list[dict], Optional[int]]:
+    """
+    (teams with hashes, cursor). The cursor is read first and the rosters
+    are then fetched from Yahoo, bypassing the HTTP cache: a cached roster
+    (check_il / pull_live fill the same key) can predate the cursor, and
+    transactions in that gap would never be applied.
+    """
+    feed = await fetch_transactions_since(aclient, league_key, None)
+    teams = fetch_team_keys(aclient.client, league_key)
+    print(f"  Fetching {len(teams)} rosters (concurrency {aclient.concurrency})...")
+    league_rosters = with_hashes(await fetch_league_rosters(aclient, teams, use_cache=False))
+    for team in league_rosters:
+        print(f"    {team['team_name']} ({team['team_key']}): {len(team['players'])} players")
+    return league_rosters, feed.newest_timestamp
+
+
+async def sync_rosters(aclient: AsyncYahooClient, league_key: str, incremental: bool) -> dict:
+    """Update league_rosters.json; returns the new sync state (also saved)."""
+    old = _load_json(ROSTERS_PATH)
+    state = _load_json(SYNC_STATE_PATH) or {}
+    now = datetime.now(tz=timezone.utc)
+
+    reason = None
+    if not incremental:
+        reason = "requested"
+    elif old is None or state.get("cursor") is None:
+        reason = "no cursor"
+    elif now - datetime.fromisoformat(state.get("full_pull_at", "1970-01-01T00:00:00+00:00")) >= FULL_PULL_EVERY:
+        reason = "weekly"
+
+    teams = None
+    cursor = state.get("cursor")
+    if reason is None:
+        feed = await fetch_transactions_since(aclient, league_key, cursor)
+        if feed.complete:
+            teams = old["teams"]
+            changed = apply_transactions(teams, feed.transactions)
+            cursor = feed.newest_timestamp or cursor
+            print(f"  {len(feed.transactions)} transactions since cursor")
+        else:
+            reason = "cursor gap"
+
+    if reason is not None:
+        print(f"Full pull ({reason})...")
+        teams, cursor = await full_pull(aclient, league_key)
+        changed = _changed_teams(old, teams)
+        state["full_pull_at"] = now.isoformat()
+
+    if changed or old is None:
+        _write_json(ROSTERS_PATH, {"league_key": league_key, "teams": teams})
+    state.update({
+        "cursor": cursor,
+        "synced_at": now.isoformat(),
+        "changed_teams": sorted(changed),
+    })
+    _write_json(SYNC_STATE_PATH, state)
+    return state
+
+
 def main() -> None:
-    DATA_DIR.mkdir(parents=True, exist_ok=True)
-    client = YahooClient.from_local_config()
-    league_key = client.settings.league_key
-
-    print(f"Fetching teams for league {league_key}...")
-    teams = fetch_team_keys(client, league_key)
-    print(f"  Found {len(teams)} teams")
-
-    league_rosters = []
-    for team in teams:
-        tkey = team["team_key"]
-        tname = team["team_name"]
-        print(f"  Fetching roster: {tname} ({tkey})...")
-        players = fetch_roster(client, tkey)
-        print(f"    {len(players)} players")
-        league_rosters.append({
-            "team_key": tkey,
-            "team_name": tname,
-            "players": players,
-        })
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--incremental", action="store_true",
+                    help="Apply transactions since the last sync instead of re-pulling every roster")
+    args = ap.parse_args()
 
-    out_path = DATA_DIR / "league_rosters.json"
-    out_path.write_text(
-        json.dumps({"league_key": league_key, "teams": league_rosters}, indent=2, ensure_ascii=False),
-        encoding="utf-8",
-    )
-    print(f"Wrote -> {out_path}")
-    print(f"Total teams: {len(league_rosters)}")
+    DATA_DIR.mkdir(parents=True, exist_ok=True)
+    aclient = AsyncYahooClient.from_local_config()
+    league_key = aclient.settings.league_key
+
+    print(f"Syncing rosters for league {league_key}...")
+    try:
+        state = asyncio.run(sync_rosters(aclient, league_key, args.incremental))
+    finally:
+        aclient.close()
+
+    changed = state["changed_teams"]
+    if changed:
+        print(f"Wrote -> {ROSTERS_PATH} ({len(changed)} teams changed: {', '.join(changed)})")
+    else:
+        print(f"No roster changes; {ROSTERS_PATH} left as is")
 
 
 if __name__ == "__main__":
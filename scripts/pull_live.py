@@ -0,0 +1,81 @@
+"""
+scripts/pull_live.py
+
+Pull the live inputs for a snapshot in one process, concurrently:
+  - league scoreboard     -> data/scoreboard_week_{week}.json, data/league_scoreboard.json
+  - roster snapshot       -> data/roster_snapshot.json / .csv
+  - IL statuses (--il)    -> data/il_status.json, data/il_alerts.json
+
+Runs the same steps as pull_scoreboard_week.py, pull_roster_snapshot.py and
+check_il.py, but their requests share one AsyncYahooClient (connection pool,
+concurrency limit, rate limit) and overlap instead of running back to back.
+
+Usage (from the repo root):
+  python3 -m scripts.pull_live
+  python3 -m scripts.pull_live --il
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+from dataclasses import dataclass
+from typing import List, Optional
+
+from yahoo_ai_gm.async_yahoo_client import AsyncYahooClient
+from scripts.check_il import fetch_current_statuses_async, record_statuses
+from scripts.pull_roster_snapshot import PlayerSnapshot, pull_roster_snapshot_async, save_roster_snapshot
+from scripts.pull_scoreboard_week import ScoreboardMatchup, ScoreboardWeek, pull_scoreboard_async
+
+
+@dataclass
+class LivePull:
+    matchups: List[ScoreboardMatchup]
+    scoreboard: Optional[ScoreboardWeek]
+    roster: List[PlayerSnapshot]
+    il_statuses: Optional[dict] = None
+
+
+async def pull_live_async(aclient: AsyncYahooClient, il: bool = False) -> LivePull:
+    """Fetch everything concurrently, then write the same files the scripts write."""
+    tasks = [pull_scoreboard_async(aclient), pull_roster_snapshot_async(aclient)]
+    if il:
+        tasks.append(fetch_current_statuses_async(aclient))
+    results = await asyncio.gather(*tasks)
+
+    (matchups, scoreboard), roster = results[0], results[1]
+    save_roster_snapshot(roster)
+    il_statuses = results[2] if il else None
+    if il_statuses is not None:
+        record_statuses(il_statuses)
+    return LivePull(matchups=matchups, scoreboard=scoreboard, roster=roster, il_statuses=il_statuses)
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--il", action="store_true", help="Also refresh IL statuses / alerts")
+    args = ap.parse_args()
+
+    aclient = AsyncYahooClient.from_local_config()
+    try:
+        live = asyncio.run(pull_live_async(aclient, il=args.il))
+    finally:
+        aclient.close()
+
+    if live.scoreboard is not None:
+        print(f"Scoreboard: week {live.scoreboard.week} ({len(live.matchups)} matchups)")
+    else:
+        print(f"Scoreboard: my team not in current scoreboard ({len(live.matchups)} matchups)")
+    print(f"Roster snapshot: {len(live.roster)} players")
+    if live.il_statuses is not None:
+        print(f"IL statuses: {len(live.il_statuses)} players")
+    if aclient.client.cache is not None:
+        c = aclient.client.cache.stats()
+        print(f"HTTP cache: {c['hits']} hits, {c['misses']} misses, {c['bypassed']} uncached")
+    r = aclient.client.retry_stats.stats()
+    if r["retries"] or r["failures"]:
+        print(f"Retries: {r['retries']} ({r['throttled']} throttled, {r['throttle_seconds']}s paused), "
+              f"{r['failures']} failed")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import csv
 import json
 from dataclasses import dataclass, asdict
@@ -7,6 +8,7 @@ from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 import xml.etree.ElementTree as ET
 
+from yahoo_ai_gm.async_yahoo_client import AsyncYahooClient, run_sync
 from yahoo_ai_gm.yahoo_client import YahooClient
 
 NS = {"y": "http://fantasysports.yahooapis.com/fantasy/v2/base.rng"}
@@ -66,88 +68,118 @@ def chunked(xs: List[str], n: int) -> List[List[str]]:
     return [xs[i:i+n] for i in range(0, len(xs), n)]
 
 
-def fetch_players_xml(client: YahooClient, player_keys: List[str]) -> ET.Element:
+def players_path(player_keys: List[str]) -> str:
     # players;player_keys=... returns player metadata
-    path = "players;player_keys=" + ",".join(player_keys)
-    xml = client.get(path)
-    return ET.fromstring(xml)
+    return "players;player_keys=" + ",".join(player_keys)
 
 
-def fetch_stats_xml(client: YahooClient, player_keys: List[str], stats_type: str, season: Optional[str] = None) -> ET.Element:
+def stats_path(player_keys: List[str], stats_type: str, season: Optional[str] = None) -> str:
     # players;player_keys=.../stats;type=...
     # Common: type=lastseason OR type=season;season=YYYY
-    base = "players;player_keys=" + ",".join(player_keys) + f"/stats;type={stats_type}"
+    base = players_path(player_keys) + f"/stats;type={stats_type}"
     if season:
         base += f";season={season}"
-    xml = client.get(base)
-    return ET.fromstring(xml)
+    return base
 
 
-def main():
-    client = YahooClient.from_local_config()
-    team_key = client.settings.team_key
+def fetch_players_xml(client: YahooClient, player_keys: List[str]) -> ET.Element:
+    return ET.fromstring(client.get(players_path(player_keys)))
+
+
+def fetch_stats_xml(client: YahooClient, player_keys: List[str], stats_type: str, season: Optional[str] = None) -> ET.Element:
+    return ET.fromstring(client.get(stats_path(player_keys, stats_type, season)))
+
+
+def _stats_map(result) -> Dict[str, Dict[str, str]]:
+    # Stats are optional (lastseason should exist even preseason; season may be empty)
+    if isinstance(result, BaseException):
+        return {}
+    try:
+        return parse_player_stats_map(ET.fromstring(result))
+    except ET.ParseError:
+        return {}
+
+
+def build_snapshots(
+    players_root: ET.Element,
+    lastseason_map: Dict[str, Dict[str, str]],
+    season_map: Dict[str, Dict[str, str]],
+) -> List[PlayerSnapshot]:
+    snapshots: List[PlayerSnapshot] = []
+    for p in players_root.findall(".//y:player", NS):
+        pkey = t(p, "y:player_key")
+        if not pkey:
+            continue
+
+        full_name = t(p, "y:name/y:full")
+        mlb_team = t(p, "y:editorial_team_abbr")
+        display_pos = t(p, "y:display_position")
+        status = t(p, "y:status") or "OK"
+
+        elig_positions = []
+        for pos in p.findall(".//y:eligible_positions/y:position", NS):
+            if pos.text:
+                elig_positions.append(pos.text.strip())
+        eligible_positions = ",".join(elig_positions)
+
+        snapshots.append(
+            PlayerSnapshot(
+                player_key=pkey,
+                full_name=full_name,
+                mlb_team=mlb_team,
+                display_position=display_pos,
+                eligible_positions=eligible_positions,
+                status=status,
+                lastseason_stats=lastseason_map.get(pkey, {}),
+                season_stats=season_map.get(pkey, {}),
+            )
+        )
+    return snapshots
+
+
+async def pull_roster_snapshot_async(aclient: AsyncYahooClient) -> List[PlayerSnapshot]:
+    """
+    Roster players with metadata, last-season and season stats. The three
+    requests per key chunk, and the chunks themselves, run concurrently.
+    """
+    team_key = aclient.settings.team_key
 
     # 1) Pull roster -> get player keys
-    roster_xml = client.get(f"team/{team_key}/roster")
-    roster_root = ET.fromstring(roster_xml)
+    roster_root = ET.fromstring(await aclient.get(f"team/{team_key}/roster"))
     roster_players = roster_root.findall(".//y:player", NS)
 
     roster_player_keys = [t(p, "y:player_key") for p in roster_players if t(p, "y:player_key")]
     if not roster_player_keys:
-        raise SystemExit("No player_keys found on roster response.")
+        raise RuntimeError("No player_keys found on roster response.")
 
     # 2) Batch fetch player metadata and stats
-    snapshots: List[PlayerSnapshot] = []
+    async def _chunk(keys: List[str]) -> List[PlayerSnapshot]:
+        players_xml, lastseason, season = await asyncio.gather(
+            aclient.get(players_path(keys)),
+            aclient.get(stats_path(keys, "lastseason")),
+            aclient.get(stats_path(keys, "season")),
+            return_exceptions=True,
+        )
+        if isinstance(players_xml, BaseException):
+            raise players_xml
+        return build_snapshots(ET.fromstring(players_xml), _stats_map(lastseason), _stats_map(season))
 
     # Yahoo can be finicky with very long URLs. 25–50 keys per call is usually safe.
-    for keys in chunked(roster_player_keys, 25):
-        players_root = fetch_players_xml(client, keys)
-
-        # Try lastseason stats (should exist even preseason)
-        try:
-            lastseason_root = fetch_stats_xml(client, keys, "lastseason")
-            lastseason_map = parse_player_stats_map(lastseason_root)
-        except Exception:
-            lastseason_map = {}
-
-        # Try current season stats (may be empty preseason)
-        # We'll use the game_key-derived season if you ever want it; for now, just call type=season without year.
-        try:
-            season_root = fetch_stats_xml(client, keys, "season")
-            season_map = parse_player_stats_map(season_root)
-        except Exception:
-            season_map = {}
-
-        # Build snapshot from metadata
-        for p in players_root.findall(".//y:player", NS):
-            pkey = t(p, "y:player_key")
-            if not pkey:
-                continue
-
-            full_name = t(p, "y:name/y:full")
-            mlb_team = t(p, "y:editorial_team_abbr")
-            display_pos = t(p, "y:display_position")
-            status = t(p, "y:status") or "OK"
-
-            elig_positions = []
-            for pos in p.findall(".//y:eligible_positions/y:position", NS):
-                if pos.text:
-                    elig_positions.append(pos.text.strip())
-            eligible_positions = ",".join(elig_positions)
-
-            snapshots.append(
-                PlayerSnapshot(
-                    player_key=pkey,
-                    full_name=full_name,
-                    mlb_team=mlb_team,
-                    display_position=display_pos,
-                    eligible_positions=eligible_positions,
-                    status=status,
-                    lastseason_stats=lastseason_map.get(pkey, {}),
-                    season_stats=season_map.get(pkey, {}),
-                )
-            )
+    chunks = await asyncio.gather(*(_chunk(keys) for keys in chunked(roster_player_keys, 25)))
+    return [s for chunk in chunks for s in chunk]
 
+
+def pull_roster_snapshot(client: YahooClient) -> List[PlayerSnapshot]:
+    """Synchronous entry point (one shared client; requests fan out internally)."""
+    aclient = AsyncYahooClient(client)
+    try:
+        return run_sync(pull_roster_snapshot_async(aclient))
+    finally:
+        aclient.close()
+
+
+def save_roster_snapshot(snapshots: List[PlayerSnapshot]) -> Tuple[Path, Path]:
+    """Write data/roster_snapshot.json and data/roster_snapshot.csv."""
     # 3) Save JSON (full fidelity)
     json_path = DATA_DIR / "roster_snapshot.json"
     with json_path.open("w", encoding="utf-8") as f:
@@ -209,6 +241,17 @@ def main():
 
             w.writerow(row)
 
+    return json_path, csv_path
+
+
+def main():
+    client = YahooClient.from_local_config()
+    try:
+        snapshots = pull_roster_snapshot(client)
+    except RuntimeError as e:
+        raise SystemExit(str(e))
+    json_path, csv_path = save_roster_snapshot(snapshots)
+
     print(f"Saved:\n- {json_path}\n- {csv_path}\n")
     print(f"Players: {len(snapshots)}")
 
@@ -1,12 +1,33 @@
+"""
+scripts/pull_scoreboard_week.py
+
+Pull the league scoreboard (one request) and write:
+  data/scoreboard_week_{week}.json  — my matchup (input to build_snapshot.py)
+  data/league_scoreboard.json       — every matchup, compact team x category
+                                      table per week (analysis/league_scoreboard.py)
+
+The response is parsed as a stream: each <matchup> is handled as soon as it
+closes and then cleared.
+
+Usage:
+  python3 scripts/pull_scoreboard_week.py            # current week
+  python3 scripts/pull_scoreboard_week.py --week 5   # backfill a past week
+  python3 scripts/pull_scoreboard_week.py --weeks 1-5 # backfill several weeks concurrently
+"""
 from __future__ import annotations
 
+import argparse
+import asyncio
+import io
 import json
 from dataclasses import dataclass, asdict
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
 import xml.etree.ElementTree as ET
 
+from yahoo_ai_gm.analysis.league_scoreboard import SCOREBOARD_CATS, merge_scoreboard_week
+from yahoo_ai_gm.async_yahoo_client import AsyncYahooClient
 from yahoo_ai_gm.yahoo_client import YahooClient
 
 NS = {"y": "http://fantasysports.yahooapis.com/fantasy/v2/base.rng"}
@@ -35,16 +56,18 @@ def t(node: ET.Element, path: str, default: str = "") -> str:
     return el.text.strip() if el is not None and el.text else default
 
 
-def find_current_week_from_scoreboard(root: ET.Element) -> Optional[int]:
+MATCHUP_TAG = f"{{{NS['y']}}}matchup"
+
+
+def iter_matchups(xml: str) -> Iterator[ET.Element]:
     """
-    Yahoo scoreboard responses typically include one or more matchups with a <week>.
-    We’ll take the first matchup week if present.
+    Stream <matchup> elements out of a scoreboard response. Each element is
+    complete when yielded and cleared once the caller is done with it.
     """
-    m = root.find(".//y:matchup", NS)
-    if m is None:
-        return None
-    wk = t(m, "y:week")
-    return int(wk) if wk.isdigit() else None
+    for _, el in ET.iterparse(io.BytesIO(xml.encode("utf-8")), events=("end",)):
+        if el.tag == MATCHUP_TAG:
+            yield el
+            el.clear()
 
 
 def parse_team_totals(team_node: ET.Element) -> Dict[str, str]:
@@ -81,6 +104,72 @@ class ScoreboardMatchup:
     week: int
     status: str
     teams: Dict[str, ScoreboardTeam]  # team_key -> ScoreboardTeam
+    week_start: str = ""
+    week_end: str = ""
+
+
+def parse_matchup(m: ET.Element) -> ScoreboardMatchup:
+    teams: Dict[str, ScoreboardTeam] = {}
+    for team in m.findall(".//y:teams/y:team", NS):
+        tk = t(team, "y:team_key")
+        teams[tk] = ScoreboardTeam(team_key=tk, name=t(team, "y:name"), totals=parse_team_totals(team))
+    wk = t(m, "y:week")
+    return ScoreboardMatchup(
+        week=int(wk) if wk.isdigit() else 0,
+        status=t(m, "y:status") or "unknown",
+        teams=teams,
+        week_start=t(m, "y:week_start"),
+        week_end=t(m, "y:week_end"),
+    )
+
+
+def _num(v: str) -> Optional[float]:
+    try:
+        return float(v)
+    except ValueError:
+        return None
+
+
+def build_week_table(matchups: List[ScoreboardMatchup]) -> dict:
+    """Compact team x category table for one week (see analysis/league_scoreboard.py)."""
+    teams: List[str] = []
+    names: List[str] = []
+    totals: List[List[Optional[float]]] = []
+    pairs: List[List[int]] = []
+    for m in matchups:
+        rows = []
+        for tk, team in m.teams.items():
+            rows.append(len(teams))
+            teams.append(tk)
+            names.append(team.name)
+            totals.append([_num(team.totals.get(cat, "")) for cat in SCOREBOARD_CATS])
+        if len(rows) == 2:
+            pairs.append(rows)
+    first = matchups[0]
+    return {
+        "status": first.status,
+        "week_start": first.week_start,
+        "week_end": first.week_end,
+        "teams": teams,
+        "names": names,
+        "totals": totals,
+        "matchups": pairs,
+    }
+
+
+def save_league_table(league_key: str, week: int, week_table: dict) -> Path:
+    path = DATA_DIR / "league_scoreboard.json"
+    table = None
+    if path.exists():
+        try:
+            table = json.loads(path.read_text(encoding="utf-8"))
+        except ValueError:
+            table = None
+    table = merge_scoreboard_week(table, league_key, week, week_table)
+    tmp = path.with_suffix(".json.tmp")
+    tmp.write_text(json.dumps(table, separators=(",", ":")), encoding="utf-8")
+    tmp.replace(path)
+    return path
 
 
 @dataclass
@@ -91,66 +180,139 @@ class ScoreboardWeek:
     matchup: ScoreboardMatchup
 
 
+def scoreboard_path(league_key: str, week: Optional[int] = None) -> str:
+    # Without a week, Yahoo returns the current week while the season is live.
+    path = f"league/{league_key}/scoreboard"
+    if week is not None:
+        path += f";week={week}"
+    return path
+
+
+def process_scoreboard(
+    xml: str, league_key: str, team_key: str, week: Optional[int] = None
+) -> Tuple[List[ScoreboardMatchup], Optional[ScoreboardWeek]]:
+    """
+    Parse a scoreboard response, merge it into data/league_scoreboard.json and,
+    if my team is in it, write data/scoreboard_week_{week}.json.
+    """
+    # 1) Parse every matchup in one streaming pass
+    matchups = [parse_matchup(m) for m in iter_matchups(xml)]
+    if not matchups:
+        return matchups, None
+    week = week or matchups[0].week
+
+    # 2) League-wide table for standings / opponent analysis
+    save_league_table(league_key, week, build_week_table(matchups))
+
+    # 3) Identify the matchup that includes YOUR team
+    matchup = next((m for m in matchups if team_key in m.teams), None)
+    if matchup is None:
+        return matchups, None
+
+    payload = ScoreboardWeek(
+        league_key=league_key,
+        pulled_at=datetime.now(timezone.utc).astimezone().strftime("%Y-%m-%d %H:%M:%S %Z"),
+        week=matchup.week or week,
+        matchup=matchup,
+    )
+    out_path = DATA_DIR / f"scoreboard_week_{payload.week}.json"
+    out_path.write_text(json.dumps(asdict(payload), indent=2, sort_keys=True), encoding="utf-8")
+    return matchups, payload
+
+
+def pull_scoreboard(
+    client: YahooClient, week: Optional[int] = None
+) -> Tuple[List[ScoreboardMatchup], Optional[ScoreboardWeek]]:
+    """
+    Pull the league scoreboard (best source for matchup totals by stat) and
+    process it. Returns (every matchup, my ScoreboardWeek or None). Used by
+    main() and in-process by use_cases/get_waivers.py.
+    """
+    league_key = client.settings.league_key
+    xml = client.get(scoreboard_path(league_key, week))
+    return process_scoreboard(xml, league_key, client.settings.team_key, week)
+
+
+async def pull_scoreboard_async(
+    aclient: AsyncYahooClient, week: Optional[int] = None
+) -> Tuple[List[ScoreboardMatchup], Optional[ScoreboardWeek]]:
+    league_key = aclient.settings.league_key
+    xml = await aclient.get(scoreboard_path(league_key, week))
+    return process_scoreboard(xml, league_key, aclient.settings.team_key, week)
+
+
+async def pull_scoreboards_async(
+    aclient: AsyncYahooClient, weeks: List[int]
+) -> List[Tuple[List[ScoreboardMatchup], Optional[ScoreboardWeek]]]:
+    """Backfill several weeks: fetched concurrently, merged in week order."""
+    league_key = aclient.settings.league_key
+    xmls = await aclient.get_many(scoreboard_path(league_key, w) for w in weeks)
+    # The league table is read-modify-write, so merging stays sequential
+    return [
+        process_scoreboard(xml, league_key, aclient.settings.team_key, w)
+        for w, xml in zip(weeks, xmls)
+    ]
+
+
+def _parse_weeks(spec: str) -> List[int]:
+    """'1-5' or '1,3,7' -> sorted week list."""
+    weeks: set = set()
+    for part in spec.split(","):
+        part = part.strip()
+        if "-" in part:
+            lo, hi = part.split("-", 1)
+            weeks.update(range(int(lo), int(hi) + 1))
+        elif part:
+            weeks.add(int(part))
+    return sorted(weeks)
+
+
 def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--week", type=int, default=None, help="Matchup week (default: current)")
+    ap.add_argument("--weeks", type=str, default=None,
+                    help="Backfill several weeks concurrently, e.g. 1-5 or 1,3,7")
+    args = ap.parse_args()
+
+    if args.weeks:
+        weeks = _parse_weeks(args.weeks)
+        aclient = AsyncYahooClient.from_local_config()
+        try:
+            results = asyncio.run(pull_scoreboards_async(aclient, weeks))
+        finally:
+            aclient.close()
+        for w, (matchups, payload) in zip(weeks, results):
+            mine = f" -> {DATA_DIR / f'scoreboard_week_{payload.week}.json'}" if payload else ""
+            print(f"Week {w}: {len(matchups)} matchups{mine}")
+        print(f"League table -> {DATA_DIR / 'league_scoreboard.json'}")
+        return
+
     client = YahooClient.from_local_config()
     league_key = client.settings.league_key
     team_key = client.settings.team_key
 
-    # 1) Pull league scoreboard (best source for matchup totals by stat)
-    # We intentionally start without specifying week. If season is live, it usually returns current week.
-    xml = client.get(f"league/{league_key}/scoreboard")
-    root = ET.fromstring(xml)
-
-    # 2) Determine current week
-    week = find_current_week_from_scoreboard(root)
-    if week is None:
+    matchups, payload = pull_scoreboard(client, args.week)
+    if not matchups:
         print("No matchup/week found in scoreboard response.")
         print("This usually means the season hasn't started, or scoreboard isn't available yet.")
         return
+    week = args.week or matchups[0].week
+    print(f"League table: {len(matchups)} matchups -> {DATA_DIR / 'league_scoreboard.json'}")
 
-    # 3) Identify the matchup that includes YOUR team
-    matchups = root.findall(".//y:matchup", NS)
-    target_matchup = None
-    for m in matchups:
-        teams = m.findall(".//y:teams/y:team", NS)
-        team_keys = [t(x, "y:team_key") for x in teams]
-        if team_key in team_keys:
-            target_matchup = m
-            break
-
-    if target_matchup is None:
+    if payload is None:
         # If we're preseason, scoreboard can return a generic matchup without your team.
         # Or if league uses different timing.
-        status_guess = t(matchups[0], "y:status") if matchups else ""
-        if status_guess == "preevent":
+        if matchups[0].status == "preevent":
             print(f"Scoreboard is preseason (status=preevent). Week {week} not active yet.")
             return
         print("Could not find your team in the returned scoreboard matchups.")
         print("We can try specifying a week explicitly once you know it is active.")
         return
 
-    status = t(target_matchup, "y:status") or "unknown"
-    wk_str = t(target_matchup, "y:week")
-    wk = int(wk_str) if wk_str.isdigit() else week
-
-    teams_out: Dict[str, ScoreboardTeam] = {}
-    for team in target_matchup.findall(".//y:teams/y:team", NS):
-        tk = t(team, "y:team_key")
-        name = t(team, "y:name")
-        totals = parse_team_totals(team)
-        teams_out[tk] = ScoreboardTeam(team_key=tk, name=name, totals=totals)
-
-    matchup = ScoreboardMatchup(week=wk, status=status, teams=teams_out)
-
-    payload = ScoreboardWeek(
-        league_key=league_key,
-        pulled_at=datetime.now(timezone.utc).astimezone().strftime("%Y-%m-%d %H:%M:%S %Z"),
-        week=wk,
-        matchup=matchup,
-    )
-
+    wk = payload.week
+    status = payload.matchup.status
+    teams_out = payload.matchup.teams
     out_path = DATA_DIR / f"scoreboard_week_{wk}.json"
-    out_path.write_text(json.dumps(asdict(payload), indent=2, sort_keys=True), encoding="utf-8")
 
     # Print a friendly summary
     print(f"League: {league_key}")
@@ -2,10 +2,8 @@ import json
 import os
 from pathlib import Path
 import xml.etree.ElementTree as ET
-import requests
 
 from yahoo_ai_gm.yahoo_client import YahooClient
-from yahoo_ai_gm.settings import Settings
 
 
 def _strip_ns(root):
@@ -21,9 +19,9 @@ def _text(node, path, default=""):
 
 
 def main() -> None:
-    settings = Settings.from_local_config()
-    session = requests.Session()
-    client = YahooClient(settings=settings, session=session)
+    # from_local_config: the settings response is cached season-long (http_cache.py)
+    client = YahooClient.from_local_config()
+    settings = client.settings
 
     league_key = os.getenv("YAHOO_LEAGUE_KEY", "").strip() or f"469.l.{settings.league_id}"
 
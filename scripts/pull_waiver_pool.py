@@ -1,20 +1,29 @@
+"""
+scripts/pull_waiver_pool.py
+
+Pull available players (status=A) for the league into
+data/waiver_pool_limit_{limit}.json.
+
+Yahoo caps a players page at 25 and does not report the collection size,
+so the first page tells us whether there is more; the remaining pages up
+to --limit are then requested concurrently in waves of --concurrency pages
+through AsyncYahooClient (shared rate limit). A short page marks the end,
+so at most one wave is wasted past it. Pages are merged in offset order and
+deduplicated by player_key (rankings can shift between page requests).
+"""
 import argparse
+import asyncio
 import json
 from pathlib import Path
-import xml.etree.ElementTree as ET
-import requests
+from typing import Callable, Optional
 
-from yahoo_ai_gm.yahoo_client import YahooClient
-from yahoo_ai_gm.settings import Settings
+from yahoo_ai_gm.async_yahoo_client import AsyncYahooClient
+from yahoo_ai_gm.yahoo_client import DEFAULT_POOL_SIZE
+from yahoo_ai_gm.yahoo_xml import findall, iter_records, text as _text
 
 PAGE_SIZE = 25  # Yahoo commonly caps page size
 
 
-def _text(node, path, default=""):
-    found = node.find(path)
-    return found.text.strip() if (found is not None and found.text) else default
-
-
 def _split_positions(s: str):
     return [p.strip() for p in (s or "").split(",") if p.strip()]
 
@@ -26,22 +35,15 @@ def _to_float(s: str):
         return None
 
 
-def _parse_players(xml_text: str):
-    root = ET.fromstring(xml_text)
-
-    # Strip namespaces to simplify XPath
-    for el in root.iter():
-        if "}" in el.tag:
-            el.tag = el.tag.split("}", 1)[1]
-
+def parse_players(xml_text: str):
     players = []
-    for player in root.findall(".//player"):
+    for player in iter_records(xml_text, "player"):
         player_key = _text(player, "player_key")
         name_full = _text(player, "name/full")
         editorial_team_abbr = _text(player, "editorial_team_abbr")
         status = _text(player, "status")
 
-        positions = [pos.text.strip() for pos in player.findall(".//eligible_positions/position") if pos.text]
+        positions = [pos.text.strip() for pos in findall(player, ".//eligible_positions/position") if pos.text]
         if not positions:
             positions = _split_positions(_text(player, "display_position"))
 
@@ -70,41 +72,69 @@ def _parse_players(xml_text: str):
     return players
 
 
+def page_path(league_key: str, start: int, count: int, position: Optional[str] = None) -> str:
+    filters = "status=A" + (f";position={position}" if position else "")
+    return f"league/{league_key}/players;{filters};start={start};count={count}"
+
+
+async def fetch_pool(
+    aclient: AsyncYahooClient,
+    league_key: str,
+    limit: int,
+    start: int = 0,
+    position: Optional[str] = None,
+    parse: Callable[[str], list[dict]] = parse_players,
+) -> list[dict]:
+    """Up to `limit` players from offset `start`, in Yahoo's order, unique by player_key."""
+    end = start + limit
+    count = min(PAGE_SIZE, limit)
+    first = parse(await aclient.get(page_path(league_key, start, count, position)))
+    pages = [first]
+    done = len(first) < count
+    next_start = start + PAGE_SIZE
+
+    while not done and next_start < end:
+        wave = []
+        while next_start < end and len(wave) < aclient.concurrency:
+            wave.append((next_start, min(PAGE_SIZE, end - next_start)))
+            next_start += PAGE_SIZE
+        xmls = await asyncio.gather(*(aclient.get(page_path(league_key, s, c, position)) for s, c in wave))
+        for (_, c), xml_text in zip(wave, xmls):
+            batch = parse(xml_text)
+            pages.append(batch)
+            if len(batch) < c:
+                done = True
+                break
+
+    seen = set()
+    players = []
+    for batch in pages:
+        for p in batch:
+            if p["player_key"] not in seen:
+                seen.add(p["player_key"])
+                players.append(p)
+    return players[:limit]
+
+
 def main() -> None:
     p = argparse.ArgumentParser()
     p.add_argument("--league-key", default=None, help="Yahoo league_key like 469.l.40206")
     p.add_argument("--limit", type=int, default=100, help="Total players to collect (auto-paged).")
     p.add_argument("--start", type=int, default=0, help="Start offset.")
+    p.add_argument("--concurrency", type=int, default=DEFAULT_POOL_SIZE, help="Pages in flight.")
     p.add_argument("--out", default=None)
     args = p.parse_args()
 
-    settings = Settings.from_local_config()
-    session = requests.Session()
-    yc = YahooClient(settings=settings, session=session)
-
-    league_key = args.league_key or f"469.l.{settings.league_id}"
+    aclient = AsyncYahooClient.from_local_config(concurrency=args.concurrency)
+    league_key = args.league_key or f"469.l.{aclient.settings.league_id}"
 
     out_path = Path(args.out or f"data/waiver_pool_limit_{args.limit}.json")
     out_path.parent.mkdir(parents=True, exist_ok=True)
 
-    all_players = []
-    start = args.start
-
-    while len(all_players) < args.limit:
-        count = min(PAGE_SIZE, args.limit - len(all_players))
-        endpoint = f"league/{league_key}/players;status=A;start={start};count={count}"
-        xml_text = yc.get(endpoint)
-
-        batch = _parse_players(xml_text)
-        if not batch:
-            break
-
-        all_players.extend(batch)
-
-        if len(batch) < count:
-            break
-
-        start += len(batch)
+    try:
+        all_players = asyncio.run(fetch_pool(aclient, league_key, args.limit, start=args.start))
+    finally:
+        aclient.close()
 
     out_path.write_text(
         json.dumps(
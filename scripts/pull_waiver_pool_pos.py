@@ -1,29 +1,27 @@
+"""
+scripts/pull_waiver_pool_pos.py
+
+Pull available players at one position into
+data/pool_{pos}_start_{start}_count_{count}.json.
+
+Usage (from the repo root):
+  python3 -m scripts.pull_waiver_pool_pos --pos RP --count 200
+"""
 from __future__ import annotations
 
 import argparse
+import asyncio
 import json
 from pathlib import Path
-import xml.etree.ElementTree as ET
-
-from yahoo_ai_gm.yahoo_client import YahooClient
-
-
-def _strip_ns(root: ET.Element) -> ET.Element:
-    for el in root.iter():
-        if "}" in el.tag:
-            el.tag = el.tag.split("}", 1)[1]
-    return root
-
 
-def _text(node: ET.Element, path: str, default: str = "") -> str:
-    found = node.find(path)
-    return found.text.strip() if (found is not None and found.text) else default
+from yahoo_ai_gm.async_yahoo_client import AsyncYahooClient
+from yahoo_ai_gm.yahoo_xml import iter_records, text as _text
+from scripts.pull_waiver_pool import fetch_pool
 
 
 def parse_players(xml_text: str) -> list[dict]:
-    root = _strip_ns(ET.fromstring(xml_text))
     out = []
-    for pl in root.findall(".//players/player"):
+    for pl in iter_records(xml_text, "player"):
         player_key = _text(pl, "player_key")
         name = _text(pl, "name/full")
         # team abbreviation is buried; try editorial_team_abbr first
@@ -52,15 +50,19 @@ def main() -> None:
     ap.add_argument("--out", default="")
     args = ap.parse_args()
 
-    yc = YahooClient.from_local_config()
-    league_key = args.league_key.strip() or f"469.l.{yc.settings.league_id}"
+    aclient = AsyncYahooClient.from_local_config()
+    league_key = args.league_key.strip() or f"469.l.{aclient.settings.league_id}"
 
     out_path = Path(args.out or f"data/pool_{args.pos}_start_{args.start}_count_{args.count}.json")
     out_path.parent.mkdir(parents=True, exist_ok=True)
 
-    path = f"league/{league_key}/players;status=A;position={args.pos};start={args.start};count={args.count}"
-    xml_text = yc.get(path)
-    players = parse_players(xml_text)
+    # Paged like pull_waiver_pool (one request used to return at most 25 players)
+    try:
+        players = asyncio.run(fetch_pool(
+            aclient, league_key, args.count, start=args.start, position=args.pos, parse=parse_players,
+        ))
+    finally:
+        aclient.close()
 
     payload = {
         "league_key": league_key,
@@ -6,11 +6,8 @@ source .venv/bin/activate
 
 echo "[refresh_snapshot] Starting at $(date)"
 
-echo "[refresh_snapshot] Pulling scoreboard..."
-python3 scripts/pull_scoreboard_week.py
-
-echo "[refresh_snapshot] Pulling roster snapshot..."
-python3 scripts/pull_roster_snapshot.py
+echo "[refresh_snapshot] Pulling scoreboard + roster snapshot..."
+python3 -m scripts.pull_live
 
 # Derive week from the most recent scoreboard file
 WEEK=$(ls data/scoreboard_week_*.json 2>/dev/null \
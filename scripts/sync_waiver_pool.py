@@ -0,0 +1,240 @@
+"""
+scripts/sync_waiver_pool.py
+
+Incremental waiver pool sync from the league transactions feed.
+
+pull_waiver_pool.py + enrich_pool_*.py rebuild a pool wholesale, though only
+a handful of players change hands each day. This script instead:
+
+  1. reads league transactions since the cursor stored in the pool file
+     ("sync_cursor")
+  2. re-reads current ownership / status for just the players those
+     transactions touched (one request per 25 keys)
+  3. removes players now on a team and updates the available ones it holds;
+     adds newly available players only if they fit the pool's own filter
+     (its "position", if any) and it is below its size ("limit" / "count"),
+     as records in the shape of the script that built it
+  4. enriches only player keys the pool has not seen before, the same way
+     the pool was built (baseline_season -> that season's stats, else
+     current stats_by_id; raw pools are left unenriched)
+  5. rewrites the pool, cursor included, atomically
+
+The first run on a pool without a cursor only records one: run it right
+after a full pull. If the feed has a gap (more than transactions.MAX_PAGES
+pages since the cursor) it exits non-zero without writing; re-pull the pool
+in full.
+
+Usage (from the repo root):
+  python3 -m scripts.sync_waiver_pool --pool data/waiver_pool_baseline_2025_300.json
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from yahoo_ai_gm.async_yahoo_client import AsyncYahooClient
+from yahoo_ai_gm.player_stats import chunked, fetch_stats_by_player
+from yahoo_ai_gm.transactions import fetch_transactions_since
+from scripts.pull_waiver_pool import parse_players
+from scripts.pull_waiver_pool_pos import parse_players as parse_position_players
+
+DEFAULT_POOL = Path("data/waiver_pool_baseline_2025_300.json")
+
+# Refreshed from Yahoo for players already in the pool (stats are kept)
+OWNERSHIP_FIELDS = ("team", "pos", "status", "ownership_type")
+
+
+class SyncGap(RuntimeError):
+    pass
+
+
+@dataclass
+class SyncResult:
+    transactions: int = 0
+    affected: list[str] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+    updated: list[str] = field(default_factory=list)
+    added: list[str] = field(default_factory=list)
+    skipped: list[str] = field(default_factory=list)
+    enrich_errors: dict[str, str] = field(default_factory=dict)
+    seeded: bool = False
+
+
+def ownership_path(league_key: str, player_keys: list[str]) -> str:
+    return f"league/{league_key}/players;player_keys={','.join(player_keys)}/ownership"
+
+
+def load_pool(path: Path) -> dict[str, Any]:
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def save_pool(path: Path, pool: dict[str, Any]) -> None:
+    tmp = path.with_suffix(".json.tmp")
+    tmp.write_text(json.dumps(pool, indent=2, ensure_ascii=False), encoding="utf-8")
+    tmp.replace(path)
+
+
+def pool_parser(pool: dict[str, Any]) -> Callable[[str], list[dict]]:
+    """Parser of the script that built the pool: position pools come from pull_waiver_pool_pos."""
+    return parse_position_players if pool.get("position") else parse_players
+
+
+def pool_size(pool: dict[str, Any]) -> Optional[int]:
+    return pool.get("limit") or pool.get("count")
+
+
+def fits_position(pool: dict[str, Any], ownership: dict) -> bool:
+    position = pool.get("position")
+    return not position or position in (ownership.get("pos") or "").split(",")
+
+
+async def fetch_ownership(
+    aclient: AsyncYahooClient,
+    league_key: str,
+    keys: list[str],
+    parse: Callable[[str], list[dict]] = parse_players,
+) -> dict[str, tuple[dict, dict]]:
+    """
+    Current state of keys as (ownership, record): ownership is the
+    pull_waiver_pool record (ownership_type, eligible positions), record the
+    same player as `parse` would store it in the pool.
+    """
+    xmls = await aclient.get_many(ownership_path(league_key, chunk) for chunk in chunked(keys))
+    out: dict[str, tuple[dict, dict]] = {}
+    for xml in xmls:
+        records = {p["player_key"]: p for p in parse(xml)} if parse is not parse_players else None
+        for p in parse_players(xml):
+            out[p["player_key"]] = (p, p if records is None else records.get(p["player_key"], p))
+    return out
+
+
+async def enrich_new_players(
+    aclient: AsyncYahooClient,
+    pool: dict[str, Any],
+    new_players: list[dict],
+) -> dict[str, str]:
+    """Add stats to new_players in place, matching how the pool was enriched. Returns errors."""
+    season: Optional[int] = pool.get("baseline_season")
+    enriched = season is not None or any("stats_by_id" in p for p in pool.get("players", []))
+    if not new_players or not enriched:
+        return {}
+
+    keys = [p["player_key"] for p in new_players]
+    if season is not None:
+        stats, errors = await fetch_stats_by_player(aclient, keys, stats_type="season", season=season)
+    else:
+        stats, errors = await fetch_stats_by_player(aclient, keys)
+
+    for p in new_players:
+        pk = p["player_key"]
+        if season is not None:
+            p["baseline_season"] = season
+            p["baseline_stats_by_id"] = stats.get(pk, {})
+        else:
+            p["stats_by_id"] = stats.get(pk, {})
+        if pk in errors:
+            p["stats_error"] = errors[pk]
+    return errors
+
+
+async def sync_pool(aclient: AsyncYahooClient, pool: dict[str, Any], league_key: str) -> SyncResult:
+    """Apply transactions since pool["sync_cursor"] to pool (in place)."""
+    result = SyncResult()
+    cursor = pool.get("sync_cursor") or {}
+    since: Optional[int] = cursor.get("timestamp")
+
+    feed = await fetch_transactions_since(aclient, league_key, since)
+    if not feed.complete:
+        raise SyncGap(f"more than {len(feed.transactions)} transactions since {since}; re-pull the pool in full")
+
+    now = datetime.now(tz=timezone.utc).isoformat()
+    if since is None:
+        result.seeded = True
+        pool["sync_cursor"] = {"timestamp": feed.newest_timestamp or 0, "synced_at": now}
+        return result
+
+    result.transactions = len(feed.transactions)
+    affected = list(dict.fromkeys(p.player_key for tx in feed.transactions for p in tx.players))
+    result.affected = affected
+
+    current = await fetch_ownership(aclient, league_key, affected, pool_parser(pool)) if affected else {}
+
+    players: list[dict] = pool.get("players", [])
+    by_key = {p["player_key"]: p for p in players}
+    size = pool_size(pool)
+    new_players: list[dict] = []
+    for pk in affected:
+        if pk not in current:
+            continue
+        ownership, record = current[pk]
+        if ownership.get("ownership_type") == "team":
+            if pk in by_key:
+                result.removed.append(pk)
+            continue
+        existing = by_key.get(pk)
+        if existing is not None:
+            for k in OWNERSHIP_FIELDS:
+                if k in record:
+                    existing[k] = record[k]
+            if record.get("percent_owned") is not None:
+                existing["percent_owned"] = record["percent_owned"]
+            result.updated.append(pk)
+        elif not fits_position(pool, ownership):
+            result.skipped.append(pk)
+        else:
+            new_players.append(dict(record))
+            result.added.append(pk)
+
+    if size is not None:
+        room = max(0, size - (len(players) - len(result.removed)))
+        result.skipped += result.added[room:]
+        new_players, result.added = new_players[:room], result.added[:room]
+
+    result.enrich_errors = await enrich_new_players(aclient, pool, new_players)
+
+    removed = set(result.removed)
+    pool["players"] = [p for p in players if p["player_key"] not in removed] + new_players
+    pool["returned"] = len(pool["players"])
+    pool["sync_cursor"] = {"timestamp": feed.newest_timestamp or since, "synced_at": now}
+    return result
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--pool", default=str(DEFAULT_POOL), help="Pool artifact to update in place")
+    ap.add_argument("--league-key", default=None, help="Defaults to the pool's league_key")
+    args = ap.parse_args()
+
+    path = Path(args.pool)
+    pool = load_pool(path)
+
+    aclient = AsyncYahooClient.from_local_config()
+    league_key = args.league_key or pool.get("league_key") or aclient.settings.league_key
+    try:
+        result = asyncio.run(sync_pool(aclient, pool, league_key))
+    except SyncGap as e:
+        raise SystemExit(f"[sync_waiver_pool] Gap in transactions feed: {e}")
+    finally:
+        aclient.close()
+
+    save_pool(path, pool)
+    if result.seeded:
+        print(f"[sync_waiver_pool] No cursor yet; recorded one -> {path}")
+        return
+    print(
+        f"[sync_waiver_pool] {result.transactions} transactions, {len(result.affected)} players affected: "
+        f"{len(result.removed)} removed, {len(result.updated)} updated, {len(result.added)} added, "
+        f"{len(result.skipped)} skipped (position / pool size)"
+    )
+    for pk, err in result.enrich_errors.items():
+        print(f"  FAIL enrich {pk}: {err}")
+    print(f"Wrote {len(pool['players'])} players -> {path}")
+
+
+if __name__ == "__main__":
+    main()
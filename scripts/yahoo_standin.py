@@ -0,0 +1,208 @@
+"""
+scripts/yahoo_standin.py
+
+Local stand-in for the Yahoo Fantasy API: replays recorded fixtures.
+
+Record a session against Yahoo once (every response the client returns is
+saved, see src/yahoo_ai_gm/recording.py):
+
+  YAHOO_RECORD_DIR=fixtures/yahoo YAHOO_HTTP_CACHE=0 python3 -m scripts.pull_live --il
+
+then replay it with no network:
+
+  python3 -m scripts.yahoo_standin --fixtures fixtures/yahoo --latency-ms 150 --p429 0.05
+  YAHOO_API_BASE=http://127.0.0.1:8765/fantasy/v2/ \\
+  YAHOO_TOKEN_URL=http://127.0.0.1:8765/oauth2/get_token \\
+      python3 -m scripts.pull_live --il
+
+Requests are matched on method + path + sorted query params (the base URL
+prefix is stripped). Unrecorded requests get a 404 with a Yahoo-style error
+body. Fault injection, applied in this order:
+
+  --rate-limit N   requests/second; over budget -> 429 (+ Retry-After)
+  --p429 P         probability of a random 429
+  --p-error P      probability of --error-status (default 500; Yahoo also
+                   throttles with 999)
+  --latency-ms / --jitter-ms   delay added to every response
+
+POST /oauth2/get_token returns a fresh fake token so refreshes stay local.
+GET /_standin/stats returns request / fault counters as JSON.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qsl, unquote, urlsplit
+
+from yahoo_ai_gm.recording import fixture_key, load_fixture
+
+YAHOO_ERROR = (
+    '<?xml version="1.0" encoding="UTF-8"?>\n'
+    '<error xmlns="http://www.yahooapis.com/v1/base.rng">'
+    "<description>{description}</description></error>"
+)
+
+
+class StandIn:
+    """Fixture lookup + fault injection shared by all handler threads."""
+
+    def __init__(self, args: argparse.Namespace):
+        self.fixtures = Path(args.fixtures)
+        self.prefix = "/" + args.prefix.strip("/") + "/"
+        self.latency = args.latency_ms / 1000.0
+        self.jitter = args.jitter_ms / 1000.0
+        self.rate = args.rate_limit
+        self.p429 = args.p429
+        self.p_error = args.p_error
+        self.error_status = args.error_status
+        self.retry_after = args.retry_after
+        self.random = random.Random(args.seed)
+        self._lock = threading.Lock()
+        self._tokens = float(max(1, self.rate))
+        self._updated = time.monotonic()
+        self.counts = {"requests": 0, "served": 0, "missing": 0, "throttled": 0, "errors": 0, "tokens": 0}
+
+    def count(self, name: str) -> None:
+        with self._lock:
+            self.counts[name] += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            return dict(self.counts)
+
+    def _over_rate(self) -> bool:
+        if self.rate <= 0:
+            return False
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(float(self.rate), self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens < 1.0:
+                return True
+            self._tokens -= 1.0
+            return False
+
+    def _roll(self, p: float) -> bool:
+        if p <= 0:
+            return False
+        with self._lock:
+            return self.random.random() < p
+
+    def delay(self) -> None:
+        wait = self.latency
+        if self.jitter > 0:
+            with self._lock:
+                wait += self.random.uniform(0, self.jitter)
+        if wait > 0:
+            time.sleep(wait)
+
+    def fault(self) -> tuple[int, dict] | None:
+        """(status, extra headers) for an injected fault, or None."""
+        if self._over_rate() or self._roll(self.p429):
+            self.count("throttled")
+            return 429, {"Retry-After": str(self.retry_after)}
+        if self._roll(self.p_error):
+            self.count("errors")
+            return self.error_status, {}
+        return None
+
+    def lookup(self, method: str, raw_path: str) -> tuple[int, str]:
+        parts = urlsplit(raw_path)
+        path = unquote(parts.path)
+        if path.startswith(self.prefix):
+            path = path[len(self.prefix):]
+        key = fixture_key(method, path, parse_qsl(parts.query, keep_blank_values=True))
+        found = load_fixture(self.fixtures, key)
+        if found is None:
+            self.count("missing")
+            return 404, YAHOO_ERROR.format(description=f"No fixture for {method} {path}")
+        self.count("served")
+        return found
+
+
+def make_handler(standin: StandIn) -> type[BaseHTTPRequestHandler]:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, fmt: str, *args) -> None:
+            pass
+
+        def _send(self, status: int, body: str, content_type: str, headers: dict | None = None) -> None:
+            data = body.encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(data)))
+            for k, v in (headers or {}).items():
+                self.send_header(k, v)
+            self.end_headers()
+            self.wfile.write(data)
+
+        def _serve(self, method: str) -> None:
+            if method == "POST":
+                # Drain the body so keep-alive connections stay in sync
+                self.rfile.read(int(self.headers.get("Content-Length") or 0))
+            if self.path.startswith("/_standin/stats"):
+                self._send(200, json.dumps(standin.stats()), "application/json")
+                return
+            if method == "POST" and self.path.startswith("/oauth2/get_token"):
+                standin.count("tokens")
+                token = {"access_token": f"standin-{time.time():.0f}", "refresh_token": "standin",
+                         "expires_in": 3600, "token_type": "bearer"}
+                self._send(200, json.dumps(token), "application/json")
+                return
+
+            standin.count("requests")
+            standin.delay()
+            fault = standin.fault()
+            if fault is not None:
+                status, headers = fault
+                self._send(status, YAHOO_ERROR.format(description="Injected fault"), "application/xml", headers)
+                return
+            status, body = standin.lookup(method, self.path)
+            self._send(status, body, "application/xml")
+
+        def do_GET(self) -> None:
+            self._serve("GET")
+
+        def do_POST(self) -> None:
+            self._serve("POST")
+
+    return Handler
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--fixtures", required=True, help="Directory written with YAHOO_RECORD_DIR")
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--port", type=int, default=8765)
+    ap.add_argument("--prefix", default="/fantasy/v2/", help="Path prefix stripped before matching")
+    ap.add_argument("--latency-ms", type=float, default=0.0)
+    ap.add_argument("--jitter-ms", type=float, default=0.0)
+    ap.add_argument("--rate-limit", type=float, default=0.0, help="Requests/second before 429s (0 = off)")
+    ap.add_argument("--p429", type=float, default=0.0, help="Probability of a random 429")
+    ap.add_argument("--p-error", type=float, default=0.0, help="Probability of --error-status")
+    ap.add_argument("--error-status", type=int, default=500)
+    ap.add_argument("--retry-after", type=int, default=1, help="Retry-After seconds sent with 429s")
+    ap.add_argument("--seed", type=int, default=None, help="Seed for reproducible fault injection")
+    args = ap.parse_args()
+
+    standin = StandIn(args)
+    server = ThreadingHTTPServer((args.host, args.port), make_handler(standin))
+    server.daemon_threads = True
+    print(f"[yahoo_standin] Replaying {standin.fixtures} on http://{args.host}:{args.port}{standin.prefix}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(f"[yahoo_standin] {json.dumps(standin.stats())}")
+
+
+if __name__ == "__main__":
+    main()
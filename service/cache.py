@@ -0,0 +1,414 @@
+"""
+service/cache.py
+
+Response cache for the API.
+
+Every report endpoint is a pure function of its query parameters and the JSON
+artifacts in data/ (FG projections, rosters, schedule, snapshots, pools,
+reports). Responses are cached under
+
+    path + sorted query params + fingerprint(data/ inputs)
+
+where the fingerprint is a hash of (name, size, mtime) of every input file.
+When the timers rewrite any input the fingerprint changes and the next request
+recomputes. Responses carry a weak ETag derived from the same key, so a
+dashboard reload with If-None-Match gets a 304 without touching the engines.
+
+Lookup order: 304 -> precomputed artifacts for the current fingerprint
+(service/precompute.py) -> LRU of computed responses -> in-flight computation
+of the same key (single-flight) -> handler.
+
+Single-flight: while one request for a key is being computed, identical
+requests (same path, params and fingerprint) await that computation instead
+of starting their own, and are counted as "coalesced".
+
+Streamed responses (no Content-Length, e.g. StreamingJSONResponse in
+service/paging.py) are not buffered: a _BodyTee forwards each chunk to the
+requesting client as it is produced and collects the chunks for the cache
+and for coalesced requests, which are answered once the body is complete.
+A streamed body is only complete when the response marked the request
+scope with STREAM_COMPLETE; one cut short (client gone, handler error) is
+neither cached nor shared.
+"""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional
+
+from fastapi import Request
+from fastapi.responses import Response, StreamingResponse
+
+from service.paging import STREAM_COMPLETE
+
+
+DATA_DIR = Path("data")
+
+# data/ subdirectories that feed the endpoints ("" = data/ itself)
+INPUT_DIRS = ("", "snapshots", "reports", "projection_snapshots")
+INPUT_SUFFIXES = (".json", ".md")
+
+# Never cached: side effects, live Yahoo calls, service status, static assets
+UNCACHED_PATHS = {
+    "/health", "/ui", "/workers", "/cache/stats", "/adddrop/execute", "/live/waivers",
+}
+UNCACHED_PREFIXES = ("/static", "/docs", "/openapi", "/redoc", "/jobs")
+
+MAX_ENTRIES = 256
+
+# Re-stat data/ at most this often; bursts of dashboard calls share one scan
+FINGERPRINT_TTL = 1.0
+
+# Internal requests from the precompute watcher skip the cache tiers
+PRECOMPUTE_HEADER = "x-gm-precompute"
+
+
+def input_fingerprint(data_dir: Path = DATA_DIR) -> str:
+    h = hashlib.sha1()
+    for sub in INPUT_DIRS:
+        d = data_dir / sub if sub else data_dir
+        try:
+            entries = sorted(os.scandir(d), key=lambda e: e.name)
+        except FileNotFoundError:
+            continue
+        for e in entries:
+            if not e.is_file() or not e.name.endswith(INPUT_SUFFIXES):
+                continue
+            st = e.stat()
+            h.update(f"{sub}/{e.name}:{st.st_size}:{st.st_mtime_ns};".encode())
+    return h.hexdigest()
+
+
+class ResponseCache:
+    def __init__(self, data_dir: Path = DATA_DIR, max_entries: int = MAX_ENTRIES):
+        self.data_dir = data_dir
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, tuple[bytes, str, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._fp: Optional[str] = None
+        self._fp_at = 0.0
+        self.hits = 0
+        self.misses = 0
+        self.not_modified = 0
+
+    def fingerprint(self) -> str:
+        now = time.monotonic()
+        with self._lock:
+            if self._fp is not None and now - self._fp_at < FINGERPRINT_TTL:
+                return self._fp
+        fp = input_fingerprint(self.data_dir)
+        with self._lock:
+            self._fp, self._fp_at = fp, now
+        return fp
+
+    @staticmethod
+    def resource(request: Request) -> str:
+        params = "&".join(f"{k}={v}" for k, v in sorted(request.query_params.multi_items()))
+        return f"{request.url.path}?{params}"
+
+    def key(self, request: Request, fingerprint: Optional[str] = None) -> str:
+        return f"{self.resource(request)}#{fingerprint or self.fingerprint()}"
+
+    @staticmethod
+    def etag(key: str) -> str:
+        return f'W/"{hashlib.sha1(key.encode()).hexdigest()[:20]}"'
+
+    def get(self, key: str) -> Optional[tuple[bytes, str, int]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+            else:
+                self.misses += 1
+            return entry
+
+    def put(self, key: str, body: bytes, media_type: str, status: int) -> None:
+        with self._lock:
+            self._entries[key] = (body, media_type, status)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def note_not_modified(self) -> None:
+        with self._lock:
+            self.not_modified += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "not_modified": self.not_modified,
+            }
+
+
+class ArtifactStore:
+    """
+    Precomputed payloads for one input fingerprint. A generation is built
+    off to the side and published with a single reference swap, so readers
+    see either the old generation or the new one, never a mix.
+    """
+
+    def __init__(self, path: Path = DATA_DIR / "artifacts" / "payloads.json"):
+        self.path = path
+        self._gen: tuple[str, dict[str, tuple[bytes, str]]] = ("", {})
+        self.generated_at: Optional[str] = None
+        self.build_seconds = 0.0
+        self.errors: list[str] = []
+        self.served = 0
+
+    @property
+    def fingerprint(self) -> str:
+        return self._gen[0]
+
+    def get(self, resource: str, fingerprint: str) -> Optional[tuple[bytes, str]]:
+        fp, payloads = self._gen
+        if fp != fingerprint:
+            return None
+        entry = payloads.get(resource)
+        if entry is not None:
+            self.served += 1
+        return entry
+
+    def publish(
+        self,
+        fingerprint: str,
+        payloads: dict[str, tuple[bytes, str]],
+        generated_at: str,
+        build_seconds: float,
+        errors: list[str],
+        persist: bool = True,
+    ) -> None:
+        self._gen = (fingerprint, payloads)
+        self.generated_at = generated_at
+        self.build_seconds = build_seconds
+        self.errors = errors
+        if persist:
+            self._save()
+
+    def _save(self) -> None:
+        fp, payloads = self._gen
+        doc = {
+            "fingerprint": fp,
+            "generated_at": self.generated_at,
+            "payloads": {
+                k: {"media_type": mt, "body": body.decode("utf-8")}
+                for k, (body, mt) in payloads.items()
+            },
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".json.tmp")
+        tmp.write_text(json.dumps(doc, separators=(",", ":")), encoding="utf-8")
+        tmp.replace(self.path)
+
+    def load(self, fingerprint: str) -> bool:
+        """Adopt the artifacts on disk if they were built from the current inputs."""
+        try:
+            doc = json.loads(self.path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, ValueError):
+            return False
+        if doc.get("fingerprint") != fingerprint:
+            return False
+        payloads = {
+            k: (v["body"].encode("utf-8"), v["media_type"])
+            for k, v in (doc.get("payloads") or {}).items()
+        }
+        self.publish(fingerprint, payloads, doc.get("generated_at"), 0.0, [], persist=False)
+        return True
+
+    def stats(self) -> dict:
+        return {
+            "fingerprint": self.fingerprint[:12],
+            "generated_at": self.generated_at,
+            "payloads": len(self._gen[1]),
+            "build_seconds": round(self.build_seconds, 2),
+            "errors": self.errors,
+            "served": self.served,
+        }
+
+
+class SingleFlight:
+    """Share one in-flight coroutine per key among concurrent callers (event-loop only)."""
+
+    def __init__(self):
+        self._inflight: dict[str, asyncio.Future] = {}
+        self.leaders = 0
+        self.coalesced = 0
+
+    async def do(self, key: str, fn) -> tuple[object, bool]:
+        """Return (result of fn(), whether it came from another caller's run)."""
+        fut = self._inflight.get(key)
+        if fut is not None:
+            self.coalesced += 1
+            try:
+                return await asyncio.shield(fut), True
+            except asyncio.CancelledError:
+                if not fut.cancelled():
+                    raise
+                # The leading request went away (client disconnect); run it ourselves
+                self.coalesced -= 1
+                return await self.do(key, fn)
+
+        fut = asyncio.get_running_loop().create_future()
+        self._inflight[key] = fut
+        self.leaders += 1
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            fut.cancel()
+            raise
+        except BaseException as e:
+            fut.set_exception(e)
+            fut.exception()  # mark retrieved; waiters (if any) still see it
+            raise
+        else:
+            fut.set_result(result)
+            return result, False
+        finally:
+            del self._inflight[key]
+
+    def stats(self) -> dict:
+        return {
+            "in_flight": len(self._inflight),
+            "computed": self.leaders,
+            "coalesced": self.coalesced,
+        }
+
+
+class StreamAborted(Exception):
+    """The streamed body a coalesced request was waiting for did not complete."""
+
+
+class _BodyTee:
+    """
+    Drains a streamed response body on its own task. Chunks are queued for
+    the leading client as they arrive and collected into `body` (a future),
+    which coalesced requests await; on_complete gets the full body once
+    is_complete() confirms the producer finished.
+    """
+
+    def __init__(self, chunks, is_complete, on_complete):
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self.body: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._is_complete = is_complete
+        self._on_complete = on_complete
+        self._task = asyncio.create_task(self._pump(chunks))
+
+    async def _pump(self, chunks) -> None:
+        parts: list[bytes] = []
+        try:
+            async for chunk in chunks:
+                if isinstance(chunk, str):
+                    chunk = chunk.encode("utf-8")
+                parts.append(chunk)
+                self._queue.put_nowait(chunk)
+            if not self._is_complete():
+                raise StreamAborted("stream ended before the response finished")
+        except BaseException as e:
+            self.body.set_exception(StreamAborted(f"{type(e).__name__}: {e}"))
+            self.body.exception()  # mark retrieved; waiters (if any) still see it
+            self._queue.put_nowait(e)
+            if isinstance(e, asyncio.CancelledError):
+                raise
+            return
+        body = b"".join(parts)
+        self._on_complete(body)
+        self.body.set_result(body)
+        self._queue.put_nowait(None)
+
+    async def stream(self):
+        while True:
+            item = await self._queue.get()
+            if item is None:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+
+
+def is_cacheable(request: Request) -> bool:
+    path = request.url.path
+    return (
+        request.method == "GET"
+        and path not in UNCACHED_PATHS
+        and not path.startswith(UNCACHED_PREFIXES)
+    )
+
+
+def _etag_matches(header: Optional[str], etag: str) -> bool:
+    if not header:
+        return False
+    tags = [t.strip() for t in header.split(",")]
+    return "*" in tags or etag in tags or etag[2:] in tags
+
+
+response_cache = ResponseCache()
+artifact_store = ArtifactStore()
+single_flight = SingleFlight()
+
+
+async def cache_middleware(request: Request, call_next):
+    if not is_cacheable(request) or request.headers.get(PRECOMPUTE_HEADER):
+        return await call_next(request)
+
+    cache = response_cache
+    fingerprint = cache.fingerprint()
+    key = cache.key(request, fingerprint)
+    etag = cache.etag(key)
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        cache.note_not_modified()
+        return Response(status_code=304, headers=headers)
+
+    artifact = artifact_store.get(cache.resource(request), fingerprint)
+    if artifact is not None:
+        body, media_type = artifact
+        return Response(content=body, status_code=200, media_type=media_type,
+                        headers={**headers, "X-Cache": "PRECOMPUTED"})
+
+    entry = cache.get(key)
+    if entry is not None:
+        body, media_type, status = entry
+        return Response(content=body, status_code=status, media_type=media_type,
+                        headers={**headers, "X-Cache": "HIT"})
+
+    async def _compute() -> tuple[object, str, int, dict]:
+        response = await call_next(request)
+        media_type = response.headers.get("content-type", "application/json")
+        original = {k: v for k, v in response.headers.items() if k != "content-length"}
+        if response.status_code == 200 and "content-length" not in response.headers:
+            tee = _BodyTee(
+                response.body_iterator,
+                lambda: request.scope.get(STREAM_COMPLETE, False),
+                lambda body: cache.put(key, body, media_type, 200),
+            )
+            return tee, media_type, 200, original
+        # Already fully built by the handler (JSONResponse, error bodies)
+        body = b"".join([chunk async for chunk in response.body_iterator])
+        if response.status_code == 200:
+            cache.put(key, body, media_type, 200)
+        return body, media_type, response.status_code, original
+
+    (body, media_type, status, original), shared = await single_flight.do(key, _compute)
+    if status != 200:
+        return Response(content=body, status_code=status, headers=original)
+    if isinstance(body, _BodyTee):
+        if not shared:
+            return StreamingResponse(body.stream(), status_code=200, media_type=media_type,
+                                     headers={**headers, "X-Cache": "MISS"})
+        try:
+            body = await asyncio.shield(body.body)
+        except StreamAborted:
+            # The leading client went away mid-stream; compute our own copy
+            return await call_next(request)
+    return Response(content=body, status_code=status, media_type=media_type,
+                    headers={**headers, "X-Cache": "COALESCED" if shared else "MISS"})
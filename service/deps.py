@@ -1,6 +1,6 @@
 from functools import lru_cache
 from yahoo_ai_gm.adapters.data_repo import DataRepo
-from yahoo_ai_gm.adapters.yahoo_client import YahooClient
+from yahoo_ai_gm.yahoo_client import YahooClient
 
 
 @lru_cache
@@ -14,4 +14,5 @@ def get_data_repo() -> DataRepo:
 
 @lru_cache
 def get_yahoo_client() -> YahooClient:
-    return YahooClient()
+    # One client (and HTTP session) for the life of the service
+    return YahooClient.from_local_config()
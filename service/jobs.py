@@ -0,0 +1,271 @@
+"""
+service/jobs.py
+
+Background jobs for the long report computations.
+
+POST /jobs?kind=trades_multi&... starts a job and returns its id straight
+away; GET /jobs/{id} reports status, progress and (once done) the result;
+GET /jobs/{id}/events streams progress as server-sent events. A job's kind is
+any /dashboard section (use_cases/get_dashboard.py) and its result has the
+same shape as that section.
+
+Jobs run in the worker pool (service/workers.py) under the same per-endpoint
+limits as the HTTP handlers. The engines report progress through a callback
+(combinations evaluated, weeks / seasons simulated, suggestions scored);
+from pool workers it is sent back over a multiprocessing manager queue and
+applied to the job here.
+
+A job is identified by kind + params + input fingerprint: posting the same
+job again while it is queued, running, or its result is still fresh returns
+the existing job. Finished jobs are dropped RESULT_TTL seconds after they
+finish.
+
+Env:
+  YAHOO_GM_JOB_TTL=900   seconds finished jobs (and results) are kept
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import multiprocessing
+import os
+import queue
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Optional
+
+from service.workers import worker_pool
+
+
+RESULT_TTL = float(os.environ.get("YAHOO_GM_JOB_TTL", "900"))
+
+# Minimum seconds between progress messages sent from one job
+PROGRESS_INTERVAL = 0.25
+
+# Extra query params each job kind accepts (beyond week and n_teams)
+JOB_OPTIONS = {
+    "standings": {"sims": int},
+    "trades_multi": {"n": int},
+    "trades_acceptance": {"n": int},
+}
+
+
+def _run_job(job_id: str, updates, data_dir: Path, kind: str, params: dict) -> dict:
+    """Pool entry point: run one section, posting throttled progress to updates."""
+    from yahoo_ai_gm.use_cases.get_dashboard import run_section
+
+    last = [0.0]
+
+    def progress(stage: str, done: int, total: int) -> None:
+        now = time.monotonic()
+        if now - last[0] < PROGRESS_INTERVAL and done < total:
+            return
+        last[0] = now
+        try:
+            updates.put_nowait((job_id, stage, done, total))
+        except Exception:  # progress is best-effort
+            pass
+
+    return run_section(data_dir, kind, progress=progress, **params)
+
+
+class Job:
+    def __init__(self, kind: str, params: dict, fingerprint: str):
+        self.id = uuid.uuid4().hex[:16]
+        self.kind = kind
+        self.params = params
+        self.fingerprint = fingerprint
+        self.status = "queued"
+        self.stage: Optional[str] = None
+        self.done = 0
+        self.total = 0
+        self.result: Optional[dict] = None
+        self.error: Optional[str] = None
+        self.created_at = datetime.now(tz=timezone.utc)
+        self.finished_at: Optional[float] = None  # monotonic
+        self.version = 0
+        self.changed = asyncio.Event()
+
+    @property
+    def key(self) -> str:
+        return job_key(self.kind, self.params, self.fingerprint)
+
+    def touch(self) -> None:
+        self.version += 1
+        self.changed.set()
+        self.changed = asyncio.Event()
+
+    def progress_dict(self) -> dict:
+        return {
+            "stage": self.stage,
+            "done": self.done,
+            "total": self.total,
+            "fraction": round(self.done / self.total, 4) if self.total else None,
+        }
+
+    def to_dict(self, include_result: bool = True) -> dict:
+        out = {
+            "job_id": self.id,
+            "kind": self.kind,
+            "params": self.params,
+            "status": self.status,
+            "created_at": self.created_at.isoformat(),
+            "progress": self.progress_dict(),
+        }
+        if self.error is not None:
+            out["error"] = self.error
+        if include_result and self.result is not None:
+            out["result"] = self.result
+        return out
+
+
+def job_key(kind: str, params: dict, fingerprint: str) -> str:
+    return f"{kind}?" + "&".join(f"{k}={v}" for k, v in sorted(params.items())) + f"#{fingerprint}"
+
+
+class JobManager:
+    def __init__(self, data_dir: Path = Path("data"), ttl: float = RESULT_TTL):
+        self.data_dir = data_dir
+        self.ttl = ttl
+        self._jobs: dict[str, Job] = {}
+        self._by_key: dict[str, str] = {}
+        self._tasks: set[asyncio.Task] = set()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._updates = None
+        self._manager = None
+        self._reader: Optional[threading.Thread] = None
+        self._channel_lock = threading.Lock()
+        self.deduplicated = 0
+
+    # ------------------------------------------------------------------
+    # Progress channel
+    # ------------------------------------------------------------------
+
+    def _channel(self):
+        """Queue the pool workers can post progress to (started on first job)."""
+        with self._channel_lock:
+            if self._updates is None:
+                if worker_pool.max_workers > 0:
+                    self._manager = multiprocessing.get_context("spawn").Manager()
+                    self._updates = self._manager.Queue()
+                else:
+                    self._updates = queue.Queue()
+                self._reader = threading.Thread(target=self._read_updates, daemon=True)
+                self._reader.start()
+            return self._updates
+
+    def _read_updates(self) -> None:
+        while True:
+            try:
+                msg = self._updates.get()
+            except (EOFError, OSError):  # manager shut down
+                return
+            if msg is None:
+                return
+            self._loop.call_soon_threadsafe(self._apply_progress, *msg)
+
+    def _apply_progress(self, job_id: str, stage: str, done: int, total: int) -> None:
+        job = self._jobs.get(job_id)
+        if job is None or job.status != "running":
+            return
+        job.stage, job.done, job.total = stage, done, total
+        job.touch()
+
+    def shutdown(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        if self._updates is not None:
+            try:
+                self._updates.put(None)
+            except Exception:
+                pass
+        if self._manager is not None:
+            self._manager.shutdown()
+            self._manager = None
+
+    # ------------------------------------------------------------------
+    # Jobs
+    # ------------------------------------------------------------------
+
+    def _expire(self) -> None:
+        now = time.monotonic()
+        for job in list(self._jobs.values()):
+            if job.finished_at is not None and now - job.finished_at > self.ttl:
+                del self._jobs[job.id]
+                if self._by_key.get(job.key) == job.id:
+                    del self._by_key[job.key]
+
+    def submit(self, kind: str, params: dict, fingerprint: str) -> tuple[Job, bool]:
+        """Return (job, created). Reuses a live or fresh job with the same key."""
+        self._loop = asyncio.get_running_loop()
+        self._expire()
+        existing = self._jobs.get(self._by_key.get(job_key(kind, params, fingerprint), ""))
+        if existing is not None and existing.status != "failed":
+            self.deduplicated += 1
+            return existing, False
+
+        job = Job(kind, params, fingerprint)
+        self._jobs[job.id] = job
+        self._by_key[job.key] = job.id
+        task = asyncio.create_task(self._run(job))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return job, True
+
+    async def _run(self, job: Job) -> None:
+        updates = await asyncio.to_thread(self._channel)
+        job.status = "running"
+        job.touch()
+        try:
+            job.result = await worker_pool.run(
+                job.kind, _run_job,
+                job_id=job.id, updates=updates, data_dir=self.data_dir,
+                kind=job.kind, params=job.params,
+            )
+            job.status = "done"
+            if job.total:
+                job.done = job.total
+        except asyncio.CancelledError:
+            job.status, job.error = "failed", "cancelled"
+            raise
+        except Exception as e:
+            job.status, job.error = "failed", f"{type(e).__name__}: {e}"
+        finally:
+            job.finished_at = time.monotonic()
+            job.touch()
+
+    def get(self, job_id: str) -> Optional[Job]:
+        self._expire()
+        return self._jobs.get(job_id)
+
+    def stats(self) -> dict:
+        counts: dict[str, int] = {}
+        for job in self._jobs.values():
+            counts[job.status] = counts.get(job.status, 0) + 1
+        return {"jobs": counts, "deduplicated": self.deduplicated, "ttl_seconds": self.ttl}
+
+
+async def job_events(job: Job, keepalive: float = 15.0):
+    """Server-sent events: a "progress" event per change, then "done" or "failed"."""
+    def _event(name: str, data: Any) -> bytes:
+        return f"event: {name}\ndata: {json.dumps(data, default=str)}\n\n".encode("utf-8")
+
+    seen = -1
+    while True:
+        changed = job.changed
+        if job.version != seen:
+            seen = job.version
+            if job.status in ("done", "failed"):
+                yield _event(job.status, job.to_dict(include_result=False))
+                return
+            yield _event("progress", {"status": job.status, **job.progress_dict()})
+        try:
+            await asyncio.wait_for(changed.wait(), timeout=keepalive)
+        except asyncio.TimeoutError:
+            yield b": keepalive\n\n"
+
+
+job_manager = JobManager()
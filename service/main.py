@@ -1,16 +1,28 @@
+import asyncio
 from pathlib import Path
+from typing import Optional
+from pydantic import BaseModel, Field
 from fastapi.responses import PlainTextResponse
 from fastapi import FastAPI, HTTPException, Query
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, StreamingResponse
 from service.routes.waivers import router as waivers_router
-from yahoo_ai_gm.snapshot.store import load_snapshot
+from service.cache import artifact_store, cache_middleware, response_cache, single_flight
+from service.jobs import JOB_OPTIONS, job_events, job_manager
+from service.paging import MAX_LIMIT, list_response
+from service.precompute import precompute_enabled, watch_inputs
+from service.workers import PoolBusy, worker_pool
+from yahoo_ai_gm.snapshot.store import latest_week, load_snapshot
 from yahoo_ai_gm.analysis.category_pressure import pressure_report
 from yahoo_ai_gm.analysis.roster_inefficiency import roster_inefficiency_report
 from yahoo_ai_gm.analysis.waiver_engine import waiver_recommendations
 from yahoo_ai_gm.use_cases.get_trades import get_trade_report
 
 app = FastAPI(title="Yahoo AI GM Service")
+
+# Proposals accepted per POST /trades/whatif
+MAX_WHATIF_TRADES = 200
+app.middleware("http")(cache_middleware)
 app.mount("/static", StaticFiles(directory="service/static"), name="static")
 
 @app.get("/ui", include_in_schema=False)
@@ -20,6 +32,32 @@ def serve_ui():
 app.include_router(waivers_router)
 
 
+_background_tasks: list[asyncio.Task] = []
+
+
+@app.on_event("startup")
+async def _start_background():
+    await asyncio.to_thread(worker_pool.start)
+    if precompute_enabled():
+        _background_tasks.append(asyncio.create_task(watch_inputs(app)))
+
+
+@app.on_event("shutdown")
+async def _stop_background():
+    for task in _background_tasks:
+        task.cancel()
+    job_manager.shutdown()
+    worker_pool.shutdown()
+
+
+async def _run_heavy(endpoint: str, fn, **kwargs):
+    """Run a CPU-heavy use case in the worker pool (see service/workers.py)."""
+    try:
+        return await worker_pool.run(endpoint, fn, **kwargs)
+    except PoolBusy as e:
+        raise HTTPException(status_code=503, detail=f"Busy, retry shortly ({e})")
+
+
 def _get_snapshot_or_404(week: int):
     try:
         return load_snapshot(week)
@@ -28,18 +66,10 @@ def _get_snapshot_or_404(week: int):
 
 
 def _latest_week() -> int:
-    snapshots_dir = Path("data/snapshots")
-    if not snapshots_dir.exists():
-        raise HTTPException(status_code=404, detail="No snapshots directory found.")
-    weeks = []
-    for f in snapshots_dir.glob("week_*.snapshot.json"):
-        try:
-            weeks.append(int(f.name.split("_")[1].split(".")[0]))
-        except (IndexError, ValueError):
-            continue
-    if not weeks:
+    week = latest_week()
+    if week is None:
         raise HTTPException(status_code=404, detail="No snapshot files found in data/snapshots/.")
-    return max(weeks)
+    return week
 
 
 @app.get("/health")
@@ -47,6 +77,20 @@ def health():
     return {"ok": True}
 
 
+@app.get("/workers")
+def get_workers():
+    return {**worker_pool.stats(), "jobs": job_manager.stats()}
+
+
+@app.get("/cache/stats")
+def get_cache_stats():
+    return {
+        "responses": response_cache.stats(),
+        "single_flight": single_flight.stats(),
+        "artifacts": artifact_store.stats(),
+    }
+
+
 @app.get("/analysis/{week}/pressure")
 def get_pressure(week: int):
     snap = _get_snapshot_or_404(week)
@@ -66,10 +110,18 @@ def get_waivers_by_week(week: int):
 
 
 @app.get("/snapshot")
-def get_snapshot(week: int = Query(None)):
+def get_snapshot(
+    week: int = Query(None),
+    cursor: str = Query(None),
+    limit: int = Query(None, ge=1, le=MAX_LIMIT),
+    fields: str = Query(None),
+):
     w = week if week is not None else _latest_week()
     snap = _get_snapshot_or_404(w)
-    return snap.model_dump()
+    return list_response(
+        snap.model_dump(mode="json"), ("roster", "players"),
+        cursor=cursor, limit=limit, fields=fields,
+    )
 
 
 @app.get("/pressure")
@@ -101,15 +153,94 @@ def get_report():
     return p.read_text(encoding="utf-8")
 
 
+@app.get("/dashboard")
+async def get_dashboard(
+    week: int = Query(None),
+    sections: str = Query(None, description="Comma-separated section names (default: all)"),
+    n_teams: int = Query(default=10, ge=2, le=20),
+):
+    from yahoo_ai_gm.use_cases.get_dashboard import SECTIONS, get_dashboard_report
+    names = [s.strip() for s in (sections or "").split(",") if s.strip()]
+    unknown = [s for s in names if s not in SECTIONS]
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown sections: {', '.join(unknown)}. Available: {', '.join(SECTIONS)}",
+        )
+    data_dir = Path("data")
+    try:
+        report = await _run_heavy(
+            "dashboard", get_dashboard_report,
+            data_dir=data_dir, week=week, sections=names or None, n_teams=n_teams,
+        )
+    except (FileNotFoundError, ValueError) as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    return {
+        "generated_at": report.generated_at.isoformat(),
+        "week": report.week,
+        "sections": report.sections,
+        "errors": report.errors,
+        "timings_ms": report.timings_ms,
+        "total_ms": report.total_ms,
+    }
+
+
+@app.post("/jobs", status_code=202)
+async def create_job(
+    kind: str = Query(..., description="A /dashboard section, e.g. trades_multi"),
+    week: int = Query(None),
+    n_teams: int = Query(default=10, ge=2, le=20),
+    n: int = Query(default=None, ge=1, le=20, description="Suggestions (trades_multi, trades_acceptance)"),
+    sims: int = Query(default=None, ge=0, le=5000, description="Simulated seasons (standings)"),
+):
+    from yahoo_ai_gm.use_cases.get_dashboard import SECTIONS
+    if kind not in SECTIONS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown job kind: {kind}. Available: {', '.join(SECTIONS)}",
+        )
+    params = {"week": week, "n_teams": n_teams}
+    for name, value in (("n", n), ("sims", sims)):
+        if value is None:
+            continue
+        if name not in JOB_OPTIONS.get(kind, {}):
+            raise HTTPException(status_code=400, detail=f"{kind} does not take {name}")
+        params[name] = value
+    job, created = job_manager.submit(kind, params, response_cache.fingerprint())
+    return {**job.to_dict(include_result=False), "deduplicated": not created}
+
+
+@app.get("/jobs/{job_id}")
+def get_job(job_id: str):
+    job = job_manager.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"No such job (or expired): {job_id}")
+    return job.to_dict()
+
+
+@app.get("/jobs/{job_id}/events")
+def get_job_events(job_id: str):
+    job = job_manager.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"No such job (or expired): {job_id}")
+    return StreamingResponse(
+        job_events(job),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @app.get("/trades")
-def get_trades(
+async def get_trades(
     n: int = Query(default=10, ge=1, le=50, description="Number of suggestions"),
     n_teams: int = Query(default=12, ge=2, le=20, description="League size"),
     max_adp: float = Query(default=300.0, description="Max ADP for receive candidates"),
 ):
     data_dir = Path("data")
     try:
-        report = get_trade_report(
+        report = await _run_heavy(
+            "trades",
+            get_trade_report,
             data_dir=data_dir,
             n_suggestions=n,
             n_teams=n_teams,
@@ -131,11 +262,18 @@ def get_trades(
 
 
 @app.get("/matchup")
-def get_matchup(week: int = Query(None)):
+async def get_matchup(
+    week: int = Query(None),
+    sims: int = Query(default=0, ge=0, le=20000, description="Simulated weeks (0 = off)"),
+    correlated: bool = Query(default=True, description="Draw categories jointly"),
+):
     from yahoo_ai_gm.use_cases.get_matchup import get_matchup_report
     data_dir = Path("data")
     try:
-        report = get_matchup_report(data_dir=data_dir, week=week)
+        report = await _run_heavy(
+            "matchup", get_matchup_report,
+            data_dir=data_dir, week=week, n_sims=sims, correlated=correlated,
+        )
     except (FileNotFoundError, ValueError) as e:
         raise HTTPException(status_code=503, detail=str(e))
     return {
@@ -145,15 +283,39 @@ def get_matchup(week: int = Query(None)):
     }
 
 
+@app.get("/matchup/live")
+def get_live_matchup(
+    week: int = Query(None),
+    remaining_days: float = Query(default=None, ge=0.0, description="Override days left in the week (clamped to the week length)"),
+):
+    from yahoo_ai_gm.use_cases.get_live_matchup import get_live_matchup_report
+    data_dir = Path("data")
+    try:
+        report = get_live_matchup_report(data_dir=data_dir, week=week, remaining_days=remaining_days)
+    except (FileNotFoundError, ValueError) as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    return {
+        "generated_at": report.generated_at.isoformat(),
+        "as_of": report.as_of,
+        "matchup_status": report.matchup_status,
+        "my_team": report.my_team,
+        "opp_team": report.opp_team,
+        **report.projection,
+    }
+
+
 @app.get("/trades/multi")
-def get_multi_trades(
+async def get_multi_trades(
     n: int = Query(default=10, ge=1, le=20, description="Suggestions per trade size"),
     n_teams: int = Query(default=10, ge=2, le=20, description="League size"),
 ):
     from yahoo_ai_gm.use_cases.get_multi_trades import get_multi_trade_report
     data_dir = Path("data")
     try:
-        report = get_multi_trade_report(data_dir=data_dir, n_suggestions=n, n_teams=n_teams)
+        report = await _run_heavy(
+            "trades_multi", get_multi_trade_report,
+            data_dir=data_dir, n_suggestions=n, n_teams=n_teams,
+        )
     except (FileNotFoundError, ValueError) as e:
         raise HTTPException(status_code=503, detail=str(e))
     return {
@@ -164,7 +326,7 @@ def get_multi_trades(
 
 
 @app.get("/adddrop")
-def get_adddrop(
+async def get_adddrop(
     week: int = Query(None),
     max_moves: int = Query(default=6, ge=1, le=10),
     n_teams: int = Query(default=10, ge=2, le=20),
@@ -172,7 +334,9 @@ def get_adddrop(
     from yahoo_ai_gm.use_cases.get_adddrop import get_adddrop_report
     data_dir = Path("data")
     try:
-        report = get_adddrop_report(
+        report = await _run_heavy(
+            "adddrop",
+            get_adddrop_report,
             data_dir=data_dir,
             week=week,
             max_moves=max_moves,
@@ -238,17 +402,21 @@ def execute_adddrop(
 
 
 @app.get("/standings")
-def get_standings(
+async def get_standings(
     week: int = Query(default=1, ge=1, le=23),
     n_teams: int = Query(default=10, ge=2, le=20),
+    sims: int = Query(default=0, ge=0, le=5000, description="Simulated seasons for playoff odds (0 = off)"),
 ):
     from yahoo_ai_gm.use_cases.get_standings import get_standings_report
     data_dir = Path("data")
     try:
-        report = get_standings_report(
+        report = await _run_heavy(
+            "standings",
+            get_standings_report,
             data_dir=data_dir,
             current_week=week,
             n_teams=n_teams,
+            n_sims=sims,
         )
     except (FileNotFoundError, ValueError) as e:
         raise HTTPException(status_code=503, detail=str(e))
@@ -259,43 +427,35 @@ def get_standings(
 
 
 @app.get("/trade-value")
-def get_trade_value(week: int = Query(default=1, ge=1, le=23)):
-    from yahoo_ai_gm.use_cases.get_trade_value import get_trade_value_report
-    data_dir = Path("data")
-    try:
-        report = get_trade_value_report(data_dir=data_dir, week=week)
-    except (FileNotFoundError, ValueError) as e:
-        raise HTTPException(status_code=503, detail=str(e))
-    return {
-        "generated_at": report.generated_at.isoformat(),
-        "week": report.week,
-        "sell_high": report.sell_high,
-        "cut_bait": report.cut_bait,
-
-        "players": report.players,
-    }
-
-
-@app.get("/trade-value")
-def get_trade_value(week: int = Query(None)):
+def get_trade_value(
+    week: int = Query(default=1, ge=1, le=23),
+    cursor: str = Query(None),
+    limit: int = Query(None, ge=1, le=MAX_LIMIT),
+    fields: str = Query(None),
+):
     from yahoo_ai_gm.use_cases.get_trade_value import get_trade_value_report
     data_dir = Path("data")
     try:
         report = get_trade_value_report(data_dir=data_dir, week=week)
     except (FileNotFoundError, ValueError) as e:
         raise HTTPException(status_code=503, detail=str(e))
-    return {
-        "generated_at": report.generated_at.isoformat(),
-        "week": report.week,
-        "sell_high": report.sell_high,
-        "cut_bait": report.cut_bait,
-        "watch": report.watch,
-        "all_players": report.players,
-    }
+    return list_response(
+        {
+            "generated_at": report.generated_at.isoformat(),
+            "week": report.week,
+            "sell_high": report.sell_high,
+            "cut_bait": report.cut_bait,
+            "watch": report.watch,
+            "players": report.players,
+        },
+        ("players",),
+        cursor=cursor, limit=limit, fields=fields,
+        also_project=(("sell_high",), ("cut_bait",), ("watch",)),
+    )
 
 
 @app.get("/trades/acceptance")
-def get_trade_acceptance(
+async def get_trade_acceptance(
     week: int = Query(None),
     n: int = Query(default=10, ge=1, le=20),
     n_teams: int = Query(default=10, ge=2, le=20),
@@ -303,7 +463,9 @@ def get_trade_acceptance(
     from yahoo_ai_gm.use_cases.get_trade_acceptance import get_trade_acceptance_report
     data_dir = Path("data")
     try:
-        report = get_trade_acceptance_report(
+        report = await _run_heavy(
+            "trades_acceptance",
+            get_trade_acceptance_report,
             data_dir=data_dir,
             week=week,
             n_suggestions=n,
@@ -318,28 +480,81 @@ def get_trade_acceptance(
     }
 
 
-@app.get("/league/construction")
-def get_roster_construction(week: int = Query(None), n_teams: int = Query(default=10)):
-    from yahoo_ai_gm.use_cases.get_league_intelligence import get_league_intelligence_report
+class WhatIfTrade(BaseModel):
+    give: list[str]
+    receive: list[str]
+    team: Optional[str] = None
+
+
+class WhatIfRequest(BaseModel):
+    trades: list[WhatIfTrade] = Field(..., min_length=1, max_length=MAX_WHATIF_TRADES)
+    week: Optional[int] = None
+    n_teams: int = Field(default=10, ge=2, le=20)
+
+
+@app.post("/trades/whatif")
+async def post_trades_whatif(body: WhatIfRequest):
+    """Score a batch of proposed trades (any k-for-m, any opposing team)."""
+    from yahoo_ai_gm.use_cases.get_whatif_trades import get_whatif_report
     data_dir = Path("data")
     try:
-        report = get_league_intelligence_report(data_dir=data_dir, week=week, n_teams=n_teams)
+        report = await _run_heavy(
+            "trades_whatif",
+            get_whatif_report,
+            data_dir=data_dir,
+            proposals=[t.model_dump() for t in body.trades],
+            week=body.week,
+            n_teams=body.n_teams,
+        )
     except (FileNotFoundError, ValueError) as e:
         raise HTTPException(status_code=503, detail=str(e))
     return {
         "generated_at": report.generated_at.isoformat(),
         "week": report.week,
-        "my_construction": report.my_construction,
-        "all_teams": report.construction_scores,
+        "base_cached": report.base_cached,
+        "trades": report.trades,
     }
 
 
+@app.get("/league/construction")
+async def get_roster_construction(
+    week: int = Query(None),
+    n_teams: int = Query(default=10),
+    cursor: str = Query(None),
+    limit: int = Query(None, ge=1, le=MAX_LIMIT),
+    fields: str = Query(None),
+):
+    from yahoo_ai_gm.use_cases.get_league_intelligence import get_league_intelligence_report
+    data_dir = Path("data")
+    try:
+        report = await _run_heavy(
+            "league_intelligence", get_league_intelligence_report,
+            data_dir=data_dir, week=week, n_teams=n_teams,
+        )
+    except (FileNotFoundError, ValueError) as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    return list_response(
+        {
+            "generated_at": report.generated_at.isoformat(),
+            "week": report.week,
+            "my_construction": report.my_construction,
+            "all_teams": report.construction_scores,
+        },
+        ("all_teams",),
+        cursor=cursor, limit=limit, fields=fields,
+        also_project=(("my_construction",),),
+    )
+
+
 @app.get("/league/opponents")
-def get_opponent_profiles(week: int = Query(None), n_teams: int = Query(default=10)):
+async def get_opponent_profiles(week: int = Query(None), n_teams: int = Query(default=10)):
     from yahoo_ai_gm.use_cases.get_league_intelligence import get_league_intelligence_report
     data_dir = Path("data")
     try:
-        report = get_league_intelligence_report(data_dir=data_dir, week=week, n_teams=n_teams)
+        report = await _run_heavy(
+            "league_intelligence", get_league_intelligence_report,
+            data_dir=data_dir, week=week, n_teams=n_teams,
+        )
     except (FileNotFoundError, ValueError) as e:
         raise HTTPException(status_code=503, detail=str(e))
     return {
@@ -0,0 +1,163 @@
+"""
+service/paging.py
+
+Pagination, field projection and streamed JSON for the list-heavy endpoints
+(/trade-value, /league/construction, /snapshot).
+
+  ?limit=N&cursor=C   one page of the endpoint's main list; the response
+                      carries "total" and "next_cursor" (null on the last page)
+  ?fields=a,b,c       keep only these keys on each list item
+
+Without limit/cursor/fields the payload is the same as before. Responses are
+written by StreamingJSONResponse: the envelope is encoded once and the list is
+emitted CHUNK_ITEMS items at a time, so the full document never exists as one
+string. The cache middleware (service/cache.py) forwards these chunks as they
+are produced rather than buffering the body. Once the last chunk is out the
+response sets STREAM_COMPLETE in the request scope; the middleware only
+caches streamed bodies that carry it, so a stream cut short is never stored.
+
+orjson is used when installed (pip install -e .[service]), otherwise the
+stdlib encoder with compact separators.
+"""
+from __future__ import annotations
+
+import json
+from typing import Any, AsyncIterator, Iterator, Optional, Sequence
+
+from fastapi import HTTPException
+from fastapi.responses import StreamingResponse
+
+try:
+    import orjson
+except ImportError:  # optional speedup
+    orjson = None
+
+
+CHUNK_ITEMS = 64
+MAX_LIMIT = 500
+
+_PLACEHOLDER = "__gm_stream_items__"
+
+# Request scope key set by StreamingJSONResponse after its final chunk
+STREAM_COMPLETE = "gm.stream_complete"
+
+
+def dumps(obj: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, default=str, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def parse_fields(fields: Optional[str]) -> Optional[tuple[str, ...]]:
+    if not fields:
+        return None
+    keys = tuple(f.strip() for f in fields.split(",") if f.strip())
+    return keys or None
+
+
+def project(item: dict, fields: Optional[Sequence[str]]) -> dict:
+    if fields is None or not isinstance(item, dict):
+        return item
+    return {k: item[k] for k in fields if k in item}
+
+
+def paginate(items: list, cursor: Optional[str], limit: Optional[int]) -> tuple[list, dict]:
+    """
+    Slice items by an opaque cursor (the offset of the next item) and limit.
+    Returns (page, paging keys to merge into the response). No paging keys
+    when neither cursor nor limit was given.
+    """
+    if cursor is None and limit is None:
+        return items, {}
+    try:
+        start = int(cursor) if cursor is not None else 0
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"Invalid cursor: {cursor!r}")
+    if start < 0:
+        raise HTTPException(status_code=400, detail=f"Invalid cursor: {cursor!r}")
+    stop = len(items) if limit is None else min(len(items), start + limit)
+    return items[start:stop], {
+        "total": len(items),
+        "next_cursor": str(stop) if stop < len(items) else None,
+    }
+
+
+def _set_path(doc: dict, path: Sequence[str], value: Any) -> dict:
+    """Shallow-copy doc along path with the leaf replaced by value."""
+    out = dict(doc)
+    if len(path) == 1:
+        out[path[0]] = value
+    else:
+        out[path[0]] = _set_path(doc.get(path[0]) or {}, path[1:], value)
+    return out
+
+
+def _get_path(doc: dict, path: Sequence[str]) -> Any:
+    node: Any = doc
+    for key in path:
+        node = node.get(key) if isinstance(node, dict) else None
+    return node
+
+
+def _stream(doc: dict, path: Sequence[str]) -> Iterator[bytes]:
+    items = _get_path(doc, path) or []
+    head, sep, tail = dumps(_set_path(doc, path, _PLACEHOLDER)).partition(
+        dumps(_PLACEHOLDER)
+    )
+    if not sep:  # list key absent; nothing to splice
+        yield head
+        return
+    yield head + b"["
+    for i in range(0, len(items), CHUNK_ITEMS):
+        chunk = b",".join(dumps(it) for it in items[i:i + CHUNK_ITEMS])
+        yield (b"," + chunk) if i else chunk
+    yield b"]" + tail
+
+
+class StreamingJSONResponse(StreamingResponse):
+    """JSON document whose list at `path` (a key path) is encoded incrementally."""
+
+    def __init__(self, content: dict, path: Sequence[str], status_code: int = 200, headers=None):
+        super().__init__(
+            _stream(content, tuple(path)),
+            status_code=status_code,
+            media_type="application/json",
+            headers=headers,
+        )
+
+    async def __call__(self, scope, receive, send) -> None:
+        self.body_iterator = _mark_complete(self.body_iterator, scope)
+        await super().__call__(scope, receive, send)
+
+
+async def _mark_complete(chunks, scope) -> AsyncIterator[bytes]:
+    async for chunk in chunks:
+        yield chunk
+    scope[STREAM_COMPLETE] = True
+
+
+def list_response(
+    doc: dict,
+    path: Sequence[str],
+    cursor: Optional[str] = None,
+    limit: Optional[int] = None,
+    fields: Optional[str] = None,
+    also_project: Sequence[Sequence[str]] = (),
+) -> StreamingJSONResponse:
+    """
+    Apply cursor/limit to the list at `path`, project `fields` onto its items
+    (and onto the lists/objects at `also_project`), and stream the result.
+    """
+    keys = parse_fields(fields)
+    items, paging = paginate(_get_path(doc, path) or [], cursor, limit)
+    if keys is not None:
+        items = [project(it, keys) for it in items]
+        for extra in also_project:
+            node = _get_path(doc, extra)
+            if isinstance(node, list):
+                doc = _set_path(doc, extra, [project(it, keys) for it in node])
+            elif isinstance(node, dict) and node:
+                doc = _set_path(doc, extra, project(node, keys))
+    doc = _set_path(doc, path, items)
+    doc.update(paging)
+    return StreamingJSONResponse(doc, path)
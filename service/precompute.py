@@ -0,0 +1,162 @@
+"""
+service/precompute.py
+
+Precompute-on-refresh.
+
+The systemd timers rewrite JSON in data/ a few times a day, but reports were
+only computed when someone asked, so the first dashboard visit after each
+refresh paid for every endpoint. A background task in the service process
+polls the input fingerprint (service/cache.py) and, once the inputs have
+settled, renders every dashboard payload through the app itself (same
+handlers, same worker pool) into a new ArtifactStore generation, which is
+then published with one reference swap and persisted to
+data/artifacts/payloads.json.
+
+A generation whose inputs changed while it was being built is thrown away
+and rebuilt on the next poll.
+
+Env:
+  YAHOO_GM_PRECOMPUTE=0        disable the watcher
+  YAHOO_GM_PRECOMPUTE_POLL=10  seconds between fingerprint polls
+"""
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+from datetime import datetime, timezone
+
+from service.cache import (
+    DATA_DIR,
+    PRECOMPUTE_HEADER,
+    artifact_store,
+    input_fingerprint,
+)
+
+
+# Endpoint payloads rendered per generation (default params + the dashboard's variants)
+PRECOMPUTE_PATHS = (
+    "/dashboard?sections=standings,matchup,snapshot",
+    "/snapshot",
+    "/snapshot?fields=name",
+    "/snapshot?fields=name,status",
+    "/pressure",
+    "/inefficiency",
+    "/waivers",
+    "/report",
+    "/matchup",
+    "/matchup/live",
+    "/ratio-risk",
+    "/standings",
+    "/trade-value",
+    "/trade-value?fields=name,type,week_acquired,signal,value_score,primary_change",
+    "/trades",
+    "/trades/multi",
+    "/trades/acceptance",
+    "/trades/acceptance?n=10",
+    "/adddrop",
+    "/league/construction",
+    "/league/construction?fields=team,grade,score,strengths,weaknesses,black_holes",
+    "/league/opponents",
+    "/streaming-sp",
+)
+
+POLL_SECONDS = float(os.environ.get("YAHOO_GM_PRECOMPUTE_POLL", "10"))
+
+
+async def _render(app, path_qs: str) -> tuple[int, bytes, str]:
+    """Run one GET through the full ASGI app in-process; returns (status, body, media type)."""
+    path, _, qs = path_qs.partition("?")
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": qs.encode(),
+        "headers": [(PRECOMPUTE_HEADER.encode(), b"1")],
+        "client": ("127.0.0.1", 0),
+        "server": ("127.0.0.1", 80),
+    }
+    status = 500
+    media_type = "application/json"
+    chunks: list[bytes] = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        nonlocal status, media_type
+        if message["type"] == "http.response.start":
+            status = message["status"]
+            for k, v in message.get("headers", []):
+                if k.lower() == b"content-type":
+                    media_type = v.decode()
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+
+    await app(scope, receive, send)
+    return status, b"".join(chunks), media_type
+
+
+def _resource(path_qs: str) -> str:
+    """Same normalization as ResponseCache.resource (sorted params)."""
+    path, _, qs = path_qs.partition("?")
+    params = sorted(tuple(p.split("=", 1)) for p in qs.split("&") if p)
+    return f"{path}?" + "&".join(f"{k}={v}" for k, v in params)
+
+
+async def build_generation(app, fingerprint: str) -> bool:
+    """Render every payload; publish only if the inputs did not move meanwhile."""
+    t0 = time.monotonic()
+    payloads: dict[str, tuple[bytes, str]] = {}
+    errors: list[str] = []
+    for path_qs in PRECOMPUTE_PATHS:
+        try:
+            status, body, media_type = await _render(app, path_qs)
+        except Exception as e:  # one broken report must not block the rest
+            errors.append(f"{path_qs}: {type(e).__name__}: {e}")
+            continue
+        if status == 200:
+            payloads[_resource(path_qs)] = (body, media_type)
+        else:
+            errors.append(f"{path_qs}: HTTP {status}")
+
+    if await asyncio.to_thread(input_fingerprint, DATA_DIR) != fingerprint:
+        return False
+    await asyncio.to_thread(
+        artifact_store.publish,
+        fingerprint,
+        payloads,
+        datetime.now(tz=timezone.utc).isoformat(),
+        time.monotonic() - t0,
+        errors,
+    )
+    return True
+
+
+async def watch_inputs(app, poll_seconds: float = POLL_SECONDS) -> None:
+    """
+    Poll the input fingerprint forever. A new generation is built once the
+    fingerprint has stayed the same for one full poll (the timers are done
+    writing) and differs from the published generation.
+    """
+    last_seen = await asyncio.to_thread(input_fingerprint, DATA_DIR)
+    await asyncio.to_thread(artifact_store.load, last_seen)
+
+    while True:
+        current = await asyncio.to_thread(input_fingerprint, DATA_DIR)
+        if current == last_seen and current != artifact_store.fingerprint:
+            try:
+                await build_generation(app, current)
+            except Exception as e:
+                artifact_store.errors = [f"generation failed: {type(e).__name__}: {e}"]
+        last_seen = current
+        await asyncio.sleep(poll_seconds)
+
+
+def precompute_enabled() -> bool:
+    return os.environ.get("YAHOO_GM_PRECOMPUTE", "1").strip() not in ("0", "false", "no")
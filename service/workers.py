@@ -0,0 +1,202 @@
+"""
+service/workers.py
+
+Process pool for the CPU-heavy report endpoints.
+
+The engines (multi-trade, add/drop, standings, trade acceptance, league
+intelligence) are pure-Python loops. Run on uvicorn's thread pool they hold
+the GIL, so one /trades/multi call stalls /health and the dashboard. Heavy
+endpoints instead await their use case in a bounded process pool:
+
+  - the pool is started and pre-warmed (engine modules imported in every
+    worker) on service startup
+  - each endpoint has its own concurrency limit, so one slow report type
+    cannot occupy every worker
+  - requests beyond MAX_QUEUED waiting per endpoint are rejected with 503
+  - a slot is held until the pool finishes the call, even if the request
+    that submitted it is cancelled (client gone), so the limits bound the
+    work actually queued in the executor
+  - running / waiting / completed counts are reported by GET /workers
+
+YAHOO_GM_WORKERS sets the pool size (0 disables the pool; calls then run on
+a thread, as before).
+"""
+from __future__ import annotations
+
+import asyncio
+import functools
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Optional
+
+
+DEFAULT_WORKERS = min(4, os.cpu_count() or 1)
+
+# Max concurrent calls per endpoint; anything not listed gets DEFAULT_LIMIT
+ENDPOINT_LIMITS = {
+    "trades_multi": 1,
+    "adddrop": 1,
+    "standings": 2,
+    "dashboard": 1,
+}
+DEFAULT_LIMIT = 2
+
+# Requests allowed to wait for an endpoint slot before 503
+MAX_QUEUED = 8
+
+WARM_MODULES = (
+    "yahoo_ai_gm.use_cases.context",
+    "yahoo_ai_gm.use_cases.get_dashboard",
+    "yahoo_ai_gm.analysis.trade_engine",
+    "yahoo_ai_gm.analysis.multi_trade_engine",
+    "yahoo_ai_gm.analysis.adddrop_engine",
+    "yahoo_ai_gm.analysis.standings_trajectory",
+    "yahoo_ai_gm.analysis.league_intelligence",
+    "yahoo_ai_gm.analysis.trade_acceptance",
+    "yahoo_ai_gm.analysis.whatif_engine",
+    "yahoo_ai_gm.analysis.matchup_engine",
+)
+
+
+class PoolBusy(Exception):
+    pass
+
+
+def _warm(_: int) -> int:
+    import importlib
+    for name in WARM_MODULES:
+        importlib.import_module(name)
+    return os.getpid()
+
+
+def _invoke(fn: Callable, kwargs: dict) -> Any:
+    return fn(**kwargs)
+
+
+class _EndpointStats:
+    __slots__ = ("limit", "running", "waiting", "completed", "failed", "rejected", "busy_seconds")
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.running = 0
+        self.waiting = 0
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+        self.busy_seconds = 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "limit": self.limit,
+            "running": self.running,
+            "waiting": self.waiting,
+            "completed": self.completed,
+            "failed": self.failed,
+            "rejected": self.rejected,
+            "busy_seconds": round(self.busy_seconds, 2),
+        }
+
+
+class WorkerPool:
+    def __init__(self, max_workers: Optional[int] = None):
+        if max_workers is None:
+            max_workers = int(os.environ.get("YAHOO_GM_WORKERS", DEFAULT_WORKERS))
+        self.max_workers = max(0, max_workers)
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._sems: dict[str, asyncio.Semaphore] = {}
+        self._stats: dict[str, _EndpointStats] = {}
+        self._lock = threading.Lock()
+        self.worker_pids: list[int] = []
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def start(self) -> None:
+        if self.max_workers == 0 or self._executor is not None:
+            return
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+        # One warm-up task per worker forces every process to spawn and
+        # import the engines before the first real request.
+        self.worker_pids = sorted(set(self._executor.map(_warm, range(self.max_workers))))
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    # ------------------------------------------------------------------
+    # Dispatch
+    # ------------------------------------------------------------------
+
+    def _endpoint(self, name: str) -> tuple[asyncio.Semaphore, _EndpointStats]:
+        with self._lock:
+            st = self._stats.get(name)
+            if st is None:
+                st = self._stats[name] = _EndpointStats(ENDPOINT_LIMITS.get(name, DEFAULT_LIMIT))
+                self._sems[name] = asyncio.Semaphore(st.limit)
+            return self._sems[name], st
+
+    async def run(self, endpoint: str, fn: Callable, **kwargs) -> Any:
+        """
+        Run fn(**kwargs) in the pool under endpoint's concurrency limit.
+        fn must be a module-level function; arguments and result must pickle.
+        """
+        sem, st = self._endpoint(endpoint)
+        if st.waiting >= MAX_QUEUED:
+            st.rejected += 1
+            raise PoolBusy(f"{endpoint}: {st.waiting} requests already queued")
+
+        st.waiting += 1
+        try:
+            await sem.acquire()
+        finally:
+            st.waiting -= 1
+
+        st.running += 1
+        t0 = time.monotonic()
+
+        def _finish(fut: asyncio.Future) -> None:
+            # Runs when the work itself ends, so the slot stays taken while it
+            # computes even if the awaiting request was cancelled
+            st.running -= 1
+            st.busy_seconds += time.monotonic() - t0
+            if fut.cancelled() or fut.exception() is not None:
+                st.failed += 1
+            else:
+                st.completed += 1
+            sem.release()
+
+        call = functools.partial(_invoke, fn, kwargs)
+        try:
+            # executor None = the loop's default thread pool
+            fut = asyncio.get_running_loop().run_in_executor(self._executor, call)
+        except BaseException:
+            st.running -= 1
+            st.failed += 1
+            sem.release()
+            raise
+        fut.add_done_callback(_finish)
+        # A cancelled caller stops waiting; the pool future runs on
+        return await asyncio.shield(fut)
+
+    def stats(self) -> dict:
+        with self._lock:
+            endpoints = {k: v.to_dict() for k, v in sorted(self._stats.items())}
+        return {
+            "workers": self.max_workers,
+            "started": self._executor is not None,
+            "worker_pids": self.worker_pids,
+            "queue_depth": sum(e["waiting"] for e in endpoints.values()),
+            "running": sum(e["running"] for e in endpoints.values()),
+            "endpoints": endpoints,
+        }
+
+
+worker_pool = WorkerPool()
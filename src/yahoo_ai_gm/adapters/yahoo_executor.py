@@ -108,7 +108,7 @@ def execute_adddrop_plan(
     league_key: str,
     my_team_key: str,
     dry_run: bool = True,
-    delay_seconds: float = 2.0,
+    delay_seconds: float = 0.0,
 ) -> list[TransactionResult]:
     """
     Execute or dry-run an ordered list of add/drop moves.
@@ -118,7 +118,8 @@ def execute_adddrop_plan(
         league_key: e.g. "469.l.40206"
         my_team_key: e.g. "469.l.40206.t.6"
         dry_run: if True, log but never POST to Yahoo API
-        delay_seconds: seconds between transactions (avoid rate limiting)
+        delay_seconds: extra pause between transactions; throttling and
+            retries are already handled by YahooClient
 
     Returns:
         list of TransactionResult
@@ -129,6 +130,7 @@ def execute_adddrop_plan(
         dry_run = True  # Force dry run regardless of parameter
 
     results = []
+    client = None  # created on the first live move, shared by the rest
 
     for move in moves:
         move_num   = move.get("move_number", 0)
@@ -172,8 +174,9 @@ def execute_adddrop_plan(
 
         # Live execution
         try:
-            from yahoo_ai_gm.yahoo_client import YahooClient
-            client = YahooClient.from_local_config()
+            if client is None:
+                from yahoo_ai_gm.yahoo_client import YahooClient
+                client = YahooClient.from_local_config()
             path = f"league/{league_key}/transactions"
             response_xml = client.post(path, body=xml_body)
 
@@ -228,6 +228,9 @@ def simulate_adddrop(
     fg_pit_data: dict,
     max_moves: int = 6,
     n_teams: int = 10,
+    all_projections: Optional[list[PlayerProjection]] = None,
+    fg_lookup: Optional[dict[str, PlayerProjection]] = None,
+    league_averages: Optional[dict[str, tuple[float, float]]] = None,
 ) -> AddDropPlan:
     """
     Simulate optimal add/drop sequence up to max_moves.
@@ -239,9 +242,13 @@ def simulate_adddrop(
         fg_bat_data / fg_pit_data: loaded FG projection dicts
         max_moves: max weekly adds allowed
         n_teams: league size
+        all_projections / fg_lookup / league_averages: precomputed shared
+            state (use_cases.context); built from the FG data when omitted
     """
-    all_projections = load_projections_from_fg(fg_bat_data, fg_pit_data)
-    fg_lookup = build_fg_lookup(all_projections)
+    if all_projections is None:
+        all_projections = load_projections_from_fg(fg_bat_data, fg_pit_data)
+    if fg_lookup is None:
+        fg_lookup = build_fg_lookup(all_projections)
 
     # Match my roster and opponent
     my_matches = match_roster_to_fg(my_roster, fg_lookup)
@@ -264,7 +271,8 @@ def simulate_adddrop(
         for p in pool_players
     }
 
-    league_averages = compute_league_averages(all_projections, n_teams=n_teams)
+    if league_averages is None:
+        league_averages = compute_league_averages(all_projections, n_teams=n_teams)
 
     # Track mutable state
     current_roster = list(my_roster)
@@ -0,0 +1,331 @@
+"""
+src/yahoo_ai_gm/analysis/category_simulation.py
+
+Layer 2 — Pure Analysis. No FastAPI, no I/O, no Yahoo client.
+
+Correlation-aware category simulation.
+
+The matchup and standings engines judge each of the 11 categories on its own,
+but R/RBI/HR move together and so do ERA/WHIP, so a team that is close in R
+is usually close in RBI too. Counting toss-ups independently overstates how
+often the categories split. This module simulates weekly category outcomes
+jointly:
+
+1. Estimate the category correlation matrix once from the projection
+   population (many synthetic rosters drawn from the top-ADP pool, the same
+   pool compute_league_averages uses). Cached per projection version.
+2. Factor it once (Cholesky, L L^T = R).
+3. Draw a batch of standard normals z and map them to correlated draws
+   y = L z. Category c is won when its standardized projected margin plus
+   the correlated noise term is positive.
+
+Independent simulation uses the identity factor through the same code path,
+so correlated sampling costs the same order of work.
+"""
+from __future__ import annotations
+
+import math
+import random
+import threading
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+from yahoo_ai_gm.analysis.trade_engine import (
+    PlayerProjection,
+    TeamProjection,
+    build_team_projection,
+    SCORING_CATS,
+    LOWER_IS_BETTER,
+)
+
+
+SIM_CATS = SCORING_CATS["batting"] + SCORING_CATS["pitching"]
+
+DEFAULT_SIMS = 2000
+DEFAULT_SEED = 0
+
+# Seasons between progress callbacks in simulate_playoff_odds
+PROGRESS_EVERY = 50
+
+# Synthetic rosters used to estimate the correlation matrix
+CORRELATION_SAMPLES = 400
+
+# Weekly noise per team, in units of the league (between-team) stdev
+WEEKLY_NOISE = 1.0
+
+_CORR_CACHE: dict[tuple, list[list[float]]] = {}
+_CORR_LOCK = threading.Lock()
+
+
+# ---------------------------------------------------------------------------
+# Data structures
+# ---------------------------------------------------------------------------
+
+@dataclass
+class SimulatedMatchup:
+    n_sims: int
+    correlated: bool
+    cat_win_probs: dict[str, float]
+    expected_cat_wins: float
+    win_prob: float
+    tie_prob: float
+    loss_prob: float
+    record_distribution: list[float]    # [P(0 cat wins), ..., P(11 cat wins)]
+
+
+# ---------------------------------------------------------------------------
+# Correlation estimate
+# ---------------------------------------------------------------------------
+
+def estimate_category_correlation(
+    all_projections: list[PlayerProjection],
+    n_teams: int = 12,
+    roster_size: int = 23,
+    n_samples: int = CORRELATION_SAMPLES,
+    seed: int = DEFAULT_SEED,
+) -> list[list[float]]:
+    """
+    Correlation of team-level category values across synthetic rosters drawn
+    from the rostered (top-ADP) population.
+    """
+    rostered_count = n_teams * roster_size
+    batters = sorted(
+        [p for p in all_projections if p.player_type == "batter"], key=lambda p: p.adp
+    )[:rostered_count // 2]
+    pitchers = sorted(
+        [p for p in all_projections if p.player_type == "pitcher"], key=lambda p: p.adp
+    )[:rostered_count // 2]
+    team_size_bat = max(1, len(batters) // n_teams)
+    team_size_pit = max(1, len(pitchers) // n_teams)
+
+    n = len(SIM_CATS)
+    if len(batters) < team_size_bat or len(pitchers) < team_size_pit or n_samples < 2:
+        return identity(n)
+
+    rng = random.Random(seed)
+    rows = []
+    for _ in range(n_samples):
+        tp = build_team_projection(
+            rng.sample(batters, team_size_bat) + rng.sample(pitchers, team_size_pit)
+        )
+        rows.append([tp.cat_value(c) for c in SIM_CATS])
+
+    means = [sum(r[i] for r in rows) / len(rows) for i in range(n)]
+    centered = [[r[i] - means[i] for i in range(n)] for r in rows]
+    cov = [
+        [sum(r[i] * r[j] for r in centered) / (len(rows) - 1) for j in range(n)]
+        for i in range(n)
+    ]
+    sd = [math.sqrt(cov[i][i]) for i in range(n)]
+    return [
+        [
+            1.0 if i == j else (cov[i][j] / (sd[i] * sd[j]) if sd[i] > 0 and sd[j] > 0 else 0.0)
+            for j in range(n)
+        ]
+        for i in range(n)
+    ]
+
+
+def category_correlation(
+    all_projections: list[PlayerProjection],
+    version: str,
+    n_teams: int = 12,
+) -> list[list[float]]:
+    """estimate_category_correlation, cached per (projection version, league size)."""
+    key = (version, n_teams)
+    with _CORR_LOCK:
+        corr = _CORR_CACHE.get(key)
+    if corr is None:
+        corr = estimate_category_correlation(all_projections, n_teams=n_teams)
+        with _CORR_LOCK:
+            _CORR_CACHE[key] = corr
+    return corr
+
+
+# ---------------------------------------------------------------------------
+# Linear algebra (11 x 11, plain lists)
+# ---------------------------------------------------------------------------
+
+def identity(n: int) -> list[list[float]]:
+    return [[1.0 if i == j else 0.0 for j in range(n)] for i in range(n)]
+
+
+def cholesky(matrix: list[list[float]], jitter: float = 1e-9) -> list[list[float]]:
+    """Lower-triangular L with L L^T = matrix. Adds diagonal jitter if not quite PD."""
+    n = len(matrix)
+    for attempt in range(6):
+        L = [[0.0] * n for _ in range(n)]
+        ok = True
+        for i in range(n):
+            for j in range(i + 1):
+                s = matrix[i][j] - sum(L[i][k] * L[j][k] for k in range(j))
+                if i == j:
+                    s += jitter * (10 ** attempt) if attempt else 0.0
+                    if s <= 0:
+                        ok = False
+                        break
+                    L[i][i] = math.sqrt(s)
+                else:
+                    L[i][j] = s / L[j][j]
+            if not ok:
+                break
+        if ok:
+            return L
+    return identity(n)
+
+
+def correlated_normals(L: list[list[float]], n_draws: int, rng: random.Random) -> list[list[float]]:
+    """Batch of n_draws vectors y = L z with z ~ N(0, I)."""
+    n = len(L)
+    rows = [[(k, v) for k, v in enumerate(L[i][:i + 1]) if v != 0.0] for i in range(n)]
+    gauss = rng.gauss
+    out = []
+    for _ in range(n_draws):
+        z = [gauss(0.0, 1.0) for _ in range(n)]
+        out.append([sum(v * z[k] for k, v in row) for row in rows])
+    return out
+
+
+# ---------------------------------------------------------------------------
+# Matchup simulation
+# ---------------------------------------------------------------------------
+
+def standardized_margins(
+    team_a: TeamProjection,
+    team_b: TeamProjection,
+    league_averages: dict[str, tuple[float, float]],
+) -> list[float]:
+    """
+    Team A's projected margin per category, oriented so positive = A wins and
+    scaled by the stdev of the weekly difference (sqrt(2) * noise * stdev).
+    """
+    out = []
+    for cat in SIM_CATS:
+        _, stdev = league_averages.get(cat, (0.0, 1.0))
+        delta = team_a.cat_value(cat) - team_b.cat_value(cat)
+        if cat in LOWER_IS_BETTER:
+            delta = -delta
+        scale = math.sqrt(2.0) * WEEKLY_NOISE * (stdev or 1.0)
+        out.append(delta / scale)
+    return out
+
+
+def orientation() -> list[float]:
+    """+1 / -1 per category so noise is applied to the oriented margin."""
+    return [-1.0 if c in LOWER_IS_BETTER else 1.0 for c in SIM_CATS]
+
+
+def simulate_matchup(
+    team_a: TeamProjection,
+    team_b: TeamProjection,
+    league_averages: dict[str, tuple[float, float]],
+    correlation: Optional[list[list[float]]] = None,
+    n_sims: int = DEFAULT_SIMS,
+    seed: int = DEFAULT_SEED,
+) -> SimulatedMatchup:
+    """
+    Simulate one week between two teams. correlation=None simulates the
+    categories independently.
+    """
+    n = len(SIM_CATS)
+    L = cholesky(correlation) if correlation is not None else identity(n)
+    margins = standardized_margins(team_a, team_b, league_averages)
+    signs = orientation()
+    rng = random.Random(seed)
+
+    cat_wins = [0] * n
+    record = [0] * (n + 1)
+    for y in correlated_normals(L, n_sims, rng):
+        w = 0
+        for c in range(n):
+            if margins[c] + signs[c] * y[c] > 0:
+                cat_wins[c] += 1
+                w += 1
+        record[w] += 1
+
+    dist = [r / n_sims for r in record] if n_sims else [0.0] * (n + 1)
+    win = sum(q for k, q in enumerate(dist) if 2 * k > n)
+    tie = sum(q for k, q in enumerate(dist) if 2 * k == n)
+    return SimulatedMatchup(
+        n_sims=n_sims,
+        correlated=correlation is not None,
+        cat_win_probs={c: round(cat_wins[i] / n_sims, 4) if n_sims else 0.0 for i, c in enumerate(SIM_CATS)},
+        expected_cat_wins=round(sum(k * q for k, q in enumerate(dist)), 3),
+        win_prob=round(win, 4),
+        tie_prob=round(tie, 4),
+        loss_prob=round(max(0.0, 1.0 - win - tie), 4),
+        record_distribution=[round(q, 4) for q in dist],
+    )
+
+
+def simulated_matchup_to_dict(sm: SimulatedMatchup) -> dict:
+    return {
+        "n_sims": sm.n_sims,
+        "correlated": sm.correlated,
+        "win_prob": sm.win_prob,
+        "tie_prob": sm.tie_prob,
+        "loss_prob": sm.loss_prob,
+        "expected_cat_wins": sm.expected_cat_wins,
+        "cat_win_probs": sm.cat_win_probs,
+        "record_distribution": sm.record_distribution,
+    }
+
+
+# ---------------------------------------------------------------------------
+# Season simulation (playoff odds)
+# ---------------------------------------------------------------------------
+
+def simulate_playoff_odds(
+    margins_by_pair: dict[tuple[int, int], list[float]],
+    weekly_pairs: list[list[tuple[int, int]]],
+    base_wins: list[int],
+    base_losses: list[int],
+    playoff_teams: int,
+    correlation: Optional[list[list[float]]] = None,
+    n_sims: int = 500,
+    seed: int = DEFAULT_SEED,
+    progress: Optional[Callable[[str, int, int], None]] = None,
+) -> list[float]:
+    """
+    Fraction of simulated seasons in which each team finishes in the top
+    playoff_teams by category wins (losses break ties).
+
+    Args:
+        margins_by_pair: (a, b) -> standardized_margins(team a, team b)
+        weekly_pairs: remaining weeks, each a list of (a, b) index pairs
+        base_wins / base_losses: already-banked category record per team
+        progress: optional progress("seasons", done, n_sims) callback
+    """
+    n = len(SIM_CATS)
+    n_idx = len(base_wins)
+    L = cholesky(correlation) if correlation is not None else identity(n)
+    signs = orientation()
+    rng = random.Random(seed)
+    n_games = sum(len(p) for p in weekly_pairs)
+    made = [0] * n_idx
+
+    for sim in range(n_sims):
+        if progress is not None and sim % PROGRESS_EVERY == 0:
+            progress("seasons", sim, n_sims)
+        wins = list(base_wins)
+        losses = list(base_losses)
+        draws = correlated_normals(L, n_games, rng)
+        g = 0
+        for pairs in weekly_pairs:
+            for a, b in pairs:
+                m = margins_by_pair[(a, b)]
+                y = draws[g]
+                g += 1
+                w = 0
+                for c in range(n):
+                    if m[c] + signs[c] * y[c] > 0:
+                        w += 1
+                wins[a] += w
+                losses[b] += w
+                wins[b] += n - w
+                losses[a] += n - w
+        order = sorted(range(n_idx), key=lambda i: (-wins[i], losses[i], rng.random()))
+        for i in order[:playoff_teams]:
+            made[i] += 1
+
+    return [m / n_sims if n_sims else 0.0 for m in made]
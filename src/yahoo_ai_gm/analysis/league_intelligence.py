@@ -17,6 +17,7 @@ from __future__ import annotations
 
 import math
 from dataclasses import dataclass, field
+from typing import Optional
 
 from yahoo_ai_gm.analysis.trade_engine import (
     PlayerProjection,
@@ -178,17 +179,28 @@ def compute_league_intelligence(
     fg_pit_data: dict,
     rank_map: dict[str, int],
     n_teams: int = 10,
+    all_projections: Optional[list[PlayerProjection]] = None,
+    fg_lookup: Optional[dict[str, PlayerProjection]] = None,
+    league_averages: Optional[dict[str, tuple[float, float]]] = None,
+    team_projections: Optional[dict[str, TeamProjection]] = None,
 ) -> tuple[list[RosterConstructionScore], list[OpponentProfile]]:
     """
     Compute roster construction scores and opponent profiles for all teams.
 
+    all_projections / fg_lookup / league_averages / team_projections are
+    optional precomputed shared state (use_cases.context); they are built
+    from the FG data when omitted.
+
     Returns:
         (construction_scores sorted by score desc,
          opponent_profiles sorted by rank asc)
     """
-    all_projections = load_projections_from_fg(fg_bat_data, fg_pit_data)
-    fg_lookup = build_fg_lookup(all_projections)
-    league_averages = compute_league_averages(all_projections, n_teams=n_teams)
+    if all_projections is None:
+        all_projections = load_projections_from_fg(fg_bat_data, fg_pit_data)
+    if fg_lookup is None:
+        fg_lookup = build_fg_lookup(all_projections)
+    if league_averages is None:
+        league_averages = compute_league_averages(all_projections, n_teams=n_teams)
 
     construction_scores = []
     opponent_profiles = []
@@ -198,9 +210,12 @@ def compute_league_intelligence(
         tname = team["team_name"]
         rank  = rank_map.get(tkey, 5)
 
-        matches = match_roster_to_fg(team["players"], fg_lookup)
-        projs   = [p for p in matches.values() if p is not None]
-        tproj   = build_team_projection(projs)
+        if team_projections is not None and tkey in team_projections:
+            tproj = team_projections[tkey]
+        else:
+            matches = match_roster_to_fg(team["players"], fg_lookup)
+            projs   = [p for p in matches.values() if p is not None]
+            tproj   = build_team_projection(projs)
 
         cs = compute_construction_score(tkey, tname, tproj, league_averages)
         construction_scores.append(cs)
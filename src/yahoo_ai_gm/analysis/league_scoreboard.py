@@ -0,0 +1,103 @@
+"""
+src/yahoo_ai_gm/analysis/league_scoreboard.py
+
+Layer 2 — Pure Analysis. No FastAPI, no I/O, no Yahoo client.
+
+Compact league-wide scoreboard table (data/league_scoreboard.json, written by
+scripts/pull_scoreboard_week.py from a single league scoreboard response):
+
+  {
+    "league_key": "...",
+    "cats": ["R", "HR", ..., "IP"],          # Yahoo category names, column order
+    "weeks": {
+      "5": {
+        "status": "postevent",
+        "week_start": "2026-04-20", "week_end": "2026-04-26",
+        "teams": [team_key, ...],             # row order
+        "names": [team_name, ...],
+        "totals": [[R, HR, ...], ...],        # team x category, null = no value
+        "matchups": [[a_row, b_row], ...]
+      }
+    }
+  }
+
+Helpers here turn completed weeks into per-category results so the standings
+trajectory can count actual results instead of simulating played weeks.
+"""
+from __future__ import annotations
+
+from typing import Optional
+
+from yahoo_ai_gm.analysis.trade_engine import LOWER_IS_BETTER
+
+
+SCOREBOARD_VERSION = 1
+
+# Yahoo scoreboard category names, in table column order
+SCOREBOARD_CATS = ["R", "HR", "RBI", "SB", "AVG", "W", "K", "SV", "ERA", "WHIP", "IP"]
+
+# Engine (FG) names that differ from Yahoo names
+ENGINE_TO_YAHOO = {"SO": "K"}
+
+FINAL_STATUS = "postevent"
+
+
+def merge_scoreboard_week(table: Optional[dict], league_key: str, week: int, week_table: dict) -> dict:
+    """Return table with week_table stored under week (replacing any earlier pull)."""
+    if not table or table.get("version") != SCOREBOARD_VERSION:
+        table = {"version": SCOREBOARD_VERSION, "league_key": league_key,
+                 "cats": list(SCOREBOARD_CATS), "weeks": {}}
+    table["weeks"][str(week)] = week_table
+    return table
+
+
+def final_weeks(table: Optional[dict]) -> list[int]:
+    if not table:
+        return []
+    return sorted(
+        int(w) for w, wt in (table.get("weeks") or {}).items()
+        if wt.get("status") == FINAL_STATUS
+    )
+
+
+def _compare(cat: str, a: Optional[float], b: Optional[float]) -> str:
+    if a is None or b is None or a == b:
+        return "toss-up"
+    a_better = a < b if cat in LOWER_IS_BETTER else a > b
+    return "win" if a_better else "loss"
+
+
+def week_category_results(
+    table: dict,
+    week: int,
+    cats: list[str],
+) -> list[tuple[str, str, list[str]]]:
+    """
+    Actual per-category results for one week.
+
+    Args:
+        table: league_scoreboard.json contents
+        week: matchup week
+        cats: engine category names, in the order results should be returned
+
+    Returns [(team_a_key, team_b_key, ["win" | "loss" | "toss-up", ...]), ...]
+    from team A's side.
+    """
+    wt = (table.get("weeks") or {}).get(str(week))
+    if not wt:
+        return []
+
+    col = {c: i for i, c in enumerate(table.get("cats") or SCOREBOARD_CATS)}
+    cols = [col.get(ENGINE_TO_YAHOO.get(c, c)) for c in cats]
+    teams = wt.get("teams", [])
+    totals = wt.get("totals", [])
+
+    out = []
+    for a, b in wt.get("matchups", []):
+        row_a, row_b = totals[a], totals[b]
+        res = [
+            _compare(cat, row_a[i], row_b[i]) if i is not None else "toss-up"
+            for cat, i in zip(cats, cols)
+        ]
+        out.append((teams[a], teams[b], res))
+    return out
@@ -0,0 +1,291 @@
+"""
+src/yahoo_ai_gm/analysis/live_matchup.py
+
+Layer 2 — Pure Analysis. No FastAPI, no I/O, no Yahoo client.
+
+Live in-week win probability.
+
+category_pressure only compares the current scoreboard totals, and the matchup
+engine only compares full-season projections. This engine combines both:
+
+  final = accumulated week totals (snapshot scoreboard)
+        + rest-of-week contribution (season projection pro-rated by remaining days)
+
+Algorithm:
+1. Per team, convert the season TeamProjection into per-day rates
+   (counting stats, plus AB/H and IP/ER/baserunners for the ratio cats).
+   Rates only depend on rosters + projections, so they are built once and
+   reused for every new scoreboard snapshot.
+2. For each category, project the final value and its rest-of-week variance
+   (over-dispersed Poisson for counting stats, binomial for AVG, run/baserunner
+   counts for ERA/WHIP weighted by total IP).
+3. P(win category) = P(my_final - opp_final > 0) under a normal approximation
+   (flipped for ERA/WHIP).
+4. Overall P(win matchup) from the Poisson-binomial distribution of category
+   wins (more category wins than losses).
+
+Categories are evaluated as parallel per-category lists, so a refresh is a
+single O(categories) pass.
+"""
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+
+from yahoo_ai_gm.analysis.trade_engine import (
+    TeamProjection,
+    SCORING_CATS,
+    LOWER_IS_BETTER,
+)
+
+
+# ---------------------------------------------------------------------------
+# Config
+# ---------------------------------------------------------------------------
+
+# Regular-season length used to turn season projections into per-day rates
+SEASON_DAYS = 186
+DEFAULT_WEEK_DAYS = 7
+
+LIVE_CATS = SCORING_CATS["batting"] + SCORING_CATS["pitching"]
+
+# Yahoo scoreboard names that differ from the FG / engine names
+YAHOO_CAT_ALIASES = {"SO": "K"}
+
+# Variance / mean of rest-of-week contributions. Runs, RBI and earned runs
+# arrive in clusters, so they are noisier than a plain Poisson count.
+CAT_DISPERSION = {
+    "R": 2.0, "HR": 1.2, "RBI": 2.0, "SB": 1.5,
+    "W": 1.0, "SO": 1.5, "SV": 1.0, "IP": 3.0,
+    "ER": 2.0, "BR": 1.3,
+}
+
+
+# ---------------------------------------------------------------------------
+# Data structures
+# ---------------------------------------------------------------------------
+
+@dataclass
+class TeamRates:
+    """Per-day projected contribution for one roster."""
+    counting: dict[str, float]    # cat -> per-day mean (R, HR, RBI, SB, W, SO, SV, IP)
+    ab: float
+    hits: float
+    er: float
+    baserunners: float
+
+
+@dataclass
+class LiveCategory:
+    cat: str
+    my_current: float
+    opp_current: float
+    my_projected: float
+    opp_projected: float
+    win_prob: float
+
+
+@dataclass
+class LiveMatchup:
+    week: int
+    remaining_days: float
+    categories: list[LiveCategory]
+    expected_cat_wins: float
+    win_prob: float
+    tie_prob: float
+    loss_prob: float
+
+
+# ---------------------------------------------------------------------------
+# Rates
+# ---------------------------------------------------------------------------
+
+def build_team_rates(team: TeamProjection, season_days: int = SEASON_DAYS) -> TeamRates:
+    d = float(season_days)
+    return TeamRates(
+        counting={
+            "R": team.r / d, "HR": team.hr / d, "RBI": team.rbi / d, "SB": team.sb / d,
+            "W": team.w / d, "SO": team.so / d, "SV": team.sv / d,
+            "IP": team.total_ip / d,
+        },
+        ab=team.total_ab / d,
+        hits=team.total_hits / d,
+        er=team.total_er / d,
+        baserunners=team.total_baserunners / d,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Scoreboard helpers
+# ---------------------------------------------------------------------------
+
+def ip_to_float(ip: float) -> float:
+    """Yahoo reports innings as 12.1 / 12.2 for 12 1/3 / 12 2/3."""
+    whole = math.floor(ip)
+    outs = round((ip - whole) * 10)
+    if outs in (1, 2):
+        return whole + outs / 3.0
+    return float(ip)
+
+
+def _current(totals: dict[str, float], cat: str) -> float:
+    v = totals.get(cat)
+    if v is None:
+        v = totals.get(YAHOO_CAT_ALIASES.get(cat, cat), 0.0)
+    try:
+        v = float(v)
+    except (TypeError, ValueError):
+        return 0.0
+    return ip_to_float(v) if cat == "IP" else v
+
+
+# ---------------------------------------------------------------------------
+# Projection of final values
+# ---------------------------------------------------------------------------
+
+def _project_final(
+    cat: str,
+    totals: dict[str, float],
+    rates: TeamRates,
+    elapsed_days: float,
+    remaining_days: float,
+) -> tuple[float, float, float]:
+    """Returns (current, projected final, variance of final) for one team."""
+    cur = _current(totals, cat)
+    rd = remaining_days
+
+    if cat == "AVG":
+        ab_acc = rates.ab * elapsed_days
+        ab_rest = rates.ab * rd
+        ab_tot = ab_acc + ab_rest
+        if ab_tot <= 0:
+            return cur, cur, 0.0
+        p = rates.hits / rates.ab if rates.ab > 0 else 0.0
+        final = (cur * ab_acc + rates.hits * rd) / ab_tot
+        var = ab_rest * p * (1.0 - p) / (ab_tot ** 2)
+        return cur, final, var
+
+    if cat in ("ERA", "WHIP"):
+        ip_acc = _current(totals, "IP")
+        ip_rest = rates.counting["IP"] * rd
+        ip_tot = ip_acc + ip_rest
+        if ip_tot <= 0:
+            return cur, cur, 0.0
+        if cat == "ERA":
+            er_rest = rates.er * rd
+            final = (cur * ip_acc / 9.0 + er_rest) * 9.0 / ip_tot
+            var = 81.0 * er_rest * CAT_DISPERSION["ER"] / (ip_tot ** 2)
+        else:
+            br_rest = rates.baserunners * rd
+            final = (cur * ip_acc + br_rest) / ip_tot
+            var = br_rest * CAT_DISPERSION["BR"] / (ip_tot ** 2)
+        return cur, final, var
+
+    rest = rates.counting.get(cat, 0.0) * rd
+    return cur, cur + rest, rest * CAT_DISPERSION.get(cat, 1.0)
+
+
+def _win_prob(cat: str, my_final: float, my_var: float, opp_final: float, opp_var: float) -> float:
+    delta = my_final - opp_final
+    if cat in LOWER_IS_BETTER:
+        delta = -delta
+    var = my_var + opp_var
+    if var <= 0:
+        if delta > 0:
+            return 1.0
+        if delta < 0:
+            return 0.0
+        return 0.5
+    return 0.5 * (1.0 + math.erf(delta / math.sqrt(2.0 * var)))
+
+
+def _record_distribution(probs: list[float]) -> list[float]:
+    """Poisson-binomial: dist[k] = P(exactly k category wins)."""
+    dist = [1.0]
+    for p in probs:
+        nxt = [0.0] * (len(dist) + 1)
+        for k, q in enumerate(dist):
+            nxt[k] += q * (1.0 - p)
+            nxt[k + 1] += q * p
+        dist = nxt
+    return dist
+
+
+def project_live_matchup(
+    my_totals: dict[str, float],
+    opp_totals: dict[str, float],
+    my_rates: TeamRates,
+    opp_rates: TeamRates,
+    week: int,
+    remaining_days: float,
+    week_days: float = DEFAULT_WEEK_DAYS,
+) -> LiveMatchup:
+    """
+    Combine accumulated week totals with rest-of-week projections.
+
+    Args:
+        my_totals / opp_totals: scoreboard totals from the snapshot matchup
+            (Yahoo names: R, HR, RBI, SB, AVG, W, K, SV, ERA, WHIP, IP)
+        my_rates / opp_rates: per-day rates from build_team_rates (reusable
+            across snapshots; only the totals change during the week)
+        remaining_days: scoring days left in the matchup week (0 = final)
+        week_days: length of the matchup week
+    """
+    remaining_days = max(0.0, min(float(remaining_days), float(week_days)))
+    elapsed_days = float(week_days) - remaining_days
+
+    mine = [_project_final(c, my_totals, my_rates, elapsed_days, remaining_days) for c in LIVE_CATS]
+    theirs = [_project_final(c, opp_totals, opp_rates, elapsed_days, remaining_days) for c in LIVE_CATS]
+    probs = [
+        _win_prob(c, m[1], m[2], o[1], o[2])
+        for c, m, o in zip(LIVE_CATS, mine, theirs)
+    ]
+
+    categories = [
+        LiveCategory(
+            cat=c,
+            my_current=round(m[0], 4),
+            opp_current=round(o[0], 4),
+            my_projected=round(m[1], 4),
+            opp_projected=round(o[1], 4),
+            win_prob=round(p, 4),
+        )
+        for c, m, o, p in zip(LIVE_CATS, mine, theirs, probs)
+    ]
+
+    n = len(probs)
+    dist = _record_distribution(probs)
+    win = sum(q for k, q in enumerate(dist) if 2 * k > n)
+    tie = sum(q for k, q in enumerate(dist) if 2 * k == n)
+
+    return LiveMatchup(
+        week=week,
+        remaining_days=round(remaining_days, 2),
+        categories=categories,
+        expected_cat_wins=round(sum(probs), 3),
+        win_prob=round(win, 4),
+        tie_prob=round(tie, 4),
+        loss_prob=round(max(0.0, 1.0 - win - tie), 4),
+    )
+
+
+def live_matchup_to_dict(lm: LiveMatchup) -> dict:
+    return {
+        "week": lm.week,
+        "remaining_days": lm.remaining_days,
+        "win_prob": lm.win_prob,
+        "tie_prob": lm.tie_prob,
+        "loss_prob": lm.loss_prob,
+        "expected_cat_wins": lm.expected_cat_wins,
+        "categories": [
+            {
+                "cat": c.cat,
+                "my_current": c.my_current,
+                "opp_current": c.opp_current,
+                "my_projected": c.my_projected,
+                "opp_projected": c.opp_projected,
+                "win_prob": c.win_prob,
+            }
+            for c in lm.categories
+        ],
+    }
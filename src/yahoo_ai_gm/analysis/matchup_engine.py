@@ -11,6 +11,8 @@ Algorithm:
 3. For each of 11 scoring categories: project win / loss / toss-up
 4. Compute projected record and confidence per category
 5. Identify swing categories (close enough to flip the matchup)
+6. Optionally simulate the week with jointly drawn (correlated) category
+   outcomes for a win probability and record distribution
 """
 from __future__ import annotations
 
@@ -28,6 +30,11 @@ from yahoo_ai_gm.analysis.trade_engine import (
     SCORING_CATS,
     LOWER_IS_BETTER,
 )
+from yahoo_ai_gm.analysis.category_simulation import (
+    SimulatedMatchup,
+    simulate_matchup,
+    simulated_matchup_to_dict,
+)
 
 
 # ---------------------------------------------------------------------------
@@ -63,6 +70,7 @@ class MatchupProjection:
     swing_categories: list[str]      # categories we could flip with targeted adds
     my_unmatched: list[str]          # roster players missing from FG
     opp_unmatched: list[str]
+    simulation: Optional[SimulatedMatchup] = None
 
 
 # ---------------------------------------------------------------------------
@@ -133,6 +141,11 @@ def project_matchup(
     opp_team_name: str,
     week: int,
     n_teams: int = 10,
+    all_projections: Optional[list[PlayerProjection]] = None,
+    fg_lookup: Optional[dict[str, PlayerProjection]] = None,
+    league_averages: Optional[dict[str, tuple[float, float]]] = None,
+    n_sims: int = 0,
+    category_correlation: Optional[list[list[float]]] = None,
 ) -> MatchupProjection:
     """
     Project head-to-head category matchup between my team and opponent.
@@ -145,9 +158,16 @@ def project_matchup(
         my_team_key / opp_team_key: Yahoo team keys
         week: current matchup week
         n_teams: league size for league average computation
+        all_projections / fg_lookup / league_averages: precomputed shared
+            state (use_cases.context); built from the FG data when omitted
+        n_sims: when > 0, also simulate the week n_sims times
+        category_correlation: correlation matrix for the simulation
+            (category_simulation.category_correlation); None = independent
     """
-    all_projections = load_projections_from_fg(fg_bat_data, fg_pit_data)
-    fg_lookup = build_fg_lookup(all_projections)
+    if all_projections is None:
+        all_projections = load_projections_from_fg(fg_bat_data, fg_pit_data)
+    if fg_lookup is None:
+        fg_lookup = build_fg_lookup(all_projections)
 
     # Match both rosters
     my_matches = match_roster_to_fg(my_roster, fg_lookup)
@@ -162,7 +182,9 @@ def project_matchup(
     my_team = build_team_projection(my_proj)
     opp_team = build_team_projection(opp_proj)
 
-    league_avgs = compute_league_averages(all_projections, n_teams=n_teams)
+    league_avgs = league_averages
+    if league_avgs is None:
+        league_avgs = compute_league_averages(all_projections, n_teams=n_teams)
 
     all_cats = SCORING_CATS["batting"] + SCORING_CATS["pitching"]
     # Use K instead of SO in display (Yahoo uses K)
@@ -188,6 +210,14 @@ def project_matchup(
         if cm.is_swing:
             swing_cats.append(cat)
 
+    simulation = None
+    if n_sims > 0:
+        simulation = simulate_matchup(
+            my_team, opp_team, league_avgs,
+            correlation=category_correlation,
+            n_sims=n_sims,
+        )
+
     return MatchupProjection(
         my_team_key=my_team_key,
         my_team_name=my_team_name,
@@ -201,11 +231,12 @@ def project_matchup(
         swing_categories=swing_cats,
         my_unmatched=my_unmatched,
         opp_unmatched=opp_unmatched,
+        simulation=simulation,
     )
 
 
 def matchup_to_dict(mp: MatchupProjection) -> dict:
-    return {
+    out = {
         "my_team": {"key": mp.my_team_key, "name": mp.my_team_name},
         "opp_team": {"key": mp.opp_team_key, "name": mp.opp_team_name},
         "week": mp.week,
@@ -230,3 +261,6 @@ def matchup_to_dict(mp: MatchupProjection) -> dict:
             for cm in mp.categories
         ],
     }
+    if mp.simulation is not None:
+        out["simulation"] = simulated_matchup_to_dict(mp.simulation)
+    return out
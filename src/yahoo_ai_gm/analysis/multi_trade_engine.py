@@ -18,7 +18,8 @@ from __future__ import annotations
 
 import itertools
 from dataclasses import dataclass, field
-from typing import Optional
+from math import comb
+from typing import Callable, Optional
 
 from yahoo_ai_gm.analysis.trade_engine import (
     PlayerProjection,
@@ -200,15 +201,26 @@ def multi_trade_suggestions(
     max_give_adp: float = 350.0,
     max_receive_adp: float = 300.0,
     top_receive_per_team: int = 40,
+    all_projections: Optional[list[PlayerProjection]] = None,
+    fg_lookup: Optional[dict[str, PlayerProjection]] = None,
+    league_averages: Optional[dict[str, tuple[float, float]]] = None,
+    progress: Optional[Callable[[str, int, int], None]] = None,
 ) -> dict[str, list[MultiTradeSuggestion]]:
     """
     Generate multi-player trade suggestions.
 
     Returns dict keyed by trade size: {"2for1": [...], "1for2": [...], "2for2": [...]}
+
+    all_projections / fg_lookup / league_averages are optional precomputed
+    shared state (use_cases.context); built from the FG data when omitted.
+    progress(stage, combinations_done, combinations_total) is called as the
+    search advances, if given.
     """
     # Load projections
-    all_projections = load_projections_from_fg(fg_bat_data, fg_pit_data)
-    fg_lookup = build_fg_lookup(all_projections)
+    if all_projections is None:
+        all_projections = load_projections_from_fg(fg_bat_data, fg_pit_data)
+    if fg_lookup is None:
+        fg_lookup = build_fg_lookup(all_projections)
 
     # Match my roster
     my_matches = match_roster_to_fg(my_roster, fg_lookup)
@@ -216,7 +228,8 @@ def multi_trade_suggestions(
     my_team = build_team_projection(my_projs)
 
     # League averages and category scores
-    league_averages = compute_league_averages(all_projections, n_teams=n_teams)
+    if league_averages is None:
+        league_averages = compute_league_averages(all_projections, n_teams=n_teams)
     cat_scores = score_team_categories(my_team, league_averages)
     cat_score_map = {cs.cat: cs for cs in cat_scores}
 
@@ -250,8 +263,25 @@ def multi_trade_suggestions(
         "2for1": [], "1for2": [], "2for2": []
     }
 
+    # 2-for-2 pre-filter: only the top give pairs and top 12 receive players
+    # per team, to keep combinatorics manageable
+    top_give_pairs = sorted(
+        itertools.combinations(give_candidates, 2),
+        key=lambda pair: pair[0].adp + pair[1].adp
+    )[:15]
+
+    evaluated = 0
+    total = (
+        comb(len(give_candidates), 2) * len(all_receive)
+        + sum(len(give_candidates) * comb(len(tp), 2) for _, tp in team_receive_pools)
+        + sum(len(top_give_pairs) * comb(len(tp[:12]), 2) for _, tp in team_receive_pools)
+    )
+
     # ── 2-for-1 ──────────────────────────────────────────────────────────
     for give_pair in itertools.combinations(give_candidates, 2):
+        if progress is not None:
+            progress("2for1", evaluated, total)
+        evaluated += len(all_receive)
         for tname, receive in all_receive:
             # Skip if receive player is same as one being given
             if receive.name in {g.name for g in give_pair}:
@@ -296,6 +326,9 @@ def multi_trade_suggestions(
     # ── 1-for-2 ──────────────────────────────────────────────────────────
     # Group receive by team for 1-for-2 (both receive from same team)
     for tname, team_projs in team_receive_pools:
+        if progress is not None:
+            progress("1for2", evaluated, total)
+        evaluated += len(give_candidates) * comb(len(team_projs), 2)
         for give in give_candidates:
             for receive_pair in itertools.combinations(team_projs, 2):
                 if give.name in {r.name for r in receive_pair}:
@@ -336,15 +369,11 @@ def multi_trade_suggestions(
                 ))
 
     # ── 2-for-2 ──────────────────────────────────────────────────────────
-    # Pre-filter: only top 10 give pairs and top 10 receive pairs per team
-    # to keep combinatorics manageable
-    top_give_pairs = sorted(
-        itertools.combinations(give_candidates, 2),
-        key=lambda pair: pair[0].adp + pair[1].adp
-    )[:15]
-
     for tname, team_projs in team_receive_pools:
         top_recv_pairs = list(itertools.combinations(team_projs[:12], 2))
+        if progress is not None:
+            progress("2for2", evaluated, total)
+        evaluated += len(top_give_pairs) * len(top_recv_pairs)
         for give_pair in top_give_pairs:
             for receive_pair in top_recv_pairs:
                 give_names_set = {g.name for g in give_pair}
@@ -397,4 +426,6 @@ def multi_trade_suggestions(
                 break
         results[size] = deduped
 
+    if progress is not None:
+        progress("done", evaluated, total)
     return results
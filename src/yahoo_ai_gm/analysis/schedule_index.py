@@ -0,0 +1,155 @@
+"""
+src/yahoo_ai_gm/analysis/schedule_index.py
+
+Layer 2 — Pure Analysis. No FastAPI, no I/O, no Yahoo client.
+
+Compiled league schedule.
+
+league_schedule.json stores the schedule as week_str -> list of nested
+{team_a: {key, name}, team_b: {key, name}} dicts. Every consumer used to walk
+that structure and re-resolve team keys on each run. The index compiles it once
+into integer arrays:
+
+  matchups[week - 1]      -> [(a_idx, b_idx), ...]   week x matchup -> team pair
+  opponents[team_idx]     -> array of opponent idx   team x week -> opponent (-1 = bye)
+
+so schedule queries (who do I play in week N, remaining opponents, strength of
+schedule) are plain index lookups.
+"""
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass, field
+from typing import Optional
+
+
+INDEX_VERSION = 1
+NO_OPPONENT = -1
+
+
+# ---------------------------------------------------------------------------
+# Data structures
+# ---------------------------------------------------------------------------
+
+@dataclass
+class ScheduleIndex:
+    league_key: str
+    n_weeks: int
+    team_keys: list[str]
+    team_names: list[str]
+    matchups: list[list[tuple[int, int]]]   # week offset -> [(a_idx, b_idx), ...]
+    opponents: list[array]                  # team idx -> week offset -> opp idx
+    _key_to_idx: dict[str, int] = field(default_factory=dict, repr=False)
+
+    def __post_init__(self) -> None:
+        if not self._key_to_idx:
+            self._key_to_idx = {k: i for i, k in enumerate(self.team_keys)}
+
+    @property
+    def n_teams(self) -> int:
+        return len(self.team_keys)
+
+    def team_idx(self, team_key: str) -> Optional[int]:
+        return self._key_to_idx.get(team_key)
+
+    def week_matchups(self, week: int) -> list[tuple[int, int]]:
+        if week < 1 or week > self.n_weeks:
+            return []
+        return self.matchups[week - 1]
+
+    def opponent_idx(self, team_idx: int, week: int) -> int:
+        if week < 1 or week > self.n_weeks:
+            return NO_OPPONENT
+        return self.opponents[team_idx][week - 1]
+
+    def opponent_key(self, team_key: str, week: int) -> Optional[str]:
+        idx = self.team_idx(team_key)
+        if idx is None:
+            return None
+        opp = self.opponent_idx(idx, week)
+        return self.team_keys[opp] if opp != NO_OPPONENT else None
+
+    def remaining_opponents(
+        self, team_idx: int, first_week: int, last_week: int
+    ) -> list[tuple[int, int]]:
+        """Returns [(week, opp_idx), ...] for weeks in [first_week, last_week] with a game."""
+        row = self.opponents[team_idx]
+        lo = max(first_week, 1)
+        hi = min(last_week, self.n_weeks)
+        return [(w, row[w - 1]) for w in range(lo, hi + 1) if row[w - 1] != NO_OPPONENT]
+
+
+# ---------------------------------------------------------------------------
+# Compilation
+# ---------------------------------------------------------------------------
+
+def compile_schedule_index(schedule_data: dict) -> ScheduleIndex:
+    """
+    Compile league_schedule.json contents into a ScheduleIndex.
+
+    Args:
+        schedule_data: {"league_key", "weeks", "schedule": {week_str: [matchup, ...]}}
+    """
+    schedule = schedule_data.get("schedule", {}) or {}
+    week_nums = [int(w) for w in schedule if str(w).isdigit()]
+    n_weeks = max([int(schedule_data.get("weeks") or 0)] + week_nums)
+
+    team_keys: list[str] = []
+    team_names: list[str] = []
+    key_to_idx: dict[str, int] = {}
+
+    def _idx(team: dict) -> int:
+        key = team.get("key", "")
+        if key not in key_to_idx:
+            key_to_idx[key] = len(team_keys)
+            team_keys.append(key)
+            team_names.append(team.get("name") or key)
+        return key_to_idx[key]
+
+    matchups: list[list[tuple[int, int]]] = [[] for _ in range(n_weeks)]
+    for week in sorted(week_nums):
+        for m in schedule.get(str(week), []):
+            a = _idx(m["team_a"])
+            b = _idx(m["team_b"])
+            matchups[week - 1].append((a, b))
+
+    opponents = [array("h", [NO_OPPONENT] * n_weeks) for _ in team_keys]
+    for w, pairs in enumerate(matchups):
+        for a, b in pairs:
+            opponents[a][w] = b
+            opponents[b][w] = a
+
+    return ScheduleIndex(
+        league_key=str(schedule_data.get("league_key", "")),
+        n_weeks=n_weeks,
+        team_keys=team_keys,
+        team_names=team_names,
+        matchups=matchups,
+        opponents=opponents,
+        _key_to_idx=key_to_idx,
+    )
+
+
+def schedule_index_to_dict(idx: ScheduleIndex) -> dict:
+    return {
+        "index_version": INDEX_VERSION,
+        "league_key": idx.league_key,
+        "weeks": idx.n_weeks,
+        "team_keys": idx.team_keys,
+        "team_names": idx.team_names,
+        "matchups": [[[a, b] for a, b in pairs] for pairs in idx.matchups],
+        "opponents": [list(row) for row in idx.opponents],
+    }
+
+
+def schedule_index_from_dict(d: dict) -> ScheduleIndex:
+    if d.get("index_version") != INDEX_VERSION:
+        raise ValueError(f"Unsupported schedule index version: {d.get('index_version')}")
+    return ScheduleIndex(
+        league_key=d.get("league_key", ""),
+        n_weeks=int(d["weeks"]),
+        team_keys=list(d["team_keys"]),
+        team_names=list(d["team_names"]),
+        matchups=[[(a, b) for a, b in pairs] for pairs in d["matchups"]],
+        opponents=[array("h", row) for row in d["opponents"]],
+    )
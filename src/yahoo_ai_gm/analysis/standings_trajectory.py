@@ -5,13 +5,16 @@ Layer 2 — Pure Analysis.
 
 Projects final standings for all 10 teams based on:
   - Current FG Steamer projections for all rostered players
-  - Full remaining schedule from league_schedule.json
+  - Full remaining schedule (compiled ScheduleIndex from league_schedule.json)
   - Per-week matchup simulation using project_matchup()
+  - Actual category results for completed weeks (league_scoreboard.json),
+    counted in place of simulation when available
 
 Output:
   - Projected W/L/T record for all 10 teams
   - Projected standings rank
-  - Playoff probability (top 6 of 10)
+  - Playoff probability (top 6 of 10); optionally from correlated
+    category simulation of the remaining season (category_simulation.py)
   - Remaining schedule difficulty for my team
 """
 from __future__ import annotations
@@ -19,9 +22,11 @@ from __future__ import annotations
 import itertools
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 
 from yahoo_ai_gm.analysis.trade_engine import (
+    PlayerProjection,
+    TeamProjection,
     build_team_projection,
     build_fg_lookup,
     load_projections_from_fg,
@@ -32,6 +37,9 @@ from yahoo_ai_gm.analysis.trade_engine import (
     _normalize_name,
 )
 from yahoo_ai_gm.analysis.matchup_engine import project_category_matchup, TOSSUP_THRESHOLD
+from yahoo_ai_gm.analysis.schedule_index import ScheduleIndex, compile_schedule_index
+from yahoo_ai_gm.analysis.league_scoreboard import final_weeks, week_category_results
+from yahoo_ai_gm.analysis.category_simulation import simulate_playoff_odds, standardized_margins
 
 
 PLAYOFF_TEAMS = 6
@@ -79,45 +87,47 @@ class StandingsTrajectory:
     hardest_weeks: list[int]       # weeks with toughest projected opponents
     easiest_weeks: list[int]       # weeks with weakest projected opponents
     playoff_contenders: list[str]  # team names projected to make playoffs
+    actual_weeks: list[int] = field(default_factory=list)  # weeks counted from real results
+    playoff_sims: int = 0          # simulated seasons behind playoff_probability (0 = heuristic)
 
 
 # ---------------------------------------------------------------------------
 # Core engine
 # ---------------------------------------------------------------------------
 
-def _project_week_matchup(
+def _category_results(
     team_a_proj,
     team_b_proj,
     league_averages: dict,
-) -> tuple[int, int, int]:
-    """Returns (a_wins, a_losses, a_tossups) for one matchup."""
-    all_cats = SCORING_CATS["batting"] + SCORING_CATS["pitching"]
-    a_wins = a_losses = a_tossups = 0
+    all_cats: list[str],
+) -> list[str]:
+    """Per-category result strings ("win" | "loss" | "toss-up") from team A's side."""
+    results = []
     for cat in all_cats:
         _, stdev = league_averages.get(cat, (0.0, 1.0))
         cm = project_category_matchup(
-            cat,
-            team_a_proj.cat_value(cat),
-            team_b_proj.cat_value(cat),
-            stdev,
+            cat, team_a_proj.cat_value(cat), team_b_proj.cat_value(cat), stdev
         )
-        if cm.result == "win":
-            a_wins += 1
-        elif cm.result == "loss":
-            a_losses += 1
-        else:
-            a_tossups += 1
-    return a_wins, a_losses, a_tossups
+        results.append(cm.result)
+    return results
 
 
 def project_standings(
     my_team_key: str,
     league_rosters: list[dict],
-    schedule: dict,         # week_str -> list of matchup dicts
+    schedule: ScheduleIndex | dict,
     fg_bat_data: dict,
     fg_pit_data: dict,
     current_week: int = 1,
     n_teams: int = 10,
+    all_projections: Optional[list[PlayerProjection]] = None,
+    fg_lookup: Optional[dict[str, PlayerProjection]] = None,
+    league_averages: Optional[dict[str, tuple[float, float]]] = None,
+    team_projections: Optional[dict[str, TeamProjection]] = None,
+    league_scoreboard: Optional[dict] = None,
+    n_sims: int = 0,
+    category_correlation: Optional[list[list[float]]] = None,
+    progress: Optional[Callable[[str, int, int], None]] = None,
 ) -> StandingsTrajectory:
     """
     Project final standings for all teams.
@@ -125,15 +135,32 @@ def project_standings(
     Args:
         my_team_key: e.g. "469.l.40206.t.6"
         league_rosters: from league_rosters.json teams list
-        schedule: from league_schedule.json schedule dict
+        schedule: compiled ScheduleIndex (a raw league_schedule.json
+                  schedule dict is still accepted and compiled on the fly)
         fg_bat_data / fg_pit_data: loaded FG projection dicts
         current_week: first week to simulate from
         n_teams: league size
+        all_projections / fg_lookup / league_averages / team_projections:
+            precomputed shared state (use_cases.context); built from the
+            FG data when omitted
+        league_scoreboard: league_scoreboard.json contents; completed weeks
+            found there count their actual results and are not simulated
+        n_sims: when > 0, playoff probability is the share of n_sims simulated
+            seasons finishing in the top PLAYOFF_TEAMS (category outcomes drawn
+            jointly using category_correlation; independent when None)
+        progress: optional progress(stage, done, total) callback ("weeks",
+            then "seasons" when simulating)
     """
+    if not isinstance(schedule, ScheduleIndex):
+        schedule = compile_schedule_index({"schedule": schedule})
+
     # Build projections for all teams
-    all_projections = load_projections_from_fg(fg_bat_data, fg_pit_data)
-    fg_lookup = build_fg_lookup(all_projections)
-    league_averages = compute_league_averages(all_projections, n_teams=n_teams)
+    if all_projections is None:
+        all_projections = load_projections_from_fg(fg_bat_data, fg_pit_data)
+    if fg_lookup is None:
+        fg_lookup = build_fg_lookup(all_projections)
+    if league_averages is None:
+        league_averages = compute_league_averages(all_projections, n_teams=n_teams)
 
     team_proj_map: dict[str, object] = {}  # team_key -> TeamProjection
     team_name_map: dict[str, str] = {}
@@ -142,136 +169,186 @@ def project_standings(
         tkey = team["team_key"]
         tname = team["team_name"]
         team_name_map[tkey] = tname
+        if team_projections is not None and tkey in team_projections:
+            team_proj_map[tkey] = team_projections[tkey]
+            continue
         matches = match_roster_to_fg(team["players"], fg_lookup)
         projs = [p for p in matches.values() if p is not None]
         team_proj_map[tkey] = build_team_projection(projs)
 
-    # Initialize record accumulators
-    records: dict[str, dict] = {
-        tkey: {"wins": 0, "losses": 0, "tossups": 0,
-               "cat_wins": {c: 0 for c in SCORING_CATS["batting"] + SCORING_CATS["pitching"]},
-               "weeks": 0}
-        for tkey in team_proj_map
-    }
-
-    my_weekly_results: list[WeeklyMatchupResult] = []
-
-    # Simulate each remaining week
     all_cats = SCORING_CATS["batting"] + SCORING_CATS["pitching"]
-    for week in range(current_week, REGULAR_SEASON_WEEKS + 1):
-        week_matchups = schedule.get(str(week), [])
-        for matchup in week_matchups:
-            a_key = matchup["team_a"]["key"]
-            b_key = matchup["team_b"]["key"]
-            a_name = matchup["team_a"]["name"]
-            b_name = matchup["team_b"]["name"]
-
-            proj_a = team_proj_map.get(a_key)
-            proj_b = team_proj_map.get(b_key)
+    n_cats = len(all_cats)
+
+    # Per-schedule-index accumulators. Teams on the schedule without a roster
+    # projection keep proj None and are skipped, as before.
+    n_idx = schedule.n_teams
+    proj_by_idx = [team_proj_map.get(k) for k in schedule.team_keys]
+    wins = [0] * n_idx
+    losses = [0] * n_idx
+    tossups = [0] * n_idx
+    weeks_played = [0] * n_idx
+    cat_wins = [[0] * n_cats for _ in range(n_idx)]
+
+    # Category results depend only on the pair, so each pairing is projected
+    # once no matter how many times it recurs on the schedule.
+    pair_results: dict[tuple[int, int], list[str]] = {}
+
+    def _tally(a: int, b: int, res: list[str]) -> None:
+        for c, r in enumerate(res):
+            if r == "win":
+                wins[a] += 1
+                losses[b] += 1
+                cat_wins[a][c] += 1
+            elif r == "loss":
+                losses[a] += 1
+                wins[b] += 1
+                cat_wins[b][c] += 1
+            else:
+                tossups[a] += 1
+                tossups[b] += 1
+        weeks_played[a] += 1
+        weeks_played[b] += 1
+
+    last_week = min(REGULAR_SEASON_WEEKS, schedule.n_weeks)
+    actual_weeks = [w for w in final_weeks(league_scoreboard) if 1 <= w <= last_week]
+    actual_set = set(actual_weeks)
+
+    # Completed weeks: actual results from the league scoreboard table
+    for week in actual_weeks:
+        for a_key, b_key, res in week_category_results(league_scoreboard, week, all_cats):
+            a = schedule.team_idx(a_key)
+            b = schedule.team_idx(b_key)
+            if a is None or b is None:
+                continue
+            _tally(a, b, res)
+    banked_wins = list(wins)
+    banked_losses = list(losses)
+
+    # Remaining weeks: simulated from projections
+    for week in range(current_week, last_week + 1):
+        if progress is not None:
+            progress("weeks", week - current_week, last_week + 1 - current_week)
+        if week in actual_set:
+            continue
+        for a, b in schedule.week_matchups(week):
+            proj_a = proj_by_idx[a]
+            proj_b = proj_by_idx[b]
             if proj_a is None or proj_b is None:
                 continue
 
-            a_wins, a_losses, a_tossups = _project_week_matchup(
-                proj_a, proj_b, league_averages
-            )
-
-            # Accumulate for team A
-            if a_key in records:
-                records[a_key]["wins"]   += a_wins
-                records[a_key]["losses"] += a_losses
-                records[a_key]["tossups"]+= a_tossups
-                records[a_key]["weeks"]  += 1
-                for cat in all_cats:
-                    _, stdev = league_averages.get(cat, (0.0, 1.0))
-                    cm = project_category_matchup(
-                        cat, proj_a.cat_value(cat), proj_b.cat_value(cat), stdev
-                    )
-                    if cm.result == "win":
-                        records[a_key]["cat_wins"][cat] += 1
-
-            # Accumulate for team B (inverse)
-            if b_key in records:
-                records[b_key]["wins"]   += a_losses
-                records[b_key]["losses"] += a_wins
-                records[b_key]["tossups"]+= a_tossups
-                records[b_key]["weeks"]  += 1
-                for cat in all_cats:
-                    _, stdev = league_averages.get(cat, (0.0, 1.0))
-                    cm = project_category_matchup(
-                        cat, proj_b.cat_value(cat), proj_a.cat_value(cat), stdev
+            res = pair_results.get((a, b))
+            if res is None:
+                res = _category_results(proj_a, proj_b, league_averages, all_cats)
+                pair_results[(a, b)] = res
+            _tally(a, b, res)
+
+    # Simulated playoff odds over the remaining (non-actual) weeks
+    sim_playoff: Optional[list[float]] = None
+    if n_sims > 0:
+        weekly_pairs = []
+        margins_by_pair: dict[tuple[int, int], list[float]] = {}
+        for week in range(current_week, last_week + 1):
+            if week in actual_set:
+                continue
+            pairs = []
+            for a, b in schedule.week_matchups(week):
+                if proj_by_idx[a] is None or proj_by_idx[b] is None:
+                    continue
+                if (a, b) not in margins_by_pair:
+                    margins_by_pair[(a, b)] = standardized_margins(
+                        proj_by_idx[a], proj_by_idx[b], league_averages
                     )
-                    if cm.result == "win":
-                        records[b_key]["cat_wins"][cat] += 1
-
-            # Track my weekly results
-            if a_key == my_team_key or b_key == my_team_key:
-                is_a = a_key == my_team_key
-                opp_key = b_key if is_a else a_key
-                opp_name = b_name if is_a else a_name
-                my_w = a_wins if is_a else a_losses
-                my_l = a_losses if is_a else a_wins
-
-                # Swing cats for my matchup
-                swing_cats = []
-                for cat in all_cats:
-                    _, stdev = league_averages.get(cat, (0.0, 1.0))
-                    if stdev == 0:
-                        continue
-                    my_val = (proj_a if is_a else proj_b).cat_value(cat)
-                    opp_val = (proj_b if is_a else proj_a).cat_value(cat)
-                    gap = abs(my_val - opp_val) / stdev
-                    if gap < 0.40:
-                        swing_cats.append(cat)
-
-                my_weekly_results.append(WeeklyMatchupResult(
-                    week=week,
-                    my_team_key=my_team_key,
-                    opp_team_key=opp_key,
-                    opp_team_name=opp_name,
-                    projected_wins=my_w,
-                    projected_losses=my_l,
-                    projected_tossups=a_tossups,
-                    swing_categories=swing_cats,
-                ))
-
-    # Build standings
+                pairs.append((a, b))
+            weekly_pairs.append(pairs)
+        sim_playoff = simulate_playoff_odds(
+            margins_by_pair,
+            weekly_pairs,
+            banked_wins,
+            banked_losses,
+            playoff_teams=PLAYOFF_TEAMS,
+            correlation=category_correlation,
+            n_sims=n_sims,
+            progress=progress,
+        )
+
+    # Build standings (roster order, as before)
     standings_list = []
-    for tkey, rec in records.items():
-        weeks = max(rec["weeks"], 1)
-        cat_win_rates = {
-            cat: rec["cat_wins"][cat] / weeks
-            for cat in all_cats
-        }
+    for tkey in team_proj_map:
+        idx = schedule.team_idx(tkey)
+        if idx is None:
+            rec_w = rec_l = rec_t = played = 0
+            rec_cats = [0] * n_cats
+        else:
+            rec_w, rec_l, rec_t = wins[idx], losses[idx], tossups[idx]
+            played = weeks_played[idx]
+            rec_cats = cat_wins[idx]
+        weeks = max(played, 1)
         standings_list.append({
             "team_key": tkey,
             "team_name": team_name_map.get(tkey, tkey),
-            "wins": rec["wins"],
-            "losses": rec["losses"],
-            "tossups": rec["tossups"],
+            "wins": rec_w,
+            "losses": rec_l,
+            "tossups": rec_t,
             "weeks": weeks,
-            "cat_win_rates": cat_win_rates,
+            "cat_win_rates": {cat: rec_cats[c] / weeks for c, cat in enumerate(all_cats)},
         })
 
     # Sort by wins desc, losses asc
     standings_list.sort(key=lambda t: (-t["wins"], t["losses"]))
 
-    # Compute strength of schedule for my team
-    my_opp_wins = []
-    for wr in my_weekly_results:
-        opp_rec = records.get(wr.opp_team_key, {})
-        my_opp_wins.append(opp_rec.get("wins", 0))
-    sos = sum(my_opp_wins) / len(my_opp_wins) if my_opp_wins else 0.0
+    # My remaining schedule: one opponent lookup per week
+    my_idx = schedule.team_idx(my_team_key)
+    my_weekly_results: list[WeeklyMatchupResult] = []
+    my_opps: list[tuple[int, int]] = []
+    if my_idx is not None and proj_by_idx[my_idx] is not None:
+        my_proj = proj_by_idx[my_idx]
+        for week, opp in schedule.remaining_opponents(my_idx, current_week, last_week):
+            opp_proj = proj_by_idx[opp]
+            if opp_proj is None or week in actual_set:
+                continue
+            res = pair_results.get((my_idx, opp))
+            if res is not None:
+                my_w, my_l = res.count("win"), res.count("loss")
+            else:
+                res = pair_results[(opp, my_idx)]
+                my_w, my_l = res.count("loss"), res.count("win")
+
+            # Swing cats for my matchup
+            swing_cats = []
+            for cat in all_cats:
+                _, stdev = league_averages.get(cat, (0.0, 1.0))
+                if stdev == 0:
+                    continue
+                gap = abs(my_proj.cat_value(cat) - opp_proj.cat_value(cat)) / stdev
+                if gap < 0.40:
+                    swing_cats.append(cat)
+
+            my_opps.append((week, opp))
+            my_weekly_results.append(WeeklyMatchupResult(
+                week=week,
+                my_team_key=my_team_key,
+                opp_team_key=schedule.team_keys[opp],
+                opp_team_name=schedule.team_names[opp],
+                projected_wins=my_w,
+                projected_losses=my_l,
+                projected_tossups=res.count("toss-up"),
+                swing_categories=swing_cats,
+            ))
+
+    # Strength of schedule for my team: mean projected wins of my opponents
+    sos = sum(wins[opp] for _, opp in my_opps) / len(my_opps) if my_opps else 0.0
 
     # Build TeamStanding objects
     all_standings = []
     for rank, t in enumerate(standings_list, 1):
-        weeks = max(t["weeks"], 1)
         playoff_prob = 1.0 if rank <= PLAYOFF_TEAMS else 0.0
+        idx = schedule.team_idx(t["team_key"])
+        if sim_playoff is not None:
+            playoff_prob = sim_playoff[idx] if idx is not None else 0.0
         # For teams on the bubble (rank 5-7), use wins margin
-        if rank in (5, 6, 7):
+        elif rank in (5, 6, 7):
             boundary_wins = standings_list[PLAYOFF_TEAMS - 1]["wins"]
-            my_wins = t["wins"]
-            margin = my_wins - boundary_wins
+            margin = t["wins"] - boundary_wins
             if margin == 0:
                 playoff_prob = 0.5
             elif margin > 0:
@@ -295,14 +372,10 @@ def project_standings(
     my_standing = next(s for s in all_standings if s.team_key == my_team_key)
     my_name = team_name_map.get(my_team_key, my_team_key)
 
-    # Hardest/easiest weeks for my team
-    sorted_by_opp = sorted(
-        my_weekly_results,
-        key=lambda w: records.get(w.opp_team_key, {}).get("wins", 0),
-        reverse=True,
-    )
-    hardest_weeks = [w.week for w in sorted_by_opp[:3]]
-    easiest_weeks = [w.week for w in sorted_by_opp[-3:]]
+    # Hardest/easiest weeks for my team, ranked by opponent projected wins
+    sorted_by_opp = sorted(my_opps, key=lambda wo: wins[wo[1]], reverse=True)
+    hardest_weeks = [w for w, _ in sorted_by_opp[:3]]
+    easiest_weeks = [w for w, _ in sorted_by_opp[-3:]]
 
     playoff_contenders = [
         s.team_name for s in all_standings if s.projected_rank <= PLAYOFF_TEAMS
@@ -318,6 +391,8 @@ def project_standings(
         hardest_weeks=hardest_weeks,
         easiest_weeks=easiest_weeks,
         playoff_contenders=playoff_contenders,
+        actual_weeks=actual_weeks,
+        playoff_sims=n_sims if sim_playoff is not None else 0,
     )
 
 
@@ -325,6 +400,7 @@ def standings_trajectory_to_dict(t: StandingsTrajectory) -> dict:
     return {
         "my_team": t.my_team_name,
         "current_week": t.current_week,
+        "actual_weeks": t.actual_weeks,
         "my_projected_record": {
             "wins": t.my_standing.projected_wins,
             "losses": t.my_standing.projected_losses,
@@ -332,6 +408,7 @@ def standings_trajectory_to_dict(t: StandingsTrajectory) -> dict:
         },
         "my_projected_rank": t.my_standing.projected_rank,
         "playoff_probability": t.my_standing.playoff_probability,
+        "playoff_sims": t.playoff_sims,
         "strength_of_schedule": t.my_standing.strength_of_schedule,
         "hardest_weeks": t.hardest_weeks,
         "easiest_weeks": t.easiest_weeks,
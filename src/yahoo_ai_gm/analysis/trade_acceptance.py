@@ -207,8 +207,13 @@ def _balance_score(
         if cm.result == "win":
             my_wins += 1
 
+    return _balance_from_wins(my_wins, len(all_cats))
+
+
+def _balance_from_wins(my_wins: int, n_cats: int) -> tuple[float, str]:
+    """Balance factor from the categories we'd win head-to-head after the trade."""
     # If I win 8+ of 11 cats after trade, it's probably too lopsided
-    balance = my_wins / len(all_cats)
+    balance = my_wins / n_cats
     if balance <= 0.45:
         return 0.9, "trade favors them slightly"
     elif balance <= 0.55:
@@ -253,6 +258,39 @@ def compute_acceptance_probability(
     )
     desp_s, desp_desc      = _desperation_score(opp_rank, n_teams)
 
+    return acceptance_from_factors(
+        opp_team_key=opp_team_key,
+        opp_team_name=opp_team_name,
+        opp_rank=opp_rank,
+        give_names=[p.name for p in give_projs],
+        receive_names=[p.name for p in receive_projs],
+        need=(need_s, cats_addressed),
+        redundancy=(redund_s, redund_pos),
+        motivation=(motiv_s, motiv_desc),
+        balance=(balance_s, balance_desc),
+        desperation=(desp_s, desp_desc),
+    )
+
+
+def acceptance_from_factors(
+    opp_team_key: str,
+    opp_team_name: str,
+    opp_rank: int,
+    give_names: list[str],
+    receive_names: list[str],
+    need: tuple[float, list[str]],
+    redundancy: tuple[float, list[str]],
+    motivation: tuple[float, str],
+    balance: tuple[float, str],
+    desperation: tuple[float, str],
+) -> TradeAcceptanceResult:
+    """Weight the five (score, detail) factors into a probability + verdict."""
+    need_s, cats_addressed = need
+    redund_s, redund_pos = redundancy
+    motiv_s, motiv_desc = motivation
+    balance_s, balance_desc = balance
+    desp_s, desp_desc = desperation
+
     prob = (
         need_s    * W_NEED +
         redund_s  * W_REDUNDANCY +
@@ -285,8 +323,8 @@ def compute_acceptance_probability(
         opp_team_key=opp_team_key,
         opp_team_name=opp_team_name,
         opp_rank=opp_rank,
-        give_players=[p.name for p in give_projs],
-        receive_players=[p.name for p in receive_projs],
+        give_players=list(give_names),
+        receive_players=list(receive_names),
         acceptance_probability=prob,
         need_score=need_s,
         redundancy_score=redund_s,
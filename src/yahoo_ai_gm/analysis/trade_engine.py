@@ -452,6 +452,9 @@ def trade_suggestions(
     n_teams: int = 12,
     min_receive_adp: float = 300.0,
     max_give_adp: float = 400.0,
+    all_projections: Optional[list[PlayerProjection]] = None,
+    fg_lookup: Optional[dict[str, PlayerProjection]] = None,
+    league_averages: Optional[dict[str, tuple[float, float]]] = None,
 ) -> list[TradeSuggestion]:
     """
     Main entry point. Returns ranked TradeSuggestion list.
@@ -464,10 +467,14 @@ def trade_suggestions(
         n_teams: league size for average computation
         min_receive_adp: only suggest receiving players with ADP < this
         max_give_adp: only suggest giving players with ADP < this (valuable enough to trade)
+        all_projections / fg_lookup / league_averages: precomputed shared
+            state (use_cases.context); built from the FG data when omitted
     """
     # 1. Load all FG projections
-    all_projections = load_projections_from_fg(fg_bat_data, fg_pit_data)
-    fg_lookup = build_fg_lookup(all_projections)
+    if all_projections is None:
+        all_projections = load_projections_from_fg(fg_bat_data, fg_pit_data)
+    if fg_lookup is None:
+        fg_lookup = build_fg_lookup(all_projections)
 
     # 2. Match roster to FG
     roster_matches = match_roster_to_fg(roster, fg_lookup)
@@ -481,7 +488,8 @@ def trade_suggestions(
     my_team = build_team_projection(my_projections)
 
     # 4. Compute league averages
-    league_averages = compute_league_averages(all_projections, n_teams=n_teams)
+    if league_averages is None:
+        league_averages = compute_league_averages(all_projections, n_teams=n_teams)
 
     # 5. Score categories
     cat_scores = score_team_categories(my_team, league_averages)
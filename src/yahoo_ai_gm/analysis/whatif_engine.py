@@ -0,0 +1,428 @@
+"""
+src/yahoo_ai_gm/analysis/whatif_engine.py
+
+Layer 2 — Pure Analysis. No FastAPI, no I/O, no Yahoo client.
+
+Batch what-if trade evaluation: any k-for-m trade with any opposing team.
+
+The trade engines score one candidate by rebuilding full TeamProjections for
+both sides (build_team_projection over every rostered player), and the
+acceptance model does it again per factor. For a list of proposals against
+the same league that repeats the same work for every proposal.
+
+Here the base state is built once (build_whatif_base):
+  - every team reduced to a component vector
+      (R, HR, RBI, SB, AB, H, W, SO, SV, IP, ER, H+BB)
+  - my category z-scores, each opponent's needs and standings rank
+  - name indexes for my roster and every opposing roster
+
+Each proposal is then a vector add/subtract of the traded players'
+components, scored the same way as multi_trade_engine._score_trade and
+trade_acceptance.compute_acceptance_probability.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Optional
+
+from yahoo_ai_gm.analysis.trade_engine import (
+    PlayerProjection,
+    TeamProjection,
+    build_team_projection,
+    match_roster_to_fg,
+    score_team_categories,
+    SCORING_CATS,
+    LOWER_IS_BETTER,
+    _normalize_name,
+)
+from yahoo_ai_gm.analysis.multi_trade_engine import _position_fit_multiplier
+from yahoo_ai_gm.analysis.matchup_engine import project_category_matchup
+from yahoo_ai_gm.analysis.trade_acceptance import (
+    _balance_from_wins,
+    _desperation_score,
+    _motivation_score,
+    _redundancy_score,
+    acceptance_from_factors,
+    acceptance_result_to_dict,
+)
+
+
+ALL_CATS = SCORING_CATS["batting"] + SCORING_CATS["pitching"]
+
+# TeamProjection fields summed by build_team_projection, in vector order
+COMPONENTS = (
+    "r", "hr", "rbi", "sb", "total_ab", "total_hits",
+    "w", "so", "sv", "total_ip", "total_er", "total_baserunners",
+)
+
+# Largest trade side accepted (k and m in k-for-m)
+MAX_PLAYERS_PER_SIDE = 5
+
+
+# ---------------------------------------------------------------------------
+# Component vectors
+# ---------------------------------------------------------------------------
+
+Vector = tuple[float, ...]
+ZERO: Vector = (0.0,) * len(COMPONENTS)
+
+
+def team_vector(tp: TeamProjection) -> Vector:
+    return tuple(getattr(tp, c) for c in COMPONENTS)
+
+
+def player_vector(p: PlayerProjection) -> Vector:
+    # Same arithmetic as a one-player team, so sums match build_team_projection
+    return team_vector(build_team_projection([p]))
+
+
+def _add(a: Vector, b: Vector) -> Vector:
+    return tuple(x + y for x, y in zip(a, b))
+
+
+def _sub(a: Vector, b: Vector) -> Vector:
+    return tuple(x - y for x, y in zip(a, b))
+
+
+def _sum(vectors) -> Vector:
+    total = ZERO
+    for v in vectors:
+        total = _add(total, v)
+    return total
+
+
+def cat_values(v: Vector) -> dict[str, float]:
+    tp = TeamProjection(**dict(zip(COMPONENTS, v)))
+    return {cat: tp.cat_value(cat) for cat in ALL_CATS}
+
+
+# ---------------------------------------------------------------------------
+# Base state
+# ---------------------------------------------------------------------------
+
+@dataclass
+class RosterEntry:
+    name: str
+    player: dict                  # roster dict (positions for fit / redundancy)
+    proj: PlayerProjection
+    vector: Vector
+
+
+@dataclass
+class OpponentState:
+    team_key: str
+    team_name: str
+    rank: int
+    roster: list[dict]
+    vector: Vector
+    values: dict[str, float]
+    needs: dict[str, float]       # cat -> z-score, for cats with z < -0.3
+    players: dict[str, RosterEntry] = field(default_factory=dict)
+
+
+@dataclass
+class WhatIfBase:
+    my_roster: list[dict]
+    my_vector: Vector
+    my_values: dict[str, float]
+    my_players: dict[str, RosterEntry]      # normalized name -> entry
+    cat_score_map: dict
+    league_averages: dict
+    opponents: dict[str, OpponentState]     # team_key -> state
+    n_teams: int
+
+    def player_owner(self) -> dict[str, list[str]]:
+        """normalized name -> team keys rostering that player."""
+        owners: dict[str, list[str]] = {}
+        for tkey, opp in self.opponents.items():
+            for key in opp.players:
+                owners.setdefault(key, []).append(tkey)
+        return owners
+
+
+def _roster_entries(roster: list[dict], fg_lookup: dict) -> dict[str, RosterEntry]:
+    by_name = {(p.get("full_name") or p.get("name") or ""): p for p in roster}
+    entries: dict[str, RosterEntry] = {}
+    for name, proj in match_roster_to_fg(roster, fg_lookup).items():
+        if proj is None:
+            continue
+        entries[_normalize_name(name)] = RosterEntry(
+            name=name, player=by_name[name], proj=proj, vector=player_vector(proj),
+        )
+    return entries
+
+
+def build_whatif_base(
+    my_roster: list[dict],
+    league_rosters: list[dict],
+    fg_lookup: dict[str, PlayerProjection],
+    league_averages: dict[str, tuple[float, float]],
+    rank_map: dict[str, int],
+    my_team_key: str = "",
+    n_teams: int = 10,
+) -> WhatIfBase:
+    """
+    league_rosters: league_rosters.json teams (my team is skipped).
+    rank_map: team_key -> projected rank (standings trajectory).
+    """
+    my_players = _roster_entries(my_roster, fg_lookup)
+    my_team = build_team_projection([e.proj for e in my_players.values()])
+    cat_scores = score_team_categories(my_team, league_averages)
+
+    opponents: dict[str, OpponentState] = {}
+    for team in league_rosters:
+        tkey = team["team_key"]
+        if tkey == my_team_key:
+            continue
+        players = _roster_entries(team["players"], fg_lookup)
+        opp_team = build_team_projection([e.proj for e in players.values()])
+        needs = {
+            cs.cat: cs.z_score
+            for cs in score_team_categories(opp_team, league_averages)
+            if cs.z_score < -0.3
+        }
+        opponents[tkey] = OpponentState(
+            team_key=tkey,
+            team_name=team.get("team_name", tkey),
+            rank=rank_map.get(tkey, 5),
+            roster=team["players"],
+            vector=team_vector(opp_team),
+            values=cat_values(team_vector(opp_team)),
+            needs=needs,
+            players=players,
+        )
+
+    return WhatIfBase(
+        my_roster=my_roster,
+        my_vector=team_vector(my_team),
+        my_values=cat_values(team_vector(my_team)),
+        my_players=my_players,
+        cat_score_map={cs.cat: cs for cs in cat_scores},
+        league_averages=league_averages,
+        opponents=opponents,
+        n_teams=n_teams,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Proposal resolution
+# ---------------------------------------------------------------------------
+
+@dataclass
+class TradeProposal:
+    give: list[str]                 # my players
+    receive: list[str]              # their players
+    team: Optional[str] = None      # opposing team key or name (inferred if omitted)
+
+
+def _find(name: str, players: dict[str, object]) -> Optional[str]:
+    """Normalized key for name: exact, else a unique partial / last-name match."""
+    key = _normalize_name(name)
+    if key in players:
+        return key
+    partial = [k for k in players if key and key in k]
+    if len(partial) == 1:
+        return partial[0]
+    parts = key.split()
+    if parts:
+        last = [k for k in players if k.endswith(" " + parts[-1])]
+        if len(last) == 1:
+            return last[0]
+    return None
+
+
+def _resolve_team(
+    proposal: TradeProposal,
+    base: WhatIfBase,
+    owners: dict[str, list[str]],
+) -> OpponentState:
+    if proposal.team:
+        wanted = proposal.team.strip().lower()
+        for opp in base.opponents.values():
+            if opp.team_key.lower() == wanted or opp.team_name.lower() == wanted:
+                return opp
+        raise ValueError(f"Unknown opposing team: {proposal.team}")
+
+    # Infer from the receive players: the one team rostering all of them
+    candidates: Optional[set[str]] = None
+    for name in proposal.receive:
+        key = _find(name, owners)
+        if key is None:
+            raise ValueError(f"Player not on an opposing roster (or no projection): {name}")
+        teams = set(owners.get(key, []))
+        candidates = teams if candidates is None else candidates & teams
+    if not candidates:
+        raise ValueError("Receive players are not all on one opposing team; pass team")
+    if len(candidates) > 1:
+        raise ValueError("Receive players are on several teams; pass team")
+    return base.opponents[candidates.pop()]
+
+
+def _resolve(
+    proposal: TradeProposal,
+    base: WhatIfBase,
+    owners: dict[str, list[str]],
+) -> tuple[list[RosterEntry], list[RosterEntry], OpponentState]:
+    if not proposal.give or not proposal.receive:
+        raise ValueError("A trade needs at least one give and one receive player")
+    if len(proposal.give) > MAX_PLAYERS_PER_SIDE or len(proposal.receive) > MAX_PLAYERS_PER_SIDE:
+        raise ValueError(f"At most {MAX_PLAYERS_PER_SIDE} players per side")
+
+    give = []
+    for name in proposal.give:
+        key = _find(name, base.my_players)
+        if key is None:
+            raise ValueError(f"Player not on my roster (or no projection): {name}")
+        give.append(base.my_players[key])
+
+    opp = _resolve_team(proposal, base, owners)
+    receive = []
+    for name in proposal.receive:
+        key = _find(name, opp.players)
+        if key is None:
+            raise ValueError(f"Player not on {opp.team_name} (or no projection): {name}")
+        receive.append(opp.players[key])
+
+    if len({e.name for e in give}) != len(give) or len({e.name for e in receive}) != len(receive):
+        raise ValueError("A player is listed twice")
+    return give, receive, opp
+
+
+# ---------------------------------------------------------------------------
+# Scoring
+# ---------------------------------------------------------------------------
+
+def _category_score(
+    base: WhatIfBase, new_values: dict[str, float],
+) -> tuple[float, list[str], list[str], dict[str, float]]:
+    """multi_trade_engine._score_trade on precomputed category values."""
+    cats_improved, cats_hurt = [], []
+    cat_impacts: dict[str, float] = {}
+    score = 0.0
+    for cat in ALL_CATS:
+        delta = new_values[cat] - base.my_values[cat]
+        if cat in LOWER_IS_BETTER:
+            delta = -delta
+        cat_impacts[cat] = delta
+
+        cs = base.cat_score_map.get(cat)
+        if cs is None:
+            continue
+        league_stdev = cs.league_stdev if cs.league_stdev > 0 else 1.0
+        net_normalized = delta / league_stdev
+        if net_normalized > 0.02:
+            cats_improved.append(cat)
+            score += net_normalized * (1.0 + max(0.0, -cs.z_score))
+        elif net_normalized < -0.02:
+            cats_hurt.append(cat)
+            score -= abs(net_normalized) * (1.0 + max(0.0, cs.z_score))
+    return score, cats_improved, cats_hurt, cat_impacts
+
+
+def _need(base: WhatIfBase, opp: OpponentState, give: list[RosterEntry]) -> tuple[float, list[str]]:
+    """trade_acceptance._need_score on vectors."""
+    total_need = sum(abs(v) for v in opp.needs.values()) or 1.0
+    need_met = 0.0
+    cats_addressed: list[str] = []
+    for g in give:
+        new_values = cat_values(_add(opp.vector, g.vector))
+        for cat, z in opp.needs.items():
+            delta = new_values[cat] - opp.values[cat]
+            if cat in LOWER_IS_BETTER:
+                delta = -delta
+            _, stdev = base.league_averages.get(cat, (0.0, 1.0))
+            if stdev > 0 and delta / stdev > 0.1:
+                need_met += abs(z)
+                if cat not in cats_addressed:
+                    cats_addressed.append(cat)
+    return round(min(1.0, need_met / total_need), 3), cats_addressed
+
+
+def _balance(
+    base: WhatIfBase, my_new: dict[str, float], opp_new: dict[str, float],
+) -> tuple[float, str]:
+    """trade_acceptance._balance_score on precomputed category values."""
+    my_wins = 0
+    for cat in ALL_CATS:
+        _, stdev = base.league_averages.get(cat, (0.0, 1.0))
+        if project_category_matchup(cat, my_new[cat], opp_new[cat], stdev).result == "win":
+            my_wins += 1
+    return _balance_from_wins(my_wins, len(ALL_CATS))
+
+
+def evaluate_proposal(
+    base: WhatIfBase,
+    proposal: TradeProposal,
+    owners: Optional[dict[str, list[str]]] = None,
+) -> dict:
+    give, receive, opp = _resolve(proposal, base, owners or base.player_owner())
+
+    give_v = _sum(e.vector for e in give)
+    recv_v = _sum(e.vector for e in receive)
+    my_new = cat_values(_add(_sub(base.my_vector, give_v), recv_v))
+    opp_new = cat_values(_add(_sub(opp.vector, recv_v), give_v))
+
+    cat_score, improved, hurt, impacts = _category_score(base, my_new)
+    pos_mult = _position_fit_multiplier(
+        base.my_roster, [e.player for e in give], [e.player for e in receive],
+    )
+    trade_score = cat_score * pos_mult
+
+    acceptance = acceptance_from_factors(
+        opp_team_key=opp.team_key,
+        opp_team_name=opp.team_name,
+        opp_rank=opp.rank,
+        give_names=[e.proj.name for e in give],
+        receive_names=[e.proj.name for e in receive],
+        need=_need(base, opp, give),
+        redundancy=_redundancy_score([e.proj for e in receive], opp.roster),
+        motivation=_motivation_score(opp.rank, base.n_teams),
+        balance=_balance(base, my_new, opp_new),
+        desperation=_desperation_score(opp.rank, base.n_teams),
+    )
+
+    give_names = " + ".join(e.proj.name for e in give)
+    recv_names = " + ".join(e.proj.name for e in receive)
+    rationale = f"Give {give_names}, receive {recv_names} from {opp.team_name}."
+    if improved:
+        rationale += f" Improves: {', '.join(improved)}."
+    if hurt:
+        rationale += f" Costs: {', '.join(hurt)}."
+
+    return {
+        "trade_size": f"{len(give)}for{len(receive)}",
+        "opponent": opp.team_name,
+        "opponent_key": opp.team_key,
+        "give_players": [
+            {"name": e.proj.name, "team": e.proj.team, "type": e.proj.player_type, "adp": round(e.proj.adp, 1)}
+            for e in give
+        ],
+        "receive_players": [
+            {"name": e.proj.name, "team": e.proj.team, "type": e.proj.player_type, "adp": round(e.proj.adp, 1)}
+            for e in receive
+        ],
+        "trade_score": round(trade_score, 3),
+        "cat_score": round(cat_score, 3),
+        "position_multiplier": round(pos_mult, 3),
+        "cats_improved": improved,
+        "cats_hurt": hurt,
+        "cat_impacts": {k: round(v, 5 if k in ("AVG", "ERA", "WHIP") else 3) for k, v in impacts.items()},
+        "acceptance": acceptance_result_to_dict(acceptance),
+        "rationale": rationale,
+    }
+
+
+def evaluate_proposals(base: WhatIfBase, proposals: list[TradeProposal]) -> list[dict]:
+    """
+    One result per proposal, in order. A proposal that can't be resolved
+    (unknown player, ambiguous team, ...) gets {"error": ...} instead.
+    """
+    owners = base.player_owner()
+    results = []
+    for i, proposal in enumerate(proposals):
+        try:
+            result = evaluate_proposal(base, proposal, owners)
+        except ValueError as e:
+            result = {"error": str(e)}
+        results.append({"index": i, **result})
+    return results
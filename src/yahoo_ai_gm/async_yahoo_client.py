@@ -0,0 +1,115 @@
+"""
+src/yahoo_ai_gm/async_yahoo_client.py
+
+Async facade over YahooClient for fan-out pulls.
+
+The pull scripts issue independent GETs (one roster per team, metadata +
+stats per player chunk, several scoreboard weeks) that used to run back to
+back. AsyncYahooClient lets them be awaited together:
+
+  - at most `concurrency` requests in flight (asyncio.Semaphore)
+  - every request takes a token from the wrapped client's TokenBucket, the
+    same bucket its synchronous get() uses, so mixed sync/async callers
+    share one budget
+  - fresh responses in the wrapped client's HttpCache are returned
+    without a token or a request
+  - requests go through the wrapped client's requests.Session, whose
+    connection pool is sized for `concurrency`, on a dedicated thread pool
+
+requests is blocking, so each GET runs on that thread pool; the event loop
+only schedules and waits.
+
+Usage:
+    aclient = AsyncYahooClient.from_local_config()
+    xmls = run_sync(aclient.get_many(["team/.../roster", ...]))
+"""
+from __future__ import annotations
+
+import asyncio
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Iterable, Optional, TypeVar
+
+from yahoo_ai_gm.yahoo_client import DEFAULT_POOL_SIZE, YahooClient
+
+
+T = TypeVar("T")
+
+
+class AsyncYahooClient:
+    def __init__(self, client: YahooClient, concurrency: int = DEFAULT_POOL_SIZE):
+        self.client = client
+        self.settings = client.settings
+        self.concurrency = max(1, concurrency)
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.concurrency, thread_name_prefix="yahoo-http",
+        )
+        # Semaphores belong to one event loop; created per loop on first use
+        self._sems: dict[int, asyncio.Semaphore] = {}
+
+    @classmethod
+    def from_local_config(cls, concurrency: int = DEFAULT_POOL_SIZE) -> "AsyncYahooClient":
+        return cls(YahooClient.from_local_config(pool_size=concurrency), concurrency)
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        sem = self._sems.get(id(loop))
+        if sem is None:
+            sem = self._sems[id(loop)] = asyncio.Semaphore(self.concurrency)
+        return sem
+
+    async def get(
+        self, path: str, *, params: Optional[dict] = None, timeout: int = 30, use_cache: bool = True,
+    ) -> str:
+        """Same contract as YahooClient.get: raw XML text, raises on HTTP errors."""
+        cached = self.client.cached(path, params=params) if use_cache else None
+        if cached is not None:
+            return cached
+        async with self._semaphore():
+            if self.client.limiter is not None:
+                await self.client.limiter.acquire_async()
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self._executor,
+                functools.partial(self.client._get, path, params=params, timeout=timeout),
+            )
+
+    async def get_many(self, paths: Iterable[str], *, use_cache: bool = True) -> list[str]:
+        """GET every path concurrently; results in input order."""
+        return list(await asyncio.gather(*(self.get(p, use_cache=use_cache) for p in paths)))
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False)
+
+    async def __aenter__(self) -> "AsyncYahooClient":
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        self.close()
+
+
+def run_sync(coro: Awaitable[T]) -> T:
+    """
+    Run a coroutine from synchronous code (scripts, sync use cases). Uses a
+    private thread when the caller is already inside an event loop.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+
+    box: dict[str, Any] = {}
+
+    def _target() -> None:
+        try:
+            box["value"] = asyncio.run(coro)
+        except BaseException as e:  # re-raised in the caller's thread
+            box["error"] = e
+
+    thread = threading.Thread(target=_target)
+    thread.start()
+    thread.join()
+    if "error" in box:
+        raise box["error"]
+    return box["value"]
@@ -2,15 +2,24 @@ from __future__ import annotations
 
 import base64
 import json
+import os
+import threading
 import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 import requests
 
 YAHOO_TOKEN_URL = "https://api.login.yahoo.com/oauth2/get_token"
 
+# Overrides YAHOO_TOKEN_URL, e.g. to refresh against scripts/yahoo_standin.py
+TOKEN_URL_ENV = "YAHOO_TOKEN_URL"
+
+# TokenManager starts a background refresh this long before expiry
+# (Yahoo access tokens last an hour)
+REFRESH_AHEAD_SECONDS = 300
+
 
 @dataclass
 class OAuthTokens:
@@ -91,22 +100,13 @@ def refresh_access_token(
         "refresh_token": refresh_token,
     }
 
-    resp = requests.post(YAHOO_TOKEN_URL, headers=headers, data=data, timeout=timeout)
+    token_url = os.getenv(TOKEN_URL_ENV, "").strip() or YAHOO_TOKEN_URL
+    resp = requests.post(token_url, headers=headers, data=data, timeout=timeout)
     resp.raise_for_status()
     return resp.json()
 
 
-def get_valid_access_token(
-    *,
-    client_id: str,
-    client_secret: str,
-    token_path: Path,
-) -> str:
-    tokens = load_tokens(token_path)
-
-    if not tokens.is_expired():
-        return tokens.access_token
-
+def _refreshed_tokens(client_id: str, client_secret: str, tokens: OAuthTokens) -> OAuthTokens:
     payload = refresh_access_token(
         client_id=client_id,
         client_secret=client_secret,
@@ -114,12 +114,118 @@ def get_valid_access_token(
     )
 
     # Yahoo refresh response includes a new access_token and expires_in; refresh_token usually remains valid.
-    new_tokens = OAuthTokens(
+    return OAuthTokens(
         access_token=payload["access_token"],
         refresh_token=payload.get("refresh_token", tokens.refresh_token),
         expires_in=int(payload["expires_in"]),
         token_type=payload.get("token_type", "bearer"),
         saved_at=int(time.time()),
     )
+
+
+def get_valid_access_token(
+    *,
+    client_id: str,
+    client_secret: str,
+    token_path: Path,
+) -> str:
+    tokens = load_tokens(token_path)
+
+    if not tokens.is_expired():
+        return tokens.access_token
+
+    new_tokens = _refreshed_tokens(client_id, client_secret, tokens)
     save_tokens(token_path, new_tokens)
     return new_tokens.access_token
+
+
+class TokenManager:
+    """
+    Access token held in memory for a long-lived client.
+
+    get_valid_access_token reads the token file on every call and refreshes
+    inside the request that finds it expired. TokenManager reads the file
+    once, serves the cached token lock-free, and starts a background refresh
+    REFRESH_AHEAD_SECONDS before expiry, so requests only block on a refresh
+    if the token actually ran out (or on the very first load).
+
+    Processes coordinate through the token file: before refreshing, the
+    file is re-read, and if another process already saved a fresher token
+    (save_tokens replaces it atomically) that one is adopted instead.
+
+    A failed background refresh is recorded (refresh_failures, last_error;
+    see stats()) rather than raised: the current token is still valid.
+    """
+
+    def __init__(
+        self,
+        *,
+        client_id: str,
+        client_secret: str,
+        token_path: Path,
+        refresh_ahead_seconds: int = REFRESH_AHEAD_SECONDS,
+    ) -> None:
+        self.client_id = client_id
+        self.client_secret = client_secret
+        self.token_path = token_path
+        self.refresh_ahead_seconds = refresh_ahead_seconds
+        self._tokens: Optional[OAuthTokens] = None
+        self._lock = threading.Lock()          # held while loading / refreshing
+        self._state_lock = threading.Lock()    # guards _refreshing
+        self._refreshing = False
+        self.refresh_failures = 0
+        self.last_error: Optional[str] = None
+
+    def access_token(self) -> str:
+        tokens = self._tokens
+        if tokens is None or tokens.is_expired():
+            with self._lock:
+                tokens = self._tokens
+                if tokens is None or tokens.is_expired():
+                    tokens = self._load_or_refresh(skew_seconds=60)
+        elif tokens.is_expired(self.refresh_ahead_seconds):
+            self._refresh_in_background()
+        return tokens.access_token
+
+    def _load_or_refresh(self, skew_seconds: int) -> OAuthTokens:
+        """Caller holds _lock. Adopt the file's token if fresh enough, else refresh and save it."""
+        tokens = load_tokens(self.token_path)
+        if tokens.is_expired(skew_seconds):
+            tokens = _refreshed_tokens(self.client_id, self.client_secret, tokens)
+            save_tokens(self.token_path, tokens)
+        self._tokens = tokens
+        return tokens
+
+    def _refresh_in_background(self) -> None:
+        with self._state_lock:
+            if self._refreshing:
+                return
+            self._refreshing = True
+        threading.Thread(target=self._background_refresh, name="yahoo-token-refresh", daemon=True).start()
+
+    def _background_refresh(self) -> None:
+        try:
+            with self._lock:
+                tokens = self._tokens
+                if tokens is None or tokens.is_expired(self.refresh_ahead_seconds):
+                    self._load_or_refresh(skew_seconds=self.refresh_ahead_seconds)
+            with self._state_lock:
+                self.last_error = None
+        except Exception as e:
+            # The current token is still valid; a request that finds it
+            # expired retries the refresh in the foreground.
+            with self._state_lock:
+                self.refresh_failures += 1
+                self.last_error = f"{type(e).__name__}: {e}"
+        finally:
+            with self._state_lock:
+                self._refreshing = False
+
+    def stats(self) -> dict:
+        tokens = self._tokens
+        with self._state_lock:
+            return {
+                "expires_at": tokens.saved_at + tokens.expires_in if tokens is not None else None,
+                "refresh_failures": self.refresh_failures,
+                "last_error": self.last_error,
+            }
@@ -21,6 +21,8 @@ class MatchupSnapshot(BaseModel):
     my_team: TeamTotals
     opp_team: TeamTotals
     status: Optional[str] = None
+    week_start: Optional[str] = None
+    week_end: Optional[str] = None
 
 
 class PlayerSnapshot(BaseModel):
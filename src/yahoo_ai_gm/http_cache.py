@@ -0,0 +1,176 @@
+"""
+src/yahoo_ai_gm/http_cache.py
+
+On-disk cache for Yahoo GET responses.
+
+Most of what the timers and scripts download barely changes between runs:
+league settings (stat categories), team lists, last-season player stats.
+HttpCache sits under YahooClient.get and serves those from disk while they
+are fresh. Entries are keyed by base URL + path + sorted params and stored
+gzip-compressed at
+
+    data/http_cache/<key[:2]>/<key>.xml.gz
+
+The file's mtime is its fetch time. Freshness is decided on read from
+TTL_RULES (first match wins), so changing a TTL applies to existing
+entries. Paths no rule matches (scoreboards, transactions, free-agent
+lists, ...) are never cached.
+
+Writes invalidate: invalidate(resource, league_key) touches
+data/http_cache/invalidated/<resource>.<league_key>, and entries of that
+resource for the league's team/ and league/ paths fetched before the
+marker's mtime are then stale in every process sharing the directory.
+YahooClient.post calls it for rosters after a league transaction.
+
+Env:
+  YAHOO_HTTP_CACHE=0        disable the cache
+  YAHOO_HTTP_CACHE_DIR=...  cache directory (default data/http_cache)
+"""
+from __future__ import annotations
+
+import gzip
+import hashlib
+import os
+import re
+import threading
+import time
+from datetime import date
+from pathlib import Path
+from typing import Optional
+from urllib.parse import urlencode
+
+
+CACHE_DIR = Path(os.getenv("YAHOO_HTTP_CACHE_DIR", "data/http_cache"))
+CACHE_ENABLED = os.getenv("YAHOO_HTTP_CACHE", "1").strip() != "0"
+
+PERMANENT = float("inf")
+MINUTE = 60
+DAY = 24 * 60 * MINUTE
+SEASON = 200 * DAY
+
+# (resource, pattern, ttl seconds) — first match wins
+TTL_RULES: list[tuple[str, re.Pattern, float]] = [
+    ("lastseason_stats", re.compile(r"/stats;type=lastseason"), PERMANENT),
+    ("settings",         re.compile(r"^league/[^/]+/settings$"), SEASON),
+    ("teams",            re.compile(r"^league/[^/]+/teams$"), DAY),
+    ("games",            re.compile(r"^users;use_login=1/games$"), DAY),
+    ("roster",           re.compile(r"^team/[^/]+/roster(;[^/]*)?(/players)?$"), 5 * MINUTE),
+]
+
+# League a team/ or league/ path belongs to (team keys extend the league key)
+_LEAGUE_RE = re.compile(r"^(?:team|league)/(\d+\.l\.\d+)")
+
+# Explicit past seasons (…/stats;type=season;season=2025) never change either
+_SEASON_RE = re.compile(r"/stats;type=season;season=(\d{4})")
+
+
+def ttl_for(path: str) -> tuple[Optional[str], Optional[float]]:
+    """(resource, ttl) for a request path; (None, None) if it is not cacheable."""
+    path = path.lstrip("/")
+    m = _SEASON_RE.search(path)
+    if m and int(m.group(1)) < date.today().year:
+        return "past_season_stats", PERMANENT
+    for resource, pattern, ttl in TTL_RULES:
+        if pattern.search(path):
+            return resource, ttl
+    return None, None
+
+
+def league_of(path: str) -> Optional[str]:
+    m = _LEAGUE_RE.match(path.lstrip("/"))
+    return m.group(1) if m else None
+
+
+def cache_key(base_url: str, path: str, params: Optional[dict] = None) -> str:
+    raw = base_url + path.lstrip("/")
+    if params:
+        raw += "?" + urlencode(sorted((str(k), str(v)) for k, v in params.items()))
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+class HttpCache:
+    def __init__(self, root: Path = CACHE_DIR):
+        self.root = Path(root)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.bypassed = 0
+        self.stores = 0
+        self.invalidations = 0
+        self.by_resource: dict[str, dict[str, int]] = {}
+
+    def _file(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.xml.gz"
+
+    def _marker(self, resource: str, league_key: str) -> Path:
+        return self.root / "invalidated" / f"{resource}.{league_key}"
+
+    def _invalidated_at(self, resource: str, path: str) -> float:
+        league_key = league_of(path)
+        if league_key is None:
+            return 0.0
+        try:
+            return self._marker(resource, league_key).stat().st_mtime
+        except OSError:
+            return 0.0
+
+    def _count(self, resource: Optional[str], outcome: str) -> None:
+        with self._lock:
+            if resource is None:
+                self.bypassed += 1
+                return
+            setattr(self, outcome, getattr(self, outcome) + 1)
+            counts = self.by_resource.setdefault(resource, {"hits": 0, "misses": 0})
+            counts[outcome] += 1
+
+    def get(self, base_url: str, path: str, params: Optional[dict] = None) -> Optional[str]:
+        """Cached body if the path is cacheable and the entry is fresh, else None."""
+        resource, ttl = ttl_for(path)
+        if resource is None:
+            self._count(None, "bypassed")
+            return None
+        f = self._file(cache_key(base_url, path, params))
+        try:
+            fetched = f.stat().st_mtime
+            if time.time() - fetched > ttl or fetched <= self._invalidated_at(resource, path):
+                raise FileNotFoundError(f)
+            body = gzip.decompress(f.read_bytes()).decode("utf-8")
+        except (OSError, EOFError):
+            # Missing, stale, or a torn/corrupt file: refetch and overwrite
+            self._count(resource, "misses")
+            return None
+        self._count(resource, "hits")
+        return body
+
+    def put(self, base_url: str, path: str, params: Optional[dict], body: str) -> None:
+        resource, _ = ttl_for(path)
+        if resource is None:
+            return
+        f = self._file(cache_key(base_url, path, params))
+        f.parent.mkdir(parents=True, exist_ok=True)
+        tmp = f.with_name(f"{f.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.write_bytes(gzip.compress(body.encode("utf-8")))
+        tmp.replace(f)
+        with self._lock:
+            self.stores += 1
+
+    def invalidate(self, resource: str, league_key: str) -> None:
+        """Mark every cached `resource` entry of league_key fetched until now as stale."""
+        marker = self._marker(resource, league_key)
+        marker.parent.mkdir(parents=True, exist_ok=True)
+        marker.touch()
+        os.utime(marker)
+        with self._lock:
+            self.invalidations += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "dir": str(self.root),
+                "hits": self.hits,
+                "misses": self.misses,
+                "bypassed": self.bypassed,
+                "stores": self.stores,
+                "invalidations": self.invalidations,
+                "by_resource": {k: dict(v) for k, v in self.by_resource.items()},
+            }
@@ -0,0 +1,76 @@
+"""
+src/yahoo_ai_gm/league_rosters.py
+
+Helpers for data/league_rosters.json (written by scripts/pull_league_rosters.py).
+
+Each team entry carries a roster_hash: a digest of its players (key, MLB
+team, position, status). Per-team caches (e.g. team projections in
+use_cases/context.py) key on it, so a roster update only recomputes the
+teams whose hash changed.
+
+apply_transactions() updates stored rosters from the league transactions
+feed instead of re-pulling every team: a player leaves source_team_key and
+joins destination_team_key (adds, drops, and both sides of a trade alike).
+Applying a transaction twice is a no-op.
+"""
+from __future__ import annotations
+
+import hashlib
+from typing import Iterable
+
+from yahoo_ai_gm.transactions import Transaction
+
+HASH_FIELDS = ("player_key", "mlb_team", "display_position", "status")
+
+
+def roster_hash(players: list[dict]) -> str:
+    rows = sorted("|".join(str(p.get(f, "")) for f in HASH_FIELDS) for p in players)
+    return hashlib.sha1("\n".join(rows).encode("utf-8")).hexdigest()[:16]
+
+
+def team_roster_hash(team: dict) -> str:
+    """Stored hash if present (files from before hashes were written fall back to computing it)."""
+    return team.get("roster_hash") or roster_hash(team.get("players", []))
+
+
+def with_hashes(teams: list[dict]) -> list[dict]:
+    for t in teams:
+        t["roster_hash"] = roster_hash(t.get("players", []))
+    return teams
+
+
+def apply_transactions(teams: list[dict], transactions: Iterable[Transaction]) -> set[str]:
+    """
+    Apply transactions (any order given; applied oldest first) to teams in
+    place and refresh their roster_hash. Returns the team_keys whose roster
+    actually changed.
+    """
+    by_team = {t["team_key"]: t for t in teams}
+    before = {k: team_roster_hash(t) for k, t in by_team.items()}
+
+    for tx in sorted(transactions, key=lambda tx: tx.timestamp):
+        for p in tx.players:
+            moved = None
+            src = by_team.get(p.source_team_key or "")
+            if src is not None:
+                for i, existing in enumerate(src["players"]):
+                    if existing.get("player_key") == p.player_key:
+                        moved = src["players"].pop(i)
+                        break
+            dst = by_team.get(p.destination_team_key or "")
+            if dst is None or any(e.get("player_key") == p.player_key for e in dst["players"]):
+                continue
+            dst["players"].append(moved or {
+                "player_key": p.player_key,
+                "full_name": p.name,
+                "mlb_team": p.mlb_team,
+                "display_position": p.display_position,
+                "status": "OK",
+            })
+
+    changed = set()
+    for key, team in by_team.items():
+        team["roster_hash"] = roster_hash(team.get("players", []))
+        if team["roster_hash"] != before[key]:
+            changed.add(key)
+    return changed
@@ -0,0 +1,83 @@
+"""
+src/yahoo_ai_gm/player_stats.py
+
+Batched player stats fetches.
+
+Yahoo's players collection takes up to 25 keys per request
+(players;player_keys=k1,k2,.../stats), so enriching a pool costs one request
+per 25 players instead of one per player. Chunks are fetched concurrently
+through an AsyncYahooClient (bounded concurrency + shared rate limit) and
+the combined response is split back into per-player stat maps.
+"""
+from __future__ import annotations
+
+import asyncio
+from typing import Callable, Iterable, Optional
+
+from yahoo_ai_gm.async_yahoo_client import AsyncYahooClient
+from yahoo_ai_gm.yahoo_xml import iter_records, stat_values, text
+
+# Yahoo's limit for player_keys in one collection request
+MAX_KEYS_PER_REQUEST = 25
+
+
+def chunked(keys: list[str], n: int = MAX_KEYS_PER_REQUEST) -> list[list[str]]:
+    return [keys[i:i + n] for i in range(0, len(keys), n)]
+
+
+def stats_path(
+    player_keys: Iterable[str],
+    stats_type: Optional[str] = None,
+    season: Optional[int] = None,
+) -> str:
+    """players;player_keys=.../stats[;type=...][;season=...]"""
+    path = "players;player_keys=" + ",".join(player_keys) + "/stats"
+    if stats_type:
+        path += f";type={stats_type}"
+    if season is not None:
+        path += f";season={season}"
+    return path
+
+
+def parse_stats_by_player(xml_text: str) -> dict[str, dict[str, str]]:
+    """{player_key: {stat_id: value}} for every <player> in a collection response."""
+    out: dict[str, dict[str, str]] = {}
+    for player in iter_records(xml_text, "player"):
+        key = text(player, "player_key")
+        if key:
+            out[key] = stat_values(player)
+    return out
+
+
+async def fetch_stats_by_player(
+    aclient: AsyncYahooClient,
+    player_keys: list[str],
+    stats_type: Optional[str] = None,
+    season: Optional[int] = None,
+    chunk_size: int = MAX_KEYS_PER_REQUEST,
+    on_chunk: Optional[Callable[[list[str], Optional[Exception]], None]] = None,
+) -> tuple[dict[str, dict[str, str]], dict[str, str]]:
+    """
+    Returns (stats, errors): stats maps player_key -> {stat_id: value};
+    errors maps player_key -> message for keys whose chunk failed. Keys
+    Yahoo returns no <player> for are simply absent from stats.
+    on_chunk(keys, error) is called as each chunk finishes.
+    """
+    stats: dict[str, dict[str, str]] = {}
+    errors: dict[str, str] = {}
+
+    async def _chunk(keys: list[str]) -> None:
+        try:
+            xml_text = await aclient.get(stats_path(keys, stats_type, season))
+            stats.update(parse_stats_by_player(xml_text))
+        except Exception as e:
+            for k in keys:
+                errors[k] = str(e)
+            if on_chunk is not None:
+                on_chunk(keys, e)
+            return
+        if on_chunk is not None:
+            on_chunk(keys, None)
+
+    await asyncio.gather(*(_chunk(keys) for keys in chunked(player_keys, chunk_size)))
+    return stats, errors
@@ -0,0 +1,117 @@
+"""
+src/yahoo_ai_gm/rate_limit.py
+
+Token-bucket rate limiter for Yahoo API calls.
+
+One bucket is shared by everything that talks to Yahoo through a client:
+plain threads call acquire(), asyncio tasks await acquire_async(). Tokens
+refill continuously at `rate` per second up to `burst`; a caller that finds
+the bucket empty reserves the next token and sleeps until it is due, so
+waiters are served in arrival order without busy-polling.
+
+The rate adapts (AIMD) between min_rate and max_rate: a throttled response
+penalize()s the bucket, halving the rate and pausing every caller for the
+Retry-After delay, and each success reward()s it with a small additive
+step back towards max_rate. Bulk pulls therefore settle just under the
+rate Yahoo actually accepts instead of a conservative fixed one.
+"""
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from typing import Optional
+
+
+class TokenBucket:
+    def __init__(
+        self,
+        rate: float,
+        burst: int = 1,
+        min_rate: Optional[float] = None,
+        max_rate: Optional[float] = None,
+        decrease: float = 0.5,
+        increase: Optional[float] = None,
+    ):
+        """
+        rate: requests per second (<= 0 disables limiting). burst: bucket size.
+        min_rate / max_rate: adaptive bounds (default rate / 10 and rate).
+        decrease: factor applied on penalize(). increase: added per reward()
+        (default 1% of max_rate).
+        """
+        self.rate = float(rate)
+        self.burst = max(1, int(burst))
+        self.max_rate = float(max_rate) if max_rate is not None else self.rate
+        self.min_rate = float(min_rate) if min_rate is not None else self.rate / 10
+        self.decrease = decrease
+        self.increase = increase if increase is not None else self.max_rate / 100
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        self.acquired = 0
+        self.waited_seconds = 0.0
+        self.penalties = 0
+        self.paused_seconds = 0.0
+
+    def reserve(self) -> float:
+        """Take one token; return how long the caller must wait before using it."""
+        with self._lock:
+            self.acquired += 1
+            if self.rate <= 0:
+                return 0.0
+            now = time.monotonic()
+            # _updated is in the future while a penalty pause is in effect
+            if now > self._updated:
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+            self._tokens -= 1.0
+            # Negative balance = tokens already promised to earlier waiters
+            wait = (self._updated - now) + max(0.0, -self._tokens) / self.rate
+            if wait > 0:
+                self.waited_seconds += wait
+            return max(0.0, wait)
+
+    def acquire(self) -> None:
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self) -> None:
+        wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def penalize(self, pause_seconds: float = 0.0) -> None:
+        """Throttled: cut the rate and hold every caller for pause_seconds."""
+        if self.rate <= 0:
+            # Unlimited bucket: nothing to pause, so the caller just waits
+            if pause_seconds > 0:
+                time.sleep(pause_seconds)
+            return
+        with self._lock:
+            self.penalties += 1
+            self.rate = max(self.min_rate, self.rate * self.decrease)
+            now = time.monotonic()
+            resume = now + max(0.0, pause_seconds)
+            if resume > self._updated:
+                self.paused_seconds += resume - max(now, self._updated)
+                self._updated = resume
+                self._tokens = min(self._tokens, 0.0)
+
+    def reward(self) -> None:
+        """A request went through: step the rate back up towards max_rate."""
+        with self._lock:
+            if 0 < self.rate < self.max_rate:
+                self.rate = min(self.max_rate, self.rate + self.increase)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "rate": round(self.rate, 3),
+                "max_rate": self.max_rate,
+                "burst": self.burst,
+                "acquired": self.acquired,
+                "waited_seconds": round(self.waited_seconds, 3),
+                "penalties": self.penalties,
+                "paused_seconds": round(self.paused_seconds, 3),
+            }
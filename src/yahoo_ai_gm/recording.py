@@ -0,0 +1,80 @@
+"""
+src/yahoo_ai_gm/recording.py
+
+Yahoo API fixtures: recorded by YahooClient, replayed by scripts/yahoo_standin.py.
+
+With YAHOO_RECORD_DIR set, YahooClient.from_local_config attaches a
+FixtureRecorder and every response it returns (network or HTTP cache) is
+written to
+
+    {YAHOO_RECORD_DIR}/{key}.xml     response body
+    {YAHOO_RECORD_DIR}/{key}.json    method, path, params, status, recorded_at
+
+where key = fixture_key(method, path, params). The stand-in server computes
+the same key from the request it receives, so a recorded session replays
+against any base URL (YAHOO_API_BASE) with no network.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterable, Optional
+from urllib.parse import urlencode
+
+RECORD_DIR_ENV = "YAHOO_RECORD_DIR"
+
+
+def fixture_key(method: str, path: str, params: Optional[Iterable[tuple[str, str]]] = None) -> str:
+    """method + path (no base URL, no leading slash) + sorted query params."""
+    raw = f"{method.upper()} {path.lstrip('/')}"
+    items = sorted((str(k), str(v)) for k, v in (params or ()))
+    if items:
+        raw += "?" + urlencode(items)
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+class FixtureRecorder:
+    def __init__(self, root: Path):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self.recorded = 0
+
+    def save(self, method: str, path: str, params: Optional[dict], status: int, body: str) -> None:
+        key = fixture_key(method, path, (params or {}).items())
+        meta = {
+            "method": method.upper(),
+            "path": path.lstrip("/"),
+            "params": params or {},
+            "status": status,
+            "recorded_at": datetime.now(tz=timezone.utc).isoformat(),
+        }
+        tag = f"{os.getpid()}.{threading.get_ident()}.tmp"
+        for suffix, data in ((".xml", body), (".json", json.dumps(meta, indent=2))):
+            f = self.root / f"{key}{suffix}"
+            tmp = f.with_name(f"{f.name}.{tag}")
+            tmp.write_text(data, encoding="utf-8")
+            tmp.replace(f)
+        with self._lock:
+            self.recorded += 1
+
+
+def recorder_from_env() -> Optional[FixtureRecorder]:
+    root = os.getenv(RECORD_DIR_ENV, "").strip()
+    return FixtureRecorder(Path(root)) if root else None
+
+
+def load_fixture(root: Path, key: str) -> Optional[tuple[int, str]]:
+    """(status, body) for a recorded key, or None."""
+    body = Path(root) / f"{key}.xml"
+    if not body.exists():
+        return None
+    meta_path = Path(root) / f"{key}.json"
+    status = 200
+    if meta_path.exists():
+        status = int(json.loads(meta_path.read_text(encoding="utf-8")).get("status", 200))
+    return status, body.read_text(encoding="utf-8")
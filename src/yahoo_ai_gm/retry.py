@@ -0,0 +1,160 @@
+"""
+src/yahoo_ai_gm/retry.py
+
+Retry with jittered exponential backoff for HTTP calls.
+
+YahooClient routes every request through send_with_retry(); other HTTP
+callers (e.g. scripts/pull_fg_projections.py) can use it too, so the
+policy is defined once:
+
+  - 429 and 999 (Yahoo's "request denied" throttle) wait for Retry-After
+    when given, else the backoff delay, and tell the shared TokenBucket
+    to slow down (penalize)
+  - 500/502/503/504 and connection errors / timeouts back off and retry,
+    but only for idempotent requests: a POST is only retried on a
+    throttle status, where Yahoo rejected it without applying it
+  - successes let the bucket creep back up towards its ceiling (reward)
+
+Backoff is "full jitter": uniform(0, min(max_delay, base_delay * 2**n)),
+so concurrent callers that fail together do not retry in lockstep.
+"""
+from __future__ import annotations
+
+import random
+import threading
+import time
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Callable, Optional
+
+import requests
+
+from yahoo_ai_gm.rate_limit import TokenBucket
+
+THROTTLE_STATUSES = frozenset({429, 999})
+RETRY_STATUSES = frozenset({500, 502, 503, 504})
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    max_attempts: int = 5
+    base_delay: float = 0.5
+    max_delay: float = 30.0
+
+    def backoff(self, attempt: int) -> float:
+        """Delay before retry number attempt + 1 (attempt counts from 0)."""
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+
+class RetryStats:
+    """Thread-safe counters for one client."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.retries = 0
+        self.throttled = 0
+        self.throttle_seconds = 0.0
+        self.backoff_seconds = 0.0
+        self.failures = 0
+
+    def add(self, **counts: float) -> None:
+        with self._lock:
+            for name, n in counts.items():
+                setattr(self, name, getattr(self, name) + n)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "retries": self.retries,
+                "throttled": self.throttled,
+                "throttle_seconds": round(self.throttle_seconds, 3),
+                "backoff_seconds": round(self.backoff_seconds, 3),
+                "failures": self.failures,
+            }
+
+
+def retry_after_seconds(resp: requests.Response) -> Optional[float]:
+    """Retry-After as seconds (delta-seconds or HTTP-date), None if absent / unparseable."""
+    value = (resp.headers.get("Retry-After") or "").strip()
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def _raise_for_status(resp: requests.Response) -> None:
+    # requests only raises for 4xx/5xx; Yahoo's 999 throttle is outside that range
+    if resp.status_code >= 600:
+        raise requests.HTTPError(f"{resp.status_code} Request denied (throttled) for url: {resp.url}", response=resp)
+    resp.raise_for_status()
+
+
+def send_with_retry(
+    send: Callable[[], requests.Response],
+    policy: RetryPolicy = RetryPolicy(),
+    *,
+    idempotent: bool = True,
+    limiter: Optional[TokenBucket] = None,
+    stats: Optional[RetryStats] = None,
+) -> requests.Response:
+    """
+    Call send() until it succeeds or the policy gives up; returns the
+    response (raise_for_status already applied). The caller takes the
+    limiter token for the first attempt; each retry takes its own.
+    """
+    stats = stats or RetryStats()
+    for attempt in range(policy.max_attempts):
+        last = attempt == policy.max_attempts - 1
+        if attempt > 0 and limiter is not None:
+            limiter.acquire()
+        stats.add(requests=1)
+
+        try:
+            resp = send()
+        except (requests.ConnectionError, requests.Timeout):
+            if last or not idempotent:
+                stats.add(failures=1)
+                raise
+            delay = policy.backoff(attempt)
+            stats.add(retries=1, backoff_seconds=delay)
+            time.sleep(delay)
+            continue
+
+        if resp.status_code in THROTTLE_STATUSES:
+            delay = retry_after_seconds(resp)
+            if delay is None:
+                delay = policy.backoff(attempt)
+            stats.add(throttled=1, throttle_seconds=delay)
+            if last:
+                stats.add(failures=1)
+                _raise_for_status(resp)
+            stats.add(retries=1)
+            if limiter is not None:
+                # Pauses every caller sharing the bucket, not just this one
+                limiter.penalize(delay)
+            else:
+                time.sleep(delay)
+            continue
+
+        if resp.status_code in RETRY_STATUSES and idempotent and not last:
+            delay = policy.backoff(attempt)
+            stats.add(retries=1, backoff_seconds=delay)
+            time.sleep(delay)
+            continue
+
+        if resp.status_code >= 400:
+            stats.add(failures=1)
+        elif limiter is not None:
+            limiter.reward()
+        _raise_for_status(resp)
+        return resp
+
+    raise RuntimeError("unreachable")
@@ -120,4 +120,11 @@ def _parse_matchup(*, week: int, my_team_key: str, scoreboard_raw: Any) -> Match
     opp = parse_team(opp_team_raw)
     matchup_status = str(matchup.get("status") or "").strip() or None
 
-    return MatchupSnapshot(week=week, my_team=my, opp_team=opp, status=matchup_status)
+    return MatchupSnapshot(
+        week=week,
+        my_team=my,
+        opp_team=opp,
+        status=matchup_status,
+        week_start=str(matchup.get("week_start") or "") or None,
+        week_end=str(matchup.get("week_end") or "") or None,
+    )
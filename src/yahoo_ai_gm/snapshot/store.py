@@ -1,9 +1,39 @@
+"""
+src/yahoo_ai_gm/snapshot/store.py
+
+Snapshot persistence.
+
+Parsed snapshots are kept in a small LRU keyed by (week, file mtime), and the
+newest week is tracked by a pointer file (data/snapshots/latest_week.json)
+that save_snapshot maintains, so serving the latest snapshot does not glob
+the directory or re-run pydantic validation. Freshness is re-checked with a
+stat at most every STAT_TTL seconds, which picks up snapshots written by
+other processes (the refresh timers).
+
+Cached Snapshot objects are shared between callers; treat them as read-only.
+"""
 from __future__ import annotations
 
+import json
+import threading
+import time
+from collections import OrderedDict
 from pathlib import Path
+from typing import Optional
+
 from yahoo_ai_gm.domain.models import Snapshot
 
 SNAPSHOT_DIR = Path("data/snapshots")
+LATEST_POINTER = "latest_week.json"
+
+CACHE_SIZE = 8
+STAT_TTL = 2.0
+
+# path -> (mtime_ns, checked_at, Snapshot)
+_cache: "OrderedDict[Path, tuple[int, float, Snapshot]]" = OrderedDict()
+# snapshot dir -> (checked_at, pointer mtime_ns, latest week)
+_latest: dict[Path, tuple[float, int, Optional[int]]] = {}
+_lock = threading.Lock()
 
 
 def snapshot_path(week: int) -> Path:
@@ -11,15 +41,118 @@ def snapshot_path(week: int) -> Path:
     return SNAPSHOT_DIR / f"week_{week}.snapshot.json"
 
 
+def _week_path(week: int, snapshot_dir: Path) -> Path:
+    return snapshot_dir / f"week_{week}.snapshot.json"
+
+
+def _mtime_ns(path: Path) -> Optional[int]:
+    try:
+        return path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+def _remember(path: Path, mtime_ns: int, snap: Snapshot) -> None:
+    with _lock:
+        _cache[path] = (mtime_ns, time.monotonic(), snap)
+        _cache.move_to_end(path)
+        while len(_cache) > CACHE_SIZE:
+            _cache.popitem(last=False)
+
+
 def save_snapshot(snapshot: Snapshot) -> Path:
     path = snapshot_path(snapshot.week)
     # Pydantic v2: model_dump_json supports indent but not sort_keys in your version.
-    path.write_text(snapshot.model_dump_json(indent=2), encoding="utf-8")
+    tmp = path.with_suffix(".json.tmp")
+    tmp.write_text(snapshot.model_dump_json(indent=2), encoding="utf-8")
+    tmp.replace(path)
+    _remember(path, path.stat().st_mtime_ns, snapshot)
+    _update_latest(SNAPSHOT_DIR, snapshot.week)
     return path
 
 
-def load_snapshot(week: int) -> Snapshot:
-    path = snapshot_path(week)
-    if not path.exists():
+def load_snapshot(week: int, snapshot_dir: Path = SNAPSHOT_DIR) -> Snapshot:
+    path = _week_path(week, snapshot_dir)
+    now = time.monotonic()
+    with _lock:
+        entry = _cache.get(path)
+        if entry is not None and now - entry[1] < STAT_TTL:
+            _cache.move_to_end(path)
+            return entry[2]
+
+    mtime = _mtime_ns(path)
+    if mtime is None:
         raise FileNotFoundError(f"No snapshot found at {path}. Run refresh first.")
-    return Snapshot.model_validate_json(path.read_text(encoding="utf-8"))
+    if entry is not None and entry[0] == mtime:
+        _remember(path, mtime, entry[2])
+        return entry[2]
+
+    snap = Snapshot.model_validate_json(path.read_text(encoding="utf-8"))
+    _remember(path, mtime, snap)
+    return snap
+
+
+# ---------------------------------------------------------------------------
+# Latest-week pointer
+# ---------------------------------------------------------------------------
+
+def _scan_latest(snapshot_dir: Path) -> Optional[int]:
+    weeks = []
+    for f in snapshot_dir.glob("week_*.snapshot.json"):
+        try:
+            weeks.append(int(f.name.split("_")[1].split(".")[0]))
+        except (IndexError, ValueError):
+            continue
+    return max(weeks) if weeks else None
+
+
+def _write_pointer(snapshot_dir: Path, week: int) -> None:
+    pointer = snapshot_dir / LATEST_POINTER
+    tmp = pointer.with_suffix(".json.tmp")
+    tmp.write_text(json.dumps({"week": week}), encoding="utf-8")
+    tmp.replace(pointer)
+
+
+def _update_latest(snapshot_dir: Path, week: int) -> None:
+    current = latest_week(snapshot_dir)
+    if current is None or week >= current:
+        _write_pointer(snapshot_dir, week)
+        pointer_mtime = _mtime_ns(snapshot_dir / LATEST_POINTER) or 0
+        with _lock:
+            _latest[snapshot_dir] = (time.monotonic(), pointer_mtime, week)
+
+
+def latest_week(snapshot_dir: Path = SNAPSHOT_DIR) -> Optional[int]:
+    """
+    Newest snapshot week, or None if there are no snapshots. Reads the pointer
+    file; rebuilds it from a directory scan if it is missing or unreadable.
+    """
+    now = time.monotonic()
+    with _lock:
+        entry = _latest.get(snapshot_dir)
+    if entry is not None and now - entry[0] < STAT_TTL:
+        return entry[2]
+
+    pointer = snapshot_dir / LATEST_POINTER
+    mtime = _mtime_ns(pointer)
+    if entry is not None and mtime is not None and mtime == entry[1]:
+        week = entry[2]
+    else:
+        week = None
+        if mtime is not None:
+            try:
+                week = int(json.loads(pointer.read_text(encoding="utf-8"))["week"])
+            except (ValueError, KeyError, TypeError, FileNotFoundError):
+                week = None
+        if week is None or not _week_path(week, snapshot_dir).exists():
+            week = _scan_latest(snapshot_dir) if snapshot_dir.exists() else None
+            if week is not None:
+                try:
+                    _write_pointer(snapshot_dir, week)
+                    mtime = _mtime_ns(pointer)
+                except OSError:
+                    pass
+
+    with _lock:
+        _latest[snapshot_dir] = (now, mtime or 0, week)
+    return week
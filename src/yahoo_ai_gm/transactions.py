@@ -0,0 +1,109 @@
+"""
+src/yahoo_ai_gm/transactions.py
+
+League transactions feed (adds, drops, trades) since a cursor.
+
+Yahoo returns league/{league_key}/transactions newest first, in pages.
+fetch_transactions_since() walks pages until it reaches a transaction at or
+before the cursor timestamp, so an incremental sync reads only what
+happened since its last run. If MAX_PAGES pass without reaching the cursor,
+the result is marked incomplete (a gap): callers should fall back to a full
+pull instead of trusting a partial diff.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Optional
+
+from yahoo_ai_gm.async_yahoo_client import AsyncYahooClient
+from yahoo_ai_gm.yahoo_xml import findall, iter_records, text
+
+PAGE_SIZE = 25
+MAX_PAGES = 20
+
+
+@dataclass
+class TransactionPlayer:
+    player_key: str
+    name: str
+    type: str                       # add / drop
+    source_type: str                # freeagents / waivers / team
+    destination_type: str           # team / waivers / freeagents
+    source_team_key: Optional[str] = None
+    destination_team_key: Optional[str] = None
+    mlb_team: str = ""
+    display_position: str = ""
+
+
+@dataclass
+class Transaction:
+    transaction_key: str
+    type: str                       # add / drop / add/drop / trade / commish
+    status: str                     # successful / pending / ...
+    timestamp: int
+    players: list[TransactionPlayer] = field(default_factory=list)
+
+
+@dataclass
+class TransactionsPage:
+    transactions: list[Transaction]   # newest first, all newer than or at the cursor
+    complete: bool                    # False if MAX_PAGES ran out before the cursor
+    newest_timestamp: Optional[int]
+
+
+def transactions_path(league_key: str, start: int = 0, count: int = PAGE_SIZE) -> str:
+    return f"league/{league_key}/transactions;start={start};count={count}"
+
+
+def parse_transactions(xml: str) -> list[Transaction]:
+    out: list[Transaction] = []
+    for tx in iter_records(xml, "transaction"):
+        players = []
+        for p in findall(tx, "players/player"):
+            players.append(TransactionPlayer(
+                player_key=text(p, "player_key"),
+                name=text(p, "name/full"),
+                type=text(p, "transaction_data/type"),
+                source_type=text(p, "transaction_data/source_type"),
+                destination_type=text(p, "transaction_data/destination_type"),
+                source_team_key=text(p, "transaction_data/source_team_key") or None,
+                destination_team_key=text(p, "transaction_data/destination_team_key") or None,
+                mlb_team=text(p, "editorial_team_abbr"),
+                display_position=text(p, "display_position"),
+            ))
+        out.append(Transaction(
+            transaction_key=text(tx, "transaction_key"),
+            type=text(tx, "type"),
+            status=text(tx, "status"),
+            timestamp=int(text(tx, "timestamp", "0") or 0),
+            players=[p for p in players if p.player_key],
+        ))
+    return out
+
+
+async def fetch_transactions_since(
+    aclient: AsyncYahooClient,
+    league_key: str,
+    since: Optional[int],
+    max_pages: int = MAX_PAGES,
+) -> TransactionsPage:
+    """
+    Successful transactions with timestamp >= since (None: just the newest
+    page, to seed a cursor). Transactions at exactly `since` are returned
+    again; callers' updates are idempotent, so a same-second transaction
+    that landed after the last run is not missed.
+    """
+    found: list[Transaction] = []
+    newest: Optional[int] = None
+    for page in range(max_pages):
+        batch = parse_transactions(await aclient.get(transactions_path(league_key, page * PAGE_SIZE)))
+        if newest is None and batch:
+            newest = batch[0].timestamp
+        reached = since is None or any(tx.timestamp < since for tx in batch)
+        found.extend(
+            tx for tx in batch
+            if tx.status == "successful" and (since is None or tx.timestamp >= since)
+        )
+        if reached or len(batch) < PAGE_SIZE:
+            return TransactionsPage(found, complete=True, newest_timestamp=newest)
+    return TransactionsPage(found, complete=False, newest_timestamp=newest)
@@ -0,0 +1,267 @@
+"""
+src/yahoo_ai_gm/use_cases/context.py
+
+Layer 4 — Orchestration.
+
+Request-scoped computation graph shared by use cases.
+
+Several use cases depend on the same intermediate results: the acceptance
+report needs standings and 1-for-1 suggestions, league intelligence and
+streaming need standings, and the daily report runs all of them back to back.
+Without sharing, every use case reloads the FG files and rebuilds projections,
+league averages and team projections from scratch.
+
+AnalysisContext memoizes each node (keyed by node name + arguments) so it is
+computed at most once per run:
+
+  json(name)                 -> parsed data file
+  projections                -> list[PlayerProjection]
+  fg_lookup                  -> normalized name -> PlayerProjection
+  league_averages(n_teams)   -> {cat: (mean, stdev)}
+  category_correlation(n)    -> category correlation matrix (cached per projection_version)
+  team_projections           -> team_key -> TeamProjection (league_rosters.json;
+                                kept across contexts per team, keyed on roster_hash)
+  schedule_index             -> ScheduleIndex
+  league_scoreboard          -> league-wide weekly results table (optional)
+  standings(week, n_teams)   -> StandingsTrajectory (optionally with simulated playoff odds)
+  trade_report(...)          -> TradeReport (1-for-1 suggestions)
+
+A context is cheap to create; make one per request / report run and pass it
+to every use case. Use cases create their own when none is given.
+Nodes are guarded by per-node locks so sections running concurrently on the
+same context still compute each node once.
+"""
+from __future__ import annotations
+
+import json
+import threading
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+
+# team_key -> (roster_hash, projection_version, TeamProjection). Survives
+# contexts so an incremental roster sync only rebuilds the teams it changed.
+_TEAM_PROJ_CACHE: dict[str, tuple[str, str, Any]] = {}
+_TEAM_PROJ_LOCK = threading.Lock()
+
+
+def _load_json(path: Path) -> Any:
+    if not path.exists():
+        raise FileNotFoundError(f"Required file not found: {path}")
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def load_schedule_index(data_dir: Path):
+    """
+    Load the compiled schedule index (scripts/compile_schedule_index.py).
+    Falls back to compiling league_schedule.json when the index is missing
+    or older than the schedule file.
+    """
+    from yahoo_ai_gm.analysis.schedule_index import (
+        compile_schedule_index,
+        schedule_index_from_dict,
+    )
+
+    schedule_path = data_dir / "league_schedule.json"
+    index_path = data_dir / "league_schedule_index.json"
+    if index_path.exists() and (
+        not schedule_path.exists()
+        or index_path.stat().st_mtime >= schedule_path.stat().st_mtime
+    ):
+        try:
+            return schedule_index_from_dict(_load_json(index_path))
+        except (KeyError, ValueError):
+            pass
+    return compile_schedule_index(_load_json(schedule_path))
+
+
+class AnalysisContext:
+    def __init__(self, data_dir: Path):
+        self.data_dir = Path(data_dir)
+        self._values: dict[tuple, Any] = {}
+        self._locks: dict[tuple, threading.Lock] = {}
+        self._guard = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    # ------------------------------------------------------------------
+    # Memoization
+    # ------------------------------------------------------------------
+
+    def node(self, key: tuple, compute: Callable[[], Any]) -> Any:
+        """Return the memoized value for key, computing it once on first use."""
+        with self._guard:
+            if key in self._values:
+                self.hits += 1
+                return self._values[key]
+            lock = self._locks.setdefault(key, threading.Lock())
+        with lock:
+            with self._guard:
+                if key in self._values:
+                    self.hits += 1
+                    return self._values[key]
+            value = compute()
+            with self._guard:
+                self._values[key] = value
+                self.misses += 1
+            return value
+
+    def stats(self) -> dict:
+        with self._guard:
+            return {"nodes": len(self._values), "hits": self.hits, "misses": self.misses}
+
+    # ------------------------------------------------------------------
+    # Data files
+    # ------------------------------------------------------------------
+
+    def json(self, name: str) -> Any:
+        return self.node(("json", name), lambda: _load_json(self.data_dir / name))
+
+    def fg_bat(self) -> dict:
+        return self.json("fg_proj_bat_2026.json")
+
+    def fg_pit(self) -> dict:
+        return self.json("fg_proj_pit_2026.json")
+
+    def league_rosters(self) -> dict:
+        return self.json("league_rosters.json")
+
+    def snapshot(self, week: int) -> dict:
+        return self.json(f"snapshots/week_{week}.snapshot.json")
+
+    def latest_week(self) -> Optional[int]:
+        from yahoo_ai_gm.snapshot.store import latest_week
+        return self.node(("latest_week",), lambda: latest_week(self.data_dir / "snapshots"))
+
+    def schedule_index(self):
+        return self.node(("schedule_index",), lambda: load_schedule_index(self.data_dir))
+
+    def league_scoreboard(self) -> Optional[dict]:
+        """league_scoreboard.json (scripts/pull_scoreboard_week.py), None before the first pull."""
+        def _compute() -> Optional[dict]:
+            path = self.data_dir / "league_scoreboard.json"
+            return _load_json(path) if path.exists() else None
+        return self.node(("league_scoreboard",), _compute)
+
+    # ------------------------------------------------------------------
+    # Projection nodes
+    # ------------------------------------------------------------------
+
+    def projections(self) -> list:
+        from yahoo_ai_gm.analysis.trade_engine import load_projections_from_fg
+        return self.node(
+            ("projections",),
+            lambda: load_projections_from_fg(self.fg_bat(), self.fg_pit()),
+        )
+
+    def projection_version(self) -> str:
+        """Identifies the FG projection files on disk (size + mtime)."""
+        def _compute() -> str:
+            parts = []
+            for name in ("fg_proj_bat_2026.json", "fg_proj_pit_2026.json"):
+                p = self.data_dir / name
+                st = p.stat() if p.exists() else None
+                parts.append(f"{st.st_size}:{st.st_mtime_ns}" if st else "missing")
+            return "|".join(parts)
+        return self.node(("projection_version",), _compute)
+
+    def fg_lookup(self) -> dict:
+        from yahoo_ai_gm.analysis.trade_engine import build_fg_lookup
+        return self.node(("fg_lookup",), lambda: build_fg_lookup(self.projections()))
+
+    def league_averages(self, n_teams: int) -> dict:
+        from yahoo_ai_gm.analysis.trade_engine import compute_league_averages
+        return self.node(
+            ("league_averages", n_teams),
+            lambda: compute_league_averages(self.projections(), n_teams=n_teams),
+        )
+
+    def category_correlation(self, n_teams: int) -> list:
+        from yahoo_ai_gm.analysis.category_simulation import category_correlation
+        return self.node(
+            ("category_correlation", n_teams),
+            lambda: category_correlation(
+                self.projections(), self.projection_version(), n_teams=n_teams
+            ),
+        )
+
+    def team_projection(self, roster: list[dict]):
+        """Uncached helper: TeamProjection for an arbitrary roster list."""
+        from yahoo_ai_gm.analysis.trade_engine import build_team_projection, match_roster_to_fg
+        matches = match_roster_to_fg(roster, self.fg_lookup())
+        return build_team_projection([p for p in matches.values() if p is not None])
+
+    def team_projections(self) -> dict:
+        from yahoo_ai_gm.league_rosters import team_roster_hash
+
+        def _compute() -> dict:
+            version = self.projection_version()
+            out = {}
+            for t in self.league_rosters().get("teams", []):
+                key, h = t["team_key"], team_roster_hash(t)
+                with _TEAM_PROJ_LOCK:
+                    cached = _TEAM_PROJ_CACHE.get(key)
+                if cached is not None and cached[:2] == (h, version):
+                    out[key] = cached[2]
+                    continue
+                out[key] = self.team_projection(t["players"])
+                with _TEAM_PROJ_LOCK:
+                    _TEAM_PROJ_CACHE[key] = (h, version, out[key])
+            return out
+        return self.node(("team_projections",), _compute)
+
+    # ------------------------------------------------------------------
+    # Engine nodes
+    # ------------------------------------------------------------------
+
+    def standings(
+        self,
+        week: int,
+        n_teams: int = 10,
+        my_team_key: Optional[str] = None,
+        n_sims: int = 0,
+        progress: Optional[Callable[[str, int, int], None]] = None,
+    ):
+        """progress is only called if this call computes the node."""
+        from yahoo_ai_gm.analysis.standings_trajectory import project_standings
+
+        if my_team_key is None:
+            my_team_key = self.snapshot(week).get("roster", {}).get("team_key", "")
+
+        return self.node(
+            ("standings", week, n_teams, my_team_key, n_sims),
+            lambda: project_standings(
+                my_team_key=my_team_key,
+                league_rosters=self.league_rosters().get("teams", []),
+                schedule=self.schedule_index(),
+                fg_bat_data=self.fg_bat(),
+                fg_pit_data=self.fg_pit(),
+                current_week=week,
+                n_teams=n_teams,
+                all_projections=self.projections(),
+                fg_lookup=self.fg_lookup(),
+                league_averages=self.league_averages(n_teams),
+                team_projections=self.team_projections(),
+                league_scoreboard=self.league_scoreboard(),
+                n_sims=n_sims,
+                category_correlation=self.category_correlation(n_teams) if n_sims > 0 else None,
+                progress=progress,
+            ),
+        )
+
+    def trade_report(
+        self,
+        n_suggestions: int = 10,
+        n_teams: int = 12,
+        min_receive_adp: float = 300.0,
+        max_give_adp: float = 400.0,
+    ):
+        from yahoo_ai_gm.use_cases.get_trades import get_trade_report
+        return get_trade_report(
+            data_dir=self.data_dir,
+            n_suggestions=n_suggestions,
+            n_teams=n_teams,
+            min_receive_adp=min_receive_adp,
+            max_give_adp=max_give_adp,
+            ctx=self,
+        )
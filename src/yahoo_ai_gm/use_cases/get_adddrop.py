@@ -5,12 +5,13 @@ Layer 4 — Orchestration.
 """
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
 
+from yahoo_ai_gm.use_cases.context import AnalysisContext
+
 
 @dataclass
 class AddDropReport:
@@ -21,39 +22,28 @@ class AddDropReport:
     error: Optional[str] = None
 
 
-def _load_json(path: Path):
-    if not path.exists():
-        raise FileNotFoundError(f"Required file not found: {path}")
-    return json.loads(path.read_text(encoding="utf-8"))
-
-
 def get_adddrop_report(
     data_dir: Path,
     week: Optional[int] = None,
     max_moves: int = 6,
     n_teams: int = 10,
     pool_file: str = "waiver_pool_baseline_2025_300.json",
+    ctx: Optional[AnalysisContext] = None,
 ) -> AddDropReport:
     from yahoo_ai_gm.analysis.adddrop_engine import simulate_adddrop, adddrop_plan_to_dict
 
-    fg_bat = _load_json(data_dir / "fg_proj_bat_2026.json")
-    fg_pit = _load_json(data_dir / "fg_proj_pit_2026.json")
-    league_data = _load_json(data_dir / "league_rosters.json")
+    ctx = ctx or AnalysisContext(data_dir)
+    fg_bat = ctx.fg_bat()
+    fg_pit = ctx.fg_pit()
+    league_data = ctx.league_rosters()
 
     # Find latest week
     if week is None:
-        snapshots_dir = data_dir / "snapshots"
-        weeks = []
-        for f in snapshots_dir.glob("week_*.snapshot.json"):
-            try:
-                weeks.append(int(f.name.split("_")[1].split(".")[0]))
-            except (IndexError, ValueError):
-                continue
-        if not weeks:
+        week = ctx.latest_week()
+        if week is None:
             raise FileNotFoundError("No snapshot files found.")
-        week = max(weeks)
 
-    snap = _load_json(data_dir / f"snapshots/week_{week}.snapshot.json")
+    snap = ctx.snapshot(week)
     my_roster = snap.get("roster", {}).get("players", [])
     my_team_key = snap.get("roster", {}).get("team_key", "")
 
@@ -72,7 +62,7 @@ def get_adddrop_report(
     opp_roster = opp_entry["players"]
 
     # Load pool
-    pool_data = _load_json(data_dir / pool_file)
+    pool_data = ctx.json(pool_file)
     pool_players = pool_data.get("players", pool_data if isinstance(pool_data, list) else [])
 
     plan = simulate_adddrop(
@@ -83,6 +73,9 @@ def get_adddrop_report(
         fg_pit_data=fg_pit,
         max_moves=max_moves,
         n_teams=n_teams,
+        all_projections=ctx.projections(),
+        fg_lookup=ctx.fg_lookup(),
+        league_averages=ctx.league_averages(n_teams),
     )
 
     return AddDropReport(
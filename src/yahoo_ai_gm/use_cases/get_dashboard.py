@@ -0,0 +1,278 @@
+"""
+src/yahoo_ai_gm/use_cases/get_dashboard.py
+
+Layer 4 — Orchestration.
+
+One payload for the web dashboard. The UI used to call each report endpoint
+separately, and each call reloaded the FG files, rosters and schedule and
+rebuilt team projections. Here every requested section runs against one
+AnalysisContext, so shared nodes (projections, league averages, standings,
+trade suggestions) are computed once. Sections run concurrently on a small
+thread pool; sections that need the same node wait on that node's lock
+instead of recomputing it.
+
+Each section's payload has the same shape as the matching endpoint. A
+section that fails reports its error instead of failing the whole payload.
+"""
+from __future__ import annotations
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Optional
+
+from yahoo_ai_gm.use_cases.context import AnalysisContext
+
+
+MAX_WORKERS = 4
+
+
+@dataclass
+class DashboardReport:
+    generated_at: datetime
+    week: int
+    sections: dict[str, dict]
+    errors: dict[str, str]
+    timings_ms: dict[str, float]
+    total_ms: float
+
+
+# ---------------------------------------------------------------------------
+# Sections (payload shapes mirror service/main.py)
+# ---------------------------------------------------------------------------
+
+def _snapshot_model(ctx: AnalysisContext, week: int):
+    from yahoo_ai_gm.snapshot.store import load_snapshot
+    return load_snapshot(week, ctx.data_dir / "snapshots")
+
+
+def _snapshot(ctx: AnalysisContext, week: int, n_teams: int, progress=None) -> dict:
+    return _snapshot_model(ctx, week).model_dump(mode="json")
+
+
+def _pressure(ctx: AnalysisContext, week: int, n_teams: int, progress=None) -> dict:
+    from yahoo_ai_gm.analysis.category_pressure import pressure_report
+    return pressure_report(_snapshot_model(ctx, week)).model_dump(mode="json")
+
+
+def _inefficiency(ctx: AnalysisContext, week: int, n_teams: int, progress=None) -> dict:
+    from yahoo_ai_gm.analysis.roster_inefficiency import roster_inefficiency_report
+    return roster_inefficiency_report(_snapshot_model(ctx, week)).model_dump(mode="json")
+
+
+def _waivers(ctx: AnalysisContext, week: int, n_teams: int, progress=None) -> dict:
+    from yahoo_ai_gm.analysis.waiver_engine import waiver_recommendations
+    return waiver_recommendations(_snapshot_model(ctx, week)).model_dump(mode="json")
+
+
+def _matchup(ctx: AnalysisContext, week: int, n_teams: int, progress=None) -> dict:
+    from yahoo_ai_gm.use_cases.get_matchup import get_matchup_report
+    report = get_matchup_report(data_dir=ctx.data_dir, week=week, n_teams=n_teams, ctx=ctx)
+    return {"generated_at": report.generated_at.isoformat(), "week": report.week, **report.projection}
+
+
+def _standings(
+    ctx: AnalysisContext, week: int, n_teams: int, progress=None, sims: int = 0,
+) -> dict:
+    from yahoo_ai_gm.use_cases.get_standings import get_standings_report
+    report = get_standings_report(
+        data_dir=ctx.data_dir, current_week=week, n_teams=n_teams, n_sims=sims,
+        ctx=ctx, progress=progress,
+    )
+    return {"generated_at": report.generated_at.isoformat(), **report.trajectory}
+
+
+def _adddrop(ctx: AnalysisContext, week: int, n_teams: int, progress=None) -> dict:
+    from yahoo_ai_gm.use_cases.get_adddrop import get_adddrop_report
+    report = get_adddrop_report(data_dir=ctx.data_dir, week=week, n_teams=n_teams, ctx=ctx)
+    return {
+        "generated_at": report.generated_at.isoformat(),
+        "week": report.week,
+        "max_moves": report.max_moves,
+        **report.plan,
+    }
+
+
+def _trades_acceptance(
+    ctx: AnalysisContext, week: int, n_teams: int, progress=None, n: int = 10,
+) -> dict:
+    from yahoo_ai_gm.use_cases.get_trade_acceptance import get_trade_acceptance_report
+    report = get_trade_acceptance_report(
+        data_dir=ctx.data_dir, week=week, n_suggestions=n, n_teams=n_teams,
+        ctx=ctx, progress=progress,
+    )
+    return {
+        "generated_at": report.generated_at.isoformat(),
+        "week": report.week,
+        "suggestions": report.suggestions,
+    }
+
+
+def _trades_multi(
+    ctx: AnalysisContext, week: int, n_teams: int, progress=None, n: int = 10,
+) -> dict:
+    from yahoo_ai_gm.use_cases.get_multi_trades import get_multi_trade_report
+    report = get_multi_trade_report(
+        data_dir=ctx.data_dir, n_suggestions=n, n_teams=n_teams, ctx=ctx, progress=progress,
+    )
+    return {
+        "generated_at": report.generated_at.isoformat(),
+        "roster_size": report.roster_size,
+        "trade_sizes": report.trade_sizes,
+    }
+
+
+def _ratio_risk(ctx: AnalysisContext, week: int, n_teams: int, progress=None) -> dict:
+    from yahoo_ai_gm.use_cases.get_ratio_risk import get_ratio_risk_report
+    report = get_ratio_risk_report(data_dir=ctx.data_dir, week=week, ctx=ctx)
+    return {
+        "generated_at": report.generated_at.isoformat(),
+        "week": report.week,
+        "pitcher_count": report.pitcher_count,
+        "profiles": report.profiles,
+    }
+
+
+def _trade_value(ctx: AnalysisContext, week: int, n_teams: int, progress=None) -> dict:
+    from yahoo_ai_gm.use_cases.get_trade_value import get_trade_value_report
+    report = get_trade_value_report(data_dir=ctx.data_dir, week=week, ctx=ctx)
+    return {
+        "generated_at": report.generated_at.isoformat(),
+        "week": report.week,
+        "sell_high": report.sell_high,
+        "cut_bait": report.cut_bait,
+        "watch": report.watch,
+        "players": report.players,
+    }
+
+
+def _league(ctx: AnalysisContext, week: int, n_teams: int):
+    from yahoo_ai_gm.use_cases.get_league_intelligence import get_league_intelligence_report
+    return get_league_intelligence_report(data_dir=ctx.data_dir, week=week, n_teams=n_teams, ctx=ctx)
+
+
+def _league_construction(ctx: AnalysisContext, week: int, n_teams: int, progress=None) -> dict:
+    report = _league(ctx, week, n_teams)
+    return {
+        "generated_at": report.generated_at.isoformat(),
+        "week": report.week,
+        "my_construction": report.my_construction,
+        "all_teams": report.construction_scores,
+    }
+
+
+def _league_opponents(ctx: AnalysisContext, week: int, n_teams: int, progress=None) -> dict:
+    report = _league(ctx, week, n_teams)
+    return {
+        "generated_at": report.generated_at.isoformat(),
+        "week": report.week,
+        "opponents": report.opponent_profiles,
+    }
+
+
+def _streaming_sp(ctx: AnalysisContext, week: int, n_teams: int, progress=None) -> dict:
+    from yahoo_ai_gm.use_cases.get_streaming_sp import get_streaming_sp_report
+    report = get_streaming_sp_report(data_dir=ctx.data_dir, week=week, ctx=ctx)
+    return {
+        "generated_at": report.generated_at.isoformat(),
+        "week": report.week,
+        "week_start": report.week_start,
+        "week_end": report.week_end,
+        "data_source": report.data_source,
+        "opponent_weaknesses": report.opp_weaknesses,
+        "candidates": report.candidates,
+    }
+
+
+# name -> fn(ctx, week, n_teams, progress=None, **options)
+SECTIONS: dict[str, Callable[..., dict]] = {
+    "snapshot": _snapshot,
+    "pressure": _pressure,
+    "inefficiency": _inefficiency,
+    "waivers": _waivers,
+    "matchup": _matchup,
+    "standings": _standings,
+    "adddrop": _adddrop,
+    "trades_acceptance": _trades_acceptance,
+    "trades_multi": _trades_multi,
+    "ratio_risk": _ratio_risk,
+    "trade_value": _trade_value,
+    "league_construction": _league_construction,
+    "league_opponents": _league_opponents,
+    "streaming_sp": _streaming_sp,
+}
+
+
+def run_section(
+    data_dir: Path,
+    name: str,
+    week: Optional[int] = None,
+    n_teams: int = 10,
+    progress: Optional[Callable[[str, int, int], None]] = None,
+    **options,
+) -> dict:
+    """
+    One section on its own (service background jobs). options are
+    section-specific: standings takes sims, trades_multi and
+    trades_acceptance take n.
+    """
+    if name not in SECTIONS:
+        raise ValueError(f"Unknown dashboard section: {name}")
+    ctx = AnalysisContext(data_dir)
+    if week is None:
+        week = ctx.latest_week() or 1
+    return SECTIONS[name](ctx, week, n_teams, progress=progress, **options)
+
+
+def get_dashboard_report(
+    data_dir: Path,
+    week: Optional[int] = None,
+    sections: Optional[list[str]] = None,
+    n_teams: int = 10,
+    max_workers: int = MAX_WORKERS,
+    ctx: Optional[AnalysisContext] = None,
+) -> DashboardReport:
+    """
+    sections: names from SECTIONS (default: all). Raises ValueError on an
+    unknown name.
+    """
+    names = list(SECTIONS) if not sections else list(dict.fromkeys(sections))
+    unknown = [s for s in names if s not in SECTIONS]
+    if unknown:
+        raise ValueError(f"Unknown dashboard sections: {', '.join(unknown)}")
+
+    t0 = time.perf_counter()
+    ctx = ctx or AnalysisContext(data_dir)
+    if week is None:
+        week = ctx.latest_week() or 1
+
+    def _run(name: str) -> tuple[str, Optional[dict], Optional[str], float]:
+        s0 = time.perf_counter()
+        try:
+            payload, error = SECTIONS[name](ctx, week, n_teams), None
+        except Exception as e:
+            # Any section failure (missing inputs or a bug) is reported, not raised
+            payload, error = None, f"{type(e).__name__}: {e}"
+        return name, payload, error, (time.perf_counter() - s0) * 1000
+
+    payloads: dict[str, dict] = {}
+    errors: dict[str, str] = {}
+    timings: dict[str, float] = {}
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(names)))) as pool:
+        for name, payload, error, ms in pool.map(_run, names):
+            timings[name] = round(ms, 1)
+            if error is None:
+                payloads[name] = payload
+            else:
+                errors[name] = error
+
+    return DashboardReport(
+        generated_at=datetime.now(tz=timezone.utc),
+        week=week,
+        sections=payloads,
+        errors=errors,
+        timings_ms=timings,
+        total_ms=round((time.perf_counter() - t0) * 1000, 1),
+    )
@@ -5,12 +5,13 @@ Layer 4 — Orchestration.
 """
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
 
+from yahoo_ai_gm.use_cases.context import AnalysisContext
+
 
 @dataclass
 class LeagueIntelligenceReport:
@@ -21,60 +22,53 @@ class LeagueIntelligenceReport:
     opponent_profiles: list[dict]
 
 
-def _load_json(path: Path) -> dict:
-    if not path.exists():
-        raise FileNotFoundError(f"Required file not found: {path}")
-    return json.loads(path.read_text(encoding="utf-8"))
-
-
 def get_league_intelligence_report(
     data_dir: Path,
     week: Optional[int] = None,
     n_teams: int = 10,
+    ctx: Optional[AnalysisContext] = None,
+) -> LeagueIntelligenceReport:
+    ctx = ctx or AnalysisContext(data_dir)
+    if week is None:
+        week = ctx.latest_week() or 1
+
+    # Memoized: streaming SP and the daily report both consume this report
+    return ctx.node(
+        ("league_intelligence", week, n_teams),
+        lambda: _build_league_intelligence_report(ctx, week, n_teams),
+    )
+
+
+def _build_league_intelligence_report(
+    ctx: AnalysisContext,
+    week: int,
+    n_teams: int,
 ) -> LeagueIntelligenceReport:
     from yahoo_ai_gm.analysis.league_intelligence import (
         compute_league_intelligence,
         construction_score_to_dict,
         opponent_profile_to_dict,
     )
-    from yahoo_ai_gm.analysis.standings_trajectory import project_standings
-
-    fg_bat = _load_json(data_dir / "fg_proj_bat_2026.json")
-    fg_pit = _load_json(data_dir / "fg_proj_pit_2026.json")
-    league_data = _load_json(data_dir / "league_rosters.json")
-    schedule_data = _load_json(data_dir / "league_schedule.json")
-
-    if week is None:
-        weeks = []
-        for f in (data_dir / "snapshots").glob("week_*.snapshot.json"):
-            try:
-                weeks.append(int(f.name.split("_")[1].split(".")[0]))
-            except (IndexError, ValueError):
-                continue
-        week = max(weeks) if weeks else 1
 
-    snap = _load_json(data_dir / f"snapshots/week_{week}.snapshot.json")
+    league_data = ctx.league_rosters()
+    snap = ctx.snapshot(week)
     my_team_key = snap.get("roster", {}).get("team_key", "")
 
     # Get standings for rank info
-    trajectory = project_standings(
-        my_team_key=my_team_key,
-        league_rosters=league_data.get("teams", []),
-        schedule=schedule_data.get("schedule", {}),
-        fg_bat_data=fg_bat,
-        fg_pit_data=fg_pit,
-        current_week=week,
-        n_teams=n_teams,
-    )
+    trajectory = ctx.standings(week, n_teams, my_team_key=my_team_key)
     rank_map = {s.team_key: s.projected_rank for s in trajectory.all_standings}
 
     construction_scores, opponent_profiles = compute_league_intelligence(
         my_team_key=my_team_key,
         league_rosters=league_data.get("teams", []),
-        fg_bat_data=fg_bat,
-        fg_pit_data=fg_pit,
+        fg_bat_data=ctx.fg_bat(),
+        fg_pit_data=ctx.fg_pit(),
         rank_map=rank_map,
         n_teams=n_teams,
+        all_projections=ctx.projections(),
+        fg_lookup=ctx.fg_lookup(),
+        league_averages=ctx.league_averages(n_teams),
+        team_projections=ctx.team_projections(),
     )
 
     cs_dicts = [construction_score_to_dict(cs) for cs in construction_scores]
@@ -0,0 +1,154 @@
+"""
+src/yahoo_ai_gm/use_cases/get_live_matchup.py
+
+Layer 4 — Orchestration. No HTTP logic.
+"""
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+from datetime import date, datetime, timezone
+from pathlib import Path
+from typing import Optional
+
+from yahoo_ai_gm.use_cases.context import AnalysisContext
+
+
+# Rest-of-week rates depend only on the roster and the FG projection files,
+# not on the scoreboard. They are kept across calls so a new scoreboard
+# snapshot only reruns the cheap per-category combine step.
+_RATES_CACHE: dict[tuple, object] = {}
+_RATES_LOCK = threading.Lock()
+_RATES_CACHE_MAX = 64
+
+
+@dataclass
+class LiveMatchupReport:
+    generated_at: datetime
+    week: int
+    as_of: str
+    matchup_status: Optional[str]
+    my_team: dict
+    opp_team: dict
+    projection: dict
+
+
+def _parse_date(value) -> Optional[date]:
+    if not value:
+        return None
+    try:
+        return date.fromisoformat(str(value)[:10])
+    except ValueError:
+        return None
+
+
+def _week_days(matchup: dict, default: float) -> float:
+    start = _parse_date(matchup.get("week_start"))
+    end = _parse_date(matchup.get("week_end"))
+    if start and end and end >= start:
+        return float((end - start).days + 1)
+    return default
+
+
+def _remaining_days(matchup: dict, as_of: Optional[date], week_days: float) -> float:
+    """
+    Scoring days left in the week, counting the snapshot day itself (snapshots
+    are pulled before the day's games). Falls back to half a week when the
+    scoreboard has no week dates.
+    """
+    status = (matchup.get("status") or "").lower()
+    if status == "postevent":
+        return 0.0
+    if status == "preevent":
+        return week_days
+    end = _parse_date(matchup.get("week_end"))
+    if end is None or as_of is None:
+        return week_days / 2.0
+    return max(0.0, min(week_days, float((end - as_of).days + 1)))
+
+
+def _team_rates(ctx: AnalysisContext, team_key: str, roster: list[dict]):
+    from yahoo_ai_gm.analysis.live_matchup import build_team_rates
+
+    names = tuple(sorted(p.get("full_name") or p.get("name") or "" for p in roster))
+    key = (str(ctx.data_dir.resolve()), team_key, names, ctx.projection_version())
+    with _RATES_LOCK:
+        rates = _RATES_CACHE.get(key)
+    if rates is None:
+        rates = build_team_rates(ctx.team_projection(roster))
+        with _RATES_LOCK:
+            if len(_RATES_CACHE) >= _RATES_CACHE_MAX:
+                _RATES_CACHE.clear()
+            _RATES_CACHE[key] = rates
+    return rates
+
+
+def get_live_matchup_report(
+    data_dir: Path,
+    week: Optional[int] = None,
+    remaining_days: Optional[float] = None,
+    ctx: Optional[AnalysisContext] = None,
+) -> LiveMatchupReport:
+    """
+    Requires:
+      {data_dir}/snapshots/week_{week}.snapshot.json  — scoreboard totals + my roster
+      {data_dir}/league_rosters.json                  — opponent roster
+      {data_dir}/fg_proj_bat_2026.json
+      {data_dir}/fg_proj_pit_2026.json
+
+    remaining_days overrides the value derived from the snapshot's week dates.
+    """
+    from yahoo_ai_gm.analysis.live_matchup import (
+        DEFAULT_WEEK_DAYS,
+        project_live_matchup,
+        live_matchup_to_dict,
+    )
+
+    ctx = ctx or AnalysisContext(data_dir)
+
+    if week is None:
+        week = ctx.latest_week()
+        if week is None:
+            raise FileNotFoundError("No snapshot files found.")
+
+    snapshot = ctx.snapshot(week)
+    matchup = snapshot.get("matchup", {})
+    my_team = matchup.get("my_team", {})
+    opp_team = matchup.get("opp_team", {})
+    opp_team_key = opp_team.get("team_key", "")
+    if not opp_team_key:
+        raise ValueError("Opponent team key not found in snapshot matchup data.")
+
+    teams = ctx.league_rosters().get("teams", [])
+    opp_entry = next((t for t in teams if t["team_key"] == opp_team_key), None)
+    if opp_entry is None:
+        raise ValueError(f"Opponent {opp_team_key} not found in league_rosters.json. Run pull_league_rosters.py.")
+
+    my_roster = snapshot.get("roster", {}).get("players", [])
+    my_rates = _team_rates(ctx, my_team.get("team_key", ""), my_roster)
+    opp_rates = _team_rates(ctx, opp_team_key, opp_entry["players"])
+
+    as_of_raw = snapshot.get("pulled_at") or ""
+    week_days = _week_days(matchup, DEFAULT_WEEK_DAYS)
+    if remaining_days is None:
+        remaining_days = _remaining_days(matchup, _parse_date(as_of_raw), week_days)
+
+    live = project_live_matchup(
+        my_totals=my_team.get("totals", {}),
+        opp_totals=opp_team.get("totals", {}),
+        my_rates=my_rates,
+        opp_rates=opp_rates,
+        week=week,
+        remaining_days=remaining_days,
+        week_days=week_days,
+    )
+
+    return LiveMatchupReport(
+        generated_at=datetime.now(tz=timezone.utc),
+        week=week,
+        as_of=str(as_of_raw),
+        matchup_status=matchup.get("status"),
+        my_team={"key": my_team.get("team_key", ""), "name": my_team.get("team_name", "")},
+        opp_team={"key": opp_team_key, "name": opp_team.get("team_name", "")},
+        projection=live_matchup_to_dict(live),
+    )
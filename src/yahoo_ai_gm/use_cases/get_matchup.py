@@ -5,12 +5,13 @@ Layer 4 — Orchestration. No HTTP logic.
 """
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
 
+from yahoo_ai_gm.use_cases.context import AnalysisContext
+
 
 @dataclass
 class MatchupReport:
@@ -20,18 +21,18 @@ class MatchupReport:
     error: Optional[str] = None
 
 
-def _load_json(path: Path) -> dict | list:
-    if not path.exists():
-        raise FileNotFoundError(f"Required file not found: {path}")
-    return json.loads(path.read_text(encoding="utf-8"))
-
-
 def get_matchup_report(
     data_dir: Path,
     week: Optional[int] = None,
     n_teams: int = 10,
+    n_sims: int = 0,
+    correlated: bool = True,
+    ctx: Optional[AnalysisContext] = None,
 ) -> MatchupReport:
     """
+    n_sims > 0 adds a simulated win probability; correlated=False draws the
+    categories independently (for comparison).
+
     Requires:
       {data_dir}/snapshots/week_{week}.snapshot.json  — has my roster + matchup info
       {data_dir}/league_rosters.json                  — all team rosters
@@ -40,25 +41,18 @@ def get_matchup_report(
     """
     from yahoo_ai_gm.analysis.matchup_engine import project_matchup, matchup_to_dict
 
-    fg_bat = _load_json(data_dir / "fg_proj_bat_2026.json")
-    fg_pit = _load_json(data_dir / "fg_proj_pit_2026.json")
-    league_rosters = _load_json(data_dir / "league_rosters.json")
+    ctx = ctx or AnalysisContext(data_dir)
+    fg_bat = ctx.fg_bat()
+    fg_pit = ctx.fg_pit()
+    league_rosters = ctx.league_rosters()
 
     # Find latest snapshot week if not specified
     if week is None:
-        snapshots_dir = data_dir / "snapshots"
-        weeks = []
-        for f in snapshots_dir.glob("week_*.snapshot.json"):
-            try:
-                weeks.append(int(f.name.split("_")[1].split(".")[0]))
-            except (IndexError, ValueError):
-                continue
-        if not weeks:
+        week = ctx.latest_week()
+        if week is None:
             raise FileNotFoundError("No snapshot files found.")
-        week = max(weeks)
 
-    snap_path = data_dir / f"snapshots/week_{week}.snapshot.json"
-    snapshot = _load_json(snap_path)
+    snapshot = ctx.snapshot(week)
 
     # Extract my roster and matchup info from snapshot
     my_roster = snapshot.get("roster", {}).get("players", [])
@@ -90,6 +84,11 @@ def get_matchup_report(
         opp_team_name=opp_team_name,
         week=week,
         n_teams=n_teams,
+        all_projections=ctx.projections(),
+        fg_lookup=ctx.fg_lookup(),
+        league_averages=ctx.league_averages(n_teams),
+        n_sims=n_sims,
+        category_correlation=ctx.category_correlation(n_teams) if n_sims > 0 and correlated else None,
     )
 
     return MatchupReport(
@@ -5,11 +5,12 @@ Layer 4 — Orchestration.
 """
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
+
+from yahoo_ai_gm.use_cases.context import AnalysisContext
 
 
 @dataclass
@@ -20,28 +21,25 @@ class MultiTradeReport:
     error: Optional[str] = None
 
 
-def _load_json(path: Path):
-    if not path.exists():
-        raise FileNotFoundError(f"Required file not found: {path}")
-    return json.loads(path.read_text(encoding="utf-8"))
-
-
 def get_multi_trade_report(
     data_dir: Path,
     n_suggestions: int = 10,
     n_teams: int = 10,
+    ctx: Optional[AnalysisContext] = None,
+    progress: Optional[Callable[[str, int, int], None]] = None,
 ) -> MultiTradeReport:
     from yahoo_ai_gm.analysis.multi_trade_engine import (
         multi_trade_suggestions,
         multi_trade_suggestion_to_dict,
     )
 
-    roster_snap = _load_json(data_dir / "snapshots" / "week_1.snapshot.json")
+    ctx = ctx or AnalysisContext(data_dir)
+    roster_snap = ctx.snapshot(1)
     my_roster = roster_snap.get("roster", {}).get("players", [])
 
-    fg_bat = _load_json(data_dir / "fg_proj_bat_2026.json")
-    fg_pit = _load_json(data_dir / "fg_proj_pit_2026.json")
-    league_data = _load_json(data_dir / "league_rosters.json")
+    fg_bat = ctx.fg_bat()
+    fg_pit = ctx.fg_pit()
+    league_data = ctx.league_rosters()
 
     # Exclude my own team from receive pool
     my_team_key = roster_snap.get("roster", {}).get("team_key", "")
@@ -54,6 +52,10 @@ def get_multi_trade_report(
         fg_pit_data=fg_pit,
         n_suggestions=n_suggestions,
         n_teams=n_teams,
+        all_projections=ctx.projections(),
+        fg_lookup=ctx.fg_lookup(),
+        league_averages=ctx.league_averages(n_teams),
+        progress=progress,
     )
 
     return MultiTradeReport(
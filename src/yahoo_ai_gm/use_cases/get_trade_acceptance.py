@@ -8,11 +8,12 @@ with acceptance probability scores.
 """
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
+
+from yahoo_ai_gm.use_cases.context import AnalysisContext
 
 
 @dataclass
@@ -22,92 +23,54 @@ class TradeAcceptanceReport:
     suggestions: list[dict]   # trade suggestions enriched with acceptance_probability
 
 
-def _load_json(path: Path) -> dict:
-    if not path.exists():
-        raise FileNotFoundError(f"Required file not found: {path}")
-    return json.loads(path.read_text(encoding="utf-8"))
-
-
 def get_trade_acceptance_report(
     data_dir: Path,
     week: Optional[int] = None,
     n_suggestions: int = 10,
     n_teams: int = 10,
+    ctx: Optional[AnalysisContext] = None,
+    progress: Optional[Callable[[str, int, int], None]] = None,
 ) -> TradeAcceptanceReport:
     from yahoo_ai_gm.analysis.trade_acceptance import (
         compute_acceptance_probability,
         acceptance_result_to_dict,
     )
-    from yahoo_ai_gm.analysis.trade_engine import (
-        load_projections_from_fg,
-        build_fg_lookup,
-        match_roster_to_fg,
-        build_team_projection,
-        compute_league_averages,
-    )
-    from yahoo_ai_gm.analysis.standings_trajectory import project_standings
 
-    fg_bat = _load_json(data_dir / "fg_proj_bat_2026.json")
-    fg_pit = _load_json(data_dir / "fg_proj_pit_2026.json")
-    league_data = _load_json(data_dir / "league_rosters.json")
-    schedule_data = _load_json(data_dir / "league_schedule.json")
+    ctx = ctx or AnalysisContext(data_dir)
+    league_data = ctx.league_rosters()
 
     if week is None:
-        weeks = []
-        for f in (data_dir / "snapshots").glob("week_*.snapshot.json"):
-            try:
-                weeks.append(int(f.name.split("_")[1].split(".")[0]))
-            except (IndexError, ValueError):
-                continue
-        week = max(weeks) if weeks else 1
-
-    snap = _load_json(data_dir / f"snapshots/week_{week}.snapshot.json")
+        week = ctx.latest_week() or 1
+
+    snap = ctx.snapshot(week)
     my_roster = snap.get("roster", {}).get("players", [])
     my_team_key = snap.get("roster", {}).get("team_key", "")
 
-    # Build projections
-    all_projections = load_projections_from_fg(fg_bat, fg_pit)
-    fg_lookup = build_fg_lookup(all_projections)
-    league_averages = compute_league_averages(all_projections, n_teams=n_teams)
-
-    my_matches = match_roster_to_fg(my_roster, fg_lookup)
-    my_projs = [p for p in my_matches.values() if p is not None]
-    my_team = build_team_projection(my_projs)
+    # Shared projection state
+    fg_lookup = ctx.fg_lookup()
+    league_averages = ctx.league_averages(n_teams)
+    my_team = ctx.team_projection(my_roster)
 
     # Get standings for rank info
-    trajectory = project_standings(
-        my_team_key=my_team_key,
-        league_rosters=league_data.get("teams", []),
-        schedule=schedule_data.get("schedule", {}),
-        fg_bat_data=fg_bat,
-        fg_pit_data=fg_pit,
-        current_week=week,
-        n_teams=n_teams,
-    )
+    trajectory = ctx.standings(week, n_teams, my_team_key=my_team_key, progress=progress)
     rank_map = {s.team_key: s.projected_rank for s in trajectory.all_standings}
 
-    # Build opponent team projections
-    other_teams = {
-        t["team_key"]: t
-        for t in league_data.get("teams", [])
-        if t["team_key"] != my_team_key
+    # Opponent team projections
+    opp_proj_map = {
+        tkey: proj
+        for tkey, proj in ctx.team_projections().items()
+        if tkey != my_team_key
     }
-    opp_proj_map = {}
-    for tkey, team in other_teams.items():
-        matches = match_roster_to_fg(team["players"], fg_lookup)
-        projs = [p for p in matches.values() if p is not None]
-        opp_proj_map[tkey] = build_team_projection(projs)
 
     # Get 1-for-1 trade suggestions
-    from yahoo_ai_gm.use_cases.get_trades import get_trade_report
-    trade_report = get_trade_report(
-        data_dir=data_dir,
-        n_suggestions=n_suggestions,
-        n_teams=n_teams,
-    )
+    if progress is not None:
+        progress("trades", 0, 1)
+    trade_report = ctx.trade_report(n_suggestions=n_suggestions, n_teams=n_teams)
 
     suggestions = []
-    for s in trade_report.suggestions:
+    for i, s in enumerate(trade_report.suggestions):
+        if progress is not None:
+            progress("acceptance", i, len(trade_report.suggestions))
         give_name    = s.get("give", {}).get("name", "")
         receive_name = s.get("receive", {}).get("name", "")
         give_team_name = s.get("receive", {}).get("team", "")
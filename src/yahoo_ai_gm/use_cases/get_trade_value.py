@@ -5,12 +5,13 @@ Layer 4 — Orchestration.
 """
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
 
+from yahoo_ai_gm.use_cases.context import AnalysisContext
+
 
 @dataclass
 class TradeValueReport:
@@ -22,36 +23,26 @@ class TradeValueReport:
     watch: list[dict]
 
 
-def _load_json(path: Path) -> dict:
-    if not path.exists():
-        raise FileNotFoundError(f"Required file not found: {path}")
-    return json.loads(path.read_text(encoding="utf-8"))
-
-
 def get_trade_value_report(
     data_dir: Path,
     week: Optional[int] = None,
+    ctx: Optional[AnalysisContext] = None,
 ) -> TradeValueReport:
     from yahoo_ai_gm.analysis.trade_value_tracker import (
         compute_trade_value_deltas,
         value_delta_to_dict,
     )
 
-    fg_bat = _load_json(data_dir / "fg_proj_bat_2026.json")
-    fg_pit = _load_json(data_dir / "fg_proj_pit_2026.json")
-    acq_log = _load_json(data_dir / "acquisition_log.json")
+    ctx = ctx or AnalysisContext(data_dir)
+    fg_bat = ctx.fg_bat()
+    fg_pit = ctx.fg_pit()
+    acq_log = ctx.json("acquisition_log.json")
     snapshots_dir = data_dir / "projection_snapshots"
 
     if week is None:
-        weeks = []
-        for f in (data_dir / "snapshots").glob("week_*.snapshot.json"):
-            try:
-                weeks.append(int(f.name.split("_")[1].split(".")[0]))
-            except (IndexError, ValueError):
-                continue
-        week = max(weeks) if weeks else 1
+        week = ctx.latest_week() or 1
 
-    snap = _load_json(data_dir / f"snapshots/week_{week}.snapshot.json")
+    snap = ctx.snapshot(week)
     my_roster = snap.get("roster", {}).get("players", [])
 
     deltas = compute_trade_value_deltas(
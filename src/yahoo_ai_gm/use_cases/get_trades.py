@@ -6,12 +6,13 @@ No HTTP logic here.
 """
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
 
+from yahoo_ai_gm.use_cases.context import AnalysisContext
+
 
 @dataclass
 class TradeReport:
@@ -25,18 +26,13 @@ class TradeReport:
     error: Optional[str] = None
 
 
-def _load_json(path: Path) -> dict:
-    if not path.exists():
-        raise FileNotFoundError(f"Required file not found: {path}")
-    return json.loads(path.read_text(encoding="utf-8"))
-
-
 def get_trade_report(
     data_dir: Path,
     n_suggestions: int = 10,
     n_teams: int = 12,
     min_receive_adp: float = 300.0,
     max_give_adp: float = 400.0,
+    ctx: Optional[AnalysisContext] = None,
 ) -> TradeReport:
     """
     Orchestrate trade suggestion generation.
@@ -45,26 +41,45 @@ def get_trade_report(
       {data_dir}/roster_snapshot.json
       {data_dir}/fg_proj_bat_2026.json
       {data_dir}/fg_proj_pit_2026.json
+
+    ctx: optional AnalysisContext; the report is memoized on it so other
+    use cases in the same run (e.g. trade acceptance) reuse it.
     """
+    ctx = ctx or AnalysisContext(data_dir)
+    return ctx.node(
+        ("trade_report", n_suggestions, n_teams, min_receive_adp, max_give_adp),
+        lambda: _build_trade_report(
+            ctx, n_suggestions, n_teams, min_receive_adp, max_give_adp
+        ),
+    )
+
+
+def _build_trade_report(
+    ctx: AnalysisContext,
+    n_suggestions: int,
+    n_teams: int,
+    min_receive_adp: float,
+    max_give_adp: float,
+) -> TradeReport:
     from yahoo_ai_gm.analysis.trade_engine import (
         trade_suggestions,
         score_team_categories,
         build_team_projection,
-        compute_league_averages,
-        load_projections_from_fg,
-        build_fg_lookup,
         match_roster_to_fg,
         suggestion_to_dict,
-        SCORING_CATS,
     )
 
     # Load data
-    roster = _load_json(data_dir / "roster_snapshot.json")
-    fg_bat = _load_json(data_dir / "fg_proj_bat_2026.json")
-    fg_pit = _load_json(data_dir / "fg_proj_pit_2026.json")
+    roster = ctx.json("roster_snapshot.json")
+    fg_bat = ctx.fg_bat()
+    fg_pit = ctx.fg_pit()
 
     fg_date = f"{fg_bat.get('season', 2026)} Steamer"
 
+    all_projections = ctx.projections()
+    fg_lookup = ctx.fg_lookup()
+    league_averages = ctx.league_averages(n_teams)
+
     # Run engine
     suggestions = trade_suggestions(
         roster=roster,
@@ -74,17 +89,17 @@ def get_trade_report(
         n_teams=n_teams,
         min_receive_adp=min_receive_adp,
         max_give_adp=max_give_adp,
+        all_projections=all_projections,
+        fg_lookup=fg_lookup,
+        league_averages=league_averages,
     )
 
     # Compute category summary for the report
-    all_projections = load_projections_from_fg(fg_bat, fg_pit)
-    fg_lookup = build_fg_lookup(all_projections)
     roster_matches = match_roster_to_fg(roster, fg_lookup)
     my_projections = [p for p in roster_matches.values() if p is not None]
     unmatched = [name for name, proj in roster_matches.items() if proj is None]
 
     my_team = build_team_projection(my_projections)
-    league_averages = compute_league_averages(all_projections, n_teams=n_teams)
     cat_scores = score_team_categories(my_team, league_averages)
 
     weak_cats = [cs.cat for cs in cat_scores if cs.rank_label == "weakness"]
@@ -1,14 +1,40 @@
+"""
+src/yahoo_ai_gm/use_cases/get_waivers.py
+
+Live waiver recommendations (/live/waivers).
+
+Each call used to run pull_scoreboard_week.py, pull_roster_snapshot.py and
+build_snapshot.py as subprocesses: three interpreters, three token-file
+reads and three HTTP sessions. The same steps now run in-process on the
+caller's YahooClient (scripts/pull_live.py, requests issued concurrently),
+and the resulting snapshot is reused for LIVE_TTL seconds per
+(league, team, week), so repeated calls skip Yahoo entirely.
+
+Env:
+  YAHOO_GM_LIVE_TTL=60   seconds a live pull is reused
+"""
 from dataclasses import dataclass
 from typing import Any, Dict, Optional, List
-import subprocess
-import sys
+import importlib
 import json
+import os
+import threading
+import time
 from pathlib import Path
 
-from yahoo_ai_gm.snapshot.store import load_snapshot
+from yahoo_ai_gm.domain.models import Snapshot
+from yahoo_ai_gm.snapshot.build import build_snapshot_from_files
+from yahoo_ai_gm.snapshot.store import save_snapshot
 from yahoo_ai_gm.analysis.waiver_engine import waiver_recommendations
 
 
+LIVE_TTL = float(os.environ.get("YAHOO_GM_LIVE_TTL", "60"))
+
+# (league_key, team_key, week) -> (pulled_at monotonic, Snapshot)
+_live_cache: Dict[tuple, tuple] = {}
+_live_lock = threading.Lock()
+
+
 @dataclass(frozen=True)
 class WaiverInputs:
     league_key: str
@@ -19,12 +45,46 @@ class WaiverInputs:
     ratio_mode: str = "protect"
 
 
-def _run(cmd: list[str]) -> None:
-    proc = subprocess.run(cmd, capture_output=True, text=True)
-    if proc.returncode != 0:
-        raise RuntimeError(
-            f"Command failed: {' '.join(cmd)}\n\nSTDOUT:\n{proc.stdout}\n\nSTDERR:\n{proc.stderr}"
-        )
+def refresh_live_snapshot(inputs: WaiverInputs, yahoo_client) -> Snapshot:
+    """
+    Pull scoreboard + roster through yahoo_client and rebuild the week's
+    snapshot (the former three-script pipeline, in-process).
+    """
+    from yahoo_ai_gm.async_yahoo_client import AsyncYahooClient, run_sync
+
+    # The pull steps live in scripts/ (run from the repo root, like the service)
+    live = importlib.import_module("scripts.pull_live")
+
+    # 1) Pull live Yahoo data -> files (scoreboard and roster requests overlap)
+    aclient = AsyncYahooClient(yahoo_client)
+    try:
+        run_sync(live.pull_live_async(aclient))
+    finally:
+        aclient.close()
+
+    # 2) Build snapshot for requested week using query params
+    snap = build_snapshot_from_files(
+        league_key=inputs.league_key,
+        week=inputs.week,
+        my_team_key=inputs.team_key,
+        roster_json_path=Path("data/roster.json"),
+        scoreboard_json_path=Path(f"data/scoreboard_week_{inputs.week}.json"),
+    )
+    save_snapshot(snap)
+    return snap
+
+
+def live_snapshot(inputs: WaiverInputs, yahoo_client) -> Snapshot:
+    """Snapshot pulled within the last LIVE_TTL seconds, refreshing if older."""
+    key = (inputs.league_key, inputs.team_key, inputs.week)
+    # Held across the pull so concurrent requests wait for one refresh
+    with _live_lock:
+        hit = _live_cache.get(key)
+        if hit is not None and time.monotonic() - hit[0] < LIVE_TTL:
+            return hit[1]
+        snap = refresh_live_snapshot(inputs, yahoo_client)
+        _live_cache[key] = (time.monotonic(), snap)
+        return snap
 
 
 def _load_json_list(path: Optional[str]) -> Optional[List[dict]]:
@@ -58,26 +118,13 @@ def _load_json_list(path: Optional[str]) -> Optional[List[dict]]:
 
 
 def get_waivers(inputs: WaiverInputs, yahoo_client, data_repo) -> Dict[str, Any]:
-    # 1) Pull live Yahoo data -> files
-    _run([sys.executable, "scripts/pull_scoreboard_week.py"])
-    _run([sys.executable, "scripts/pull_roster_snapshot.py"])
+    # 1) Live snapshot (pulled at most once per LIVE_TTL)
+    snapshot = live_snapshot(inputs, yahoo_client)
 
-    # 2) Build snapshot for requested week using query params
-    _run([
-        sys.executable,
-        "scripts/build_snapshot.py",
-        "--week", str(inputs.week),
-        "--league-key", inputs.league_key,
-        "--my-team-key", inputs.team_key,
-        "--roster-json", "data/roster.json",
-        "--scoreboard-json", f"data/scoreboard_week_{inputs.week}.json",
-    ])
-
-    # 3) Load snapshot + pools
-    snapshot = load_snapshot(inputs.week)
+    # 2) Load pools
     pool = _load_json_list(inputs.pool_path)
     sv_pool = _load_json_list(inputs.sv_pool_path)
 
-    # 4) Run engine (expects lists, not paths)
+    # 3) Run engine (expects lists, not paths)
     report = waiver_recommendations(snapshot, pool=pool, sv_pool=sv_pool, ratio_mode=inputs.ratio_mode)
     return report.model_dump() if hasattr(report, "model_dump") else report
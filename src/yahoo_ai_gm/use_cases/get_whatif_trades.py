@@ -0,0 +1,128 @@
+"""
+src/yahoo_ai_gm/use_cases/get_whatif_trades.py
+
+Layer 4 — Orchestration.
+
+Scores a batch of user-proposed trades (What-If simulator). The base state
+(my team, opponent teams, league averages, standings ranks) is built once
+per input version and kept in-process, so a batch of proposals only pays
+for the per-proposal vector arithmetic in analysis/whatif_engine.py.
+"""
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional
+
+from yahoo_ai_gm.use_cases.context import AnalysisContext
+
+
+# Files the base state depends on; their size + mtime key the cache
+BASE_INPUTS = (
+    "fg_proj_bat_2026.json",
+    "fg_proj_pit_2026.json",
+    "league_rosters.json",
+    "league_schedule.json",
+    "league_schedule_index.json",
+    "league_scoreboard.json",
+)
+BASE_CACHE_SIZE = 4
+
+_base_cache: "OrderedDict[tuple, object]" = OrderedDict()
+_base_lock = threading.Lock()
+
+
+@dataclass
+class WhatIfReport:
+    generated_at: datetime
+    week: int
+    base_cached: bool
+    trades: list[dict]
+
+
+def _input_version(data_dir: Path, week: int) -> tuple:
+    parts = []
+    for name in BASE_INPUTS + (f"snapshots/week_{week}.snapshot.json",):
+        try:
+            st = (data_dir / name).stat()
+            parts.append((name, st.st_size, st.st_mtime_ns))
+        except OSError:
+            parts.append((name, None, None))
+    return tuple(parts)
+
+
+def _build_base(ctx: AnalysisContext, week: int, n_teams: int):
+    from yahoo_ai_gm.analysis.whatif_engine import build_whatif_base
+
+    snap = ctx.snapshot(week)
+    my_roster = snap.get("roster", {}).get("players", [])
+    my_team_key = snap.get("roster", {}).get("team_key", "")
+
+    trajectory = ctx.standings(week, n_teams, my_team_key=my_team_key)
+    return build_whatif_base(
+        my_roster=my_roster,
+        league_rosters=ctx.league_rosters().get("teams", []),
+        fg_lookup=ctx.fg_lookup(),
+        league_averages=ctx.league_averages(n_teams),
+        rank_map={s.team_key: s.projected_rank for s in trajectory.all_standings},
+        my_team_key=my_team_key,
+        n_teams=n_teams,
+    )
+
+
+def get_whatif_base(
+    data_dir: Path,
+    week: int,
+    n_teams: int = 10,
+    ctx: Optional[AnalysisContext] = None,
+):
+    """Returns (WhatIfBase, cached). Rebuilt when any input file changes."""
+    key = (str(data_dir), week, n_teams, _input_version(data_dir, week))
+    with _base_lock:
+        base = _base_cache.get(key)
+        if base is not None:
+            _base_cache.move_to_end(key)
+            return base, True
+        # Built under the lock so a burst of requests builds it once
+        base = _build_base(ctx or AnalysisContext(data_dir), week, n_teams)
+        _base_cache[key] = base
+        while len(_base_cache) > BASE_CACHE_SIZE:
+            _base_cache.popitem(last=False)
+        return base, False
+
+
+def get_whatif_report(
+    data_dir: Path,
+    proposals: list[dict],
+    week: Optional[int] = None,
+    n_teams: int = 10,
+    ctx: Optional[AnalysisContext] = None,
+) -> WhatIfReport:
+    """
+    proposals: [{"give": [names], "receive": [names], "team": key or name (optional)}]
+    """
+    from yahoo_ai_gm.analysis.whatif_engine import TradeProposal, evaluate_proposals
+
+    if week is None:
+        ctx = ctx or AnalysisContext(data_dir)
+        week = ctx.latest_week() or 1
+
+    base, cached = get_whatif_base(data_dir, week, n_teams, ctx=ctx)
+    trades = evaluate_proposals(base, [
+        TradeProposal(
+            give=list(p.get("give") or []),
+            receive=list(p.get("receive") or []),
+            team=p.get("team"),
+        )
+        for p in proposals
+    ])
+
+    return WhatIfReport(
+        generated_at=datetime.now(tz=timezone.utc),
+        week=week,
+        base_cached=cached,
+        trades=trades,
+    )
@@ -1,57 +1,155 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import os
+import re
+from dataclasses import dataclass, field
 from typing import Optional
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from yahoo_ai_gm.settings import Settings
-from yahoo_ai_gm.auth import get_valid_access_token
+from yahoo_ai_gm.auth import TokenManager
+from yahoo_ai_gm.http_cache import CACHE_ENABLED, HttpCache, league_of
+from yahoo_ai_gm.recording import FixtureRecorder, recorder_from_env
+from yahoo_ai_gm.rate_limit import TokenBucket
+from yahoo_ai_gm.retry import RetryPolicy, RetryStats, send_with_retry
 
 
 YAHOO_FANTASY_API_BASE = "https://fantasysports.yahooapis.com/fantasy/v2/"
 
+# Overridable for a local stand-in server (e.g. http://127.0.0.1:8765/fantasy/v2/)
+API_BASE_ENV = "YAHOO_API_BASE"
+
+# Connections kept per host; also the default concurrency of AsyncYahooClient
+DEFAULT_POOL_SIZE = int(os.getenv("YAHOO_CONCURRENCY", "8"))
+
+# Shared request budget (requests/second, burst)
+DEFAULT_RATE = float(os.getenv("YAHOO_RATE_LIMIT", "10"))
+DEFAULT_BURST = int(os.getenv("YAHOO_RATE_BURST", "10"))
+
+# POSTs that change rosters (HttpCache roster entries are invalidated)
+_TRANSACTIONS_RE = re.compile(r"^league/\d+\.l\.\d+/transactions")
+
 
 @dataclass
 class YahooClient:
     settings: Settings
     session: requests.Session
+    base_url: str = YAHOO_FANTASY_API_BASE
+    limiter: Optional[TokenBucket] = None
+    # In-memory token shared by every request on this client (see TokenManager)
+    tokens: Optional[TokenManager] = field(default=None, repr=False)
+    # On-disk response cache for slow-changing resources (see http_cache.py)
+    cache: Optional[HttpCache] = None
+    # Writes every response as a replayable fixture (YAHOO_RECORD_DIR, see recording.py)
+    recorder: Optional[FixtureRecorder] = None
+    # Backoff / Retry-After / throttle handling for every request (see retry.py)
+    retry_policy: RetryPolicy = field(default_factory=RetryPolicy)
+    retry_stats: RetryStats = field(default_factory=RetryStats, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.tokens is None:
+            self.tokens = TokenManager(
+                client_id=self.settings.client_id,
+                client_secret=self.settings.client_secret,
+                token_path=self.settings.token_path,
+            )
 
     @classmethod
-    def from_local_config(cls) -> "YahooClient":
+    def from_local_config(cls, pool_size: int = DEFAULT_POOL_SIZE) -> "YahooClient":
         settings = Settings.from_local_config()
         session = requests.Session()
         # Yahoo Fantasy API is XML by default; we’ll parse later.
         session.headers.update({"Accept": "application/xml"})
-        return cls(settings=settings, session=session)
+        # One connection pool shared by every thread / task using this client
+        adapter = HTTPAdapter(pool_connections=2, pool_maxsize=max(1, pool_size))
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        base_url = os.getenv(API_BASE_ENV, "").strip() or YAHOO_FANTASY_API_BASE
+        return cls(
+            settings=settings,
+            session=session,
+            base_url=base_url.rstrip("/") + "/",
+            limiter=TokenBucket(DEFAULT_RATE, DEFAULT_BURST),
+            cache=HttpCache() if CACHE_ENABLED else None,
+            recorder=recorder_from_env(),
+        )
 
     def _auth_headers(self) -> dict:
-        token = get_valid_access_token(
-            client_id=self.settings.client_id,
-            client_secret=self.settings.client_secret,
-            token_path=self.settings.token_path,
-        )
-        return {"Authorization": f"Bearer {token}"}
+        return {"Authorization": f"Bearer {self.tokens.access_token()}"}
 
-    def get(self, path: str, *, params: Optional[dict] = None, timeout: int = 30) -> str:
+    def get(self, path: str, *, params: Optional[dict] = None, timeout: int = 30, use_cache: bool = True) -> str:
         """
         GET wrapper. `path` should be like 'league/mlb.l.40206' or 'users;use_login=1/...'
-        Returns raw XML text.
+        Returns raw XML text. Fresh cached responses skip the network (and the rate limit);
+        use_cache=False always fetches (the response still refreshes the cache).
         """
-        url = YAHOO_FANTASY_API_BASE + path.lstrip("/")
-        resp = self.session.get(url, headers=self._auth_headers(), params=params, timeout=timeout)
-        resp.raise_for_status()
+        cached = self.cached(path, params=params) if use_cache else None
+        if cached is not None:
+            return cached
+        if self.limiter is not None:
+            self.limiter.acquire()
+        return self._get(path, params=params, timeout=timeout)
+
+    def cached(self, path: str, *, params: Optional[dict] = None) -> Optional[str]:
+        """Fresh cached body for this GET, or None."""
+        if self.cache is None:
+            return None
+        body = self.cache.get(self.base_url, path, params)
+        if body is not None and self.recorder is not None:
+            self.recorder.save("GET", path, params, 200, body)
+        return body
+
+    def _get(self, path: str, *, params: Optional[dict] = None, timeout: int = 30) -> str:
+        """
+        GET from the network, retrying per retry_policy. The caller already
+        holds a rate-limit token for the first attempt; retries take their own.
+        """
+        url = self.base_url + path.lstrip("/")
+        resp = send_with_retry(
+            lambda: self.session.get(url, headers=self._auth_headers(), params=params, timeout=timeout),
+            self.retry_policy,
+            limiter=self.limiter,
+            stats=self.retry_stats,
+        )
+        if self.cache is not None:
+            self.cache.put(self.base_url, path, params, resp.text)
+        if self.recorder is not None:
+            self.recorder.save("GET", path, params, resp.status_code, resp.text)
         return resp.text
 
     def post(self, path: str, *, body: str, timeout: int = 30) -> str:
         """
         POST wrapper for write operations (transactions).
         `body` should be XML string.
-        Returns raw XML response text.
+        Returns raw XML response text. Only retried on a throttle response
+        (429/999), which Yahoo rejects without applying the write.
         """
-        url = YAHOO_FANTASY_API_BASE + path.lstrip("/")
+        if self.limiter is not None:
+            self.limiter.acquire()
+        url = self.base_url + path.lstrip("/")
         headers = self._auth_headers()
         headers["Content-Type"] = "application/xml"
-        resp = self.session.post(url, headers=headers, data=body.encode("utf-8"), timeout=timeout)
-        resp.raise_for_status()
+        resp = send_with_retry(
+            lambda: self.session.post(url, headers=headers, data=body.encode("utf-8"), timeout=timeout),
+            self.retry_policy,
+            idempotent=False,
+            limiter=self.limiter,
+            stats=self.retry_stats,
+        )
+        if self.recorder is not None:
+            self.recorder.save("POST", path, None, resp.status_code, resp.text)
+        if self.cache is not None and _TRANSACTIONS_RE.match(path.lstrip("/")):
+            # Adds / drops / trades change rosters that may still be cached as fresh
+            self.cache.invalidate("roster", league_of(path))
         return resp.text
+
+    def stats(self) -> dict:
+        """Request counters: retries / throttling, rate limiter, HTTP cache, token refresh."""
+        out = {"retry": self.retry_stats.stats(), "tokens": self.tokens.stats()}
+        if self.limiter is not None:
+            out["rate_limit"] = self.limiter.stats()
+        if self.cache is not None:
+            out["cache"] = self.cache.stats()
+        return out
@@ -0,0 +1,79 @@
+"""
+src/yahoo_ai_gm/yahoo_xml.py
+
+Streaming parser for Yahoo Fantasy XML responses.
+
+Parsers used to ET.fromstring the whole response. Several then rewrote every
+tag to strip the namespace before pulling a few fields out of each <player>.
+iter_records() instead walks the document with iterparse and yields each
+record element (e.g. <player>) as soon as it closes, then clears it once
+the consumer moves on, so only one record's subtree is alive at a time and
+no pass over the tree is needed for namespaces.
+
+Paths are written without prefixes ("name/full", ".//stats/stat") and
+qualified with the Yahoo namespace for you:
+
+    for player in iter_records(xml_text, "player"):
+        key = text(player, "player_key")
+        stats = stat_values(player)
+"""
+from __future__ import annotations
+
+import io
+import xml.etree.ElementTree as ET
+from functools import lru_cache
+from typing import Iterator, Union
+
+YAHOO_NS = "http://fantasysports.yahooapis.com/fantasy/v2/base.rng"
+
+
+def qname(tag: str) -> str:
+    """'player' -> '{<yahoo ns>}player'"""
+    return f"{{{YAHOO_NS}}}{tag}"
+
+
+@lru_cache(maxsize=256)
+def _qualify(path: str) -> str:
+    """'name/full' -> '{ns}name/{ns}full'; '.', '..' and empty steps (from //) are kept."""
+    return "/".join(
+        p if (not p or p in (".", "..") or p.startswith("{")) else qname(p)
+        for p in path.split("/")
+    )
+
+
+def iter_records(xml: Union[str, bytes], tag: str = "player") -> Iterator[ET.Element]:
+    """
+    Yield every complete <tag> element in document order. The element is
+    only valid until the next one is requested; copy out what you need.
+    """
+    target = qname(tag)
+    data = xml.encode("utf-8") if isinstance(xml, str) else xml
+    for _, el in ET.iterparse(io.BytesIO(data), events=("end",)):
+        if el.tag == target:
+            yield el
+            # Drop the record's subtree; the empty shell left in its
+            # parent is a few bytes per record
+            el.clear()
+
+
+def findall(node: ET.Element, path: str) -> list[ET.Element]:
+    return node.findall(_qualify(path))
+
+
+def text(node: ET.Element, path: str, default: str = "") -> str:
+    """Stripped text at path, or default if missing / empty."""
+    el = node.find(_qualify(path))
+    return el.text.strip() if el is not None and el.text else default
+
+
+_STAT, _STAT_ID, _VALUE = qname("stat"), qname("stat_id"), qname("value")
+
+
+def stat_values(player: ET.Element) -> dict[str, str]:
+    """{stat_id: value} from a player's <player_stats><stats>."""
+    out: dict[str, str] = {}
+    for stat in player.iter(_STAT):
+        stat_id = (stat.findtext(_STAT_ID) or "").strip()
+        if stat_id:
+            out[stat_id] = (stat.findtext(_VALUE) or "").strip()
+    return out